@@ -0,0 +1,231 @@
+"""Benchmark the RO-Crate lifecycle on a synthetic project.
+
+Generates a project with N datasets x M tables x K columns and a long action history
+(see synthetic_project.py), then times the steps every command goes through, with the
+cr8tor services mocked (USE_TEST_DATA=true):
+
+- build (crate render, crate write and bag save) and bag.save on its own
+- ROCrateGraph load and the action gate query
+- resourceops reads (cold and cached), validated model reads (cold and from the model
+  cache of an earlier command) and an action append/delete
+- merge_metadata_into_dataset and verify_tables_metadata
+
+Usage:
+    python benchmarks/lifecycle.py [--datasets N] [--tables M] [--columns K]
+        [--actions A] [--sharded] [--repeat R] [--json results.json]
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from synthetic_project import generate_project
+
+os.environ["USE_TEST_DATA"] = "true"
+
+import bagit  # noqa: E402
+
+import cr8tor.cli.build as ro_crate_builder  # noqa: E402
+import cr8tor.cli.validate as validate_cmd  # noqa: E402
+import cr8tor.core.crate_graph as proj_graph  # noqa: E402
+import cr8tor.core.datasets as datasets  # noqa: E402
+import cr8tor.core.resourceops as project_resources  # noqa: E402
+import cr8tor.core.schema as schemas  # noqa: E402
+
+
+def timed(fn, repeat: int, setup=None) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+@contextlib.contextmanager
+def quiet():
+    # The rich log handler writes to stdout, and build and bag.save log every bag file
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+def run(args) -> dict:
+    results = {}
+
+    def bench(label: str, fn, repeat: int = args.repeat, setup=None):
+        with quiet():
+            timings = timed(fn, repeat, setup)
+        results[label] = {
+            "min_ms": min(timings) * 1000,
+            "median_ms": statistics.median(timings) * 1000,
+            "repeat": repeat,
+        }
+        print(
+            f"{label:<45} min {min(timings) * 1000:10.1f} ms | median {statistics.median(timings) * 1000:10.1f} ms"
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_id = generate_project(
+            Path(tmp),
+            args.datasets,
+            args.tables,
+            args.columns,
+            args.actions,
+            args.sharded,
+        )
+        os.chdir(tmp)
+        # Keep the validated models of the synthetic project out of the user's cache
+        os.environ["CR8TOR_CACHE_DIR"] = str(Path(tmp, "cache"))
+
+        def clear_caches():
+            project_resources.invalidate_resource_cache()
+            shutil.rmtree(Path(tmp, "cache", "models"), ignore_errors=True)
+
+        resources_dir = Path("resources")
+        config_file = Path("config.toml")
+        bagit_dir = Path("bagit")
+        project_resource_path = resources_dir.joinpath("governance", "project.toml")
+        project_datasets = datasets.find_datasets(resources_dir)
+        dataset = project_datasets[0]
+
+        metadata_bytes = sum(
+            f.stat().st_size for f in resources_dir.rglob("*.toml") if f.is_file()
+        )
+        print(
+            f"Project: {args.datasets} datasets x {args.tables} tables x {args.columns} columns, "
+            f"{args.actions + 5} actions, {metadata_bytes / 1024:.0f} KiB of resources"
+            f"{' (sharded)' if args.sharded else ''}"
+        )
+
+        bench(
+            "build (first run, creates bag)",
+            lambda: ro_crate_builder.build(resources_dir, config_file, False),
+            repeat=1,
+        )
+        bench(
+            "build",
+            lambda: ro_crate_builder.build(resources_dir, config_file, False),
+        )
+        bench("bag.save", lambda: bagit.Bag(str(bagit_dir)).save(manifests=True))
+
+        bench("ROCrateGraph load", lambda: proj_graph.ROCrateGraph(bagit_dir))
+        with quiet():
+            graph = proj_graph.ROCrateGraph(bagit_dir)
+        bench(
+            "ROCrateGraph action gate query",
+            lambda: graph.is_project_action_complete(
+                command_type=schemas.Cr8torCommandType.DISCLOSURE_CHECK,
+                action_type=schemas.RoCrateActionType.ASSESS,
+                project_id=project_id,
+            ),
+        )
+
+        bench(
+            "resourceops read project.toml (cold)",
+            lambda: project_resources.read_resource(project_resource_path),
+            setup=project_resources.invalidate_resource_cache,
+        )
+        bench(
+            "resourceops read project.toml (cached)",
+            lambda: project_resources.read_resource(project_resource_path),
+        )
+        bench(
+            "resourceops read dataset (cold)",
+            dataset.read_dataset,
+            setup=project_resources.invalidate_resource_cache,
+        )
+        bench(
+            "resourceops read dataset model (cold)",
+            dataset.read_dataset_model,
+            setup=clear_caches,
+        )
+        bench(
+            "resourceops read dataset model (cached)",
+            dataset.read_dataset_model,
+            setup=project_resources.invalidate_resource_cache,
+        )
+
+        def append_and_delete_action():
+            project_resources.update_resource_entity(
+                project_resource_path,
+                "actions",
+                {"id": "bench-action", "type": "CreateAction", "name": "Bench"},
+            )
+            project_resources.delete_resource_entity(
+                project_resource_path, "actions", "id", "bench-action"
+            )
+
+        bench("resourceops append + delete action", append_and_delete_action)
+
+        metadata = dataset.read_dataset_model()
+        metadata.tables.append(
+            schemas.TableMetadata(
+                name="table_new",
+                columns=[{"name": "id", "description": "", "datatype": "LONG"}],
+            )
+        )
+        snapshot = {path: path.read_bytes() for path in dataset.resource_paths()}
+
+        def restore_dataset():
+            for path in list(dataset.resource_paths()):
+                if path not in snapshot:
+                    path.unlink()
+            for path, content in snapshot.items():
+                path.write_bytes(content)
+            project_resources.invalidate_resource_cache()
+
+        bench(
+            "merge_metadata_into_dataset",
+            lambda: validate_cmd.merge_metadata_into_dataset(dataset.path, metadata),
+            setup=restore_dataset,
+        )
+        restore_dataset()
+
+        local_tables = dataset.read_dataset_model().tables
+        bench(
+            "verify_tables_metadata",
+            lambda: validate_cmd.verify_tables_metadata(metadata.tables, local_tables),
+        )
+
+    return {
+        "parameters": vars(args) | {"json": None},
+        "python": platform.python_version(),
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--datasets", type=int, default=2)
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--actions", type=int, default=50)
+    parser.add_argument("--sharded", action="store_true")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--json", type=Path, help="Write the results to a JSON file for comparison"
+    )
+    args = parser.parse_args()
+
+    logging.getLogger("rich").setLevel(logging.WARNING)
+    cwd = Path.cwd()
+    output = run(args)
+
+    if args.json:
+        json_path = args.json if args.json.is_absolute() else cwd / args.json
+        json_path.write_text(json.dumps(output, indent=2))
+        print(f"Results written to {json_path}")
+
+
+if __name__ == "__main__":
+    main()
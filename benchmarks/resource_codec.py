@@ -0,0 +1,140 @@
+"""Benchmark TOML load/dump of resource files for the resourceops codec.
+
+Compares the previous toml-only implementation with the resourceops codec
+(tomllib reads, tomlkit format-preserving edits, toml dumps) on a synthetic
+dataset TOML with many tables and columns. Loads are reported cold (parsing the
+file) and warm (served by the per-process resource cache) separately.
+
+Usage:
+    python benchmarks/resource_codec.py [n_tables] [n_columns_per_table]
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import toml
+
+import cr8tor.core.resourceops as project_resources
+
+
+def make_dataset(n_tables: int, n_columns: int) -> dict:
+    return {
+        "name": "dataset_bench",
+        "description": "Synthetic dataset for benchmarking",
+        "schema_name": "bench",
+        "tables": [
+            {
+                "name": f"table_{t}",
+                "columns": [
+                    {"name": f"column_{c}", "datatype": "STRING", "description": ""}
+                    for c in range(n_columns)
+                ],
+            }
+            for t in range(n_tables)
+        ],
+    }
+
+
+def timed(fn, repeat: int = 5, setup=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def report(label: str, baseline: float, candidate: float):
+    print(
+        f"{label:<40} toml {baseline * 1000:9.1f} ms | codec {candidate * 1000:9.1f} ms | x{baseline / candidate:5.2f}"
+    )
+
+
+def main(n_tables: int = 50, n_columns: int = 200):
+    logging.getLogger("rich").setLevel(logging.WARNING)
+
+    dataset = make_dataset(n_tables, n_columns)
+    # A project.toml after a long action history
+    project = {
+        "project": {"id": "bench", "name": "Bench", "description": "Bench"},
+        "actions": [
+            {
+                "id": f"action-{i}",
+                "name": "Action",
+                "action_status": "CompletedActionStatus",
+                "result": [{"@id": str(i)}],
+                "phases": [
+                    {"name": phase, "duration_seconds": 0.5, "count": 3}
+                    for phase in ("gate_check", "resource_load", "remote_call")
+                ],
+            }
+            for i in range(55)
+        ],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dataset_path = Path(tmp, "dataset_bench.toml")
+        project_path = Path(tmp, "project.toml")
+        dataset_path.write_text(toml.dumps(dataset))
+        project_path.write_text(toml.dumps(project))
+
+        print(
+            f"Dataset: {n_tables} tables x {n_columns} columns ({dataset_path.stat().st_size / 1024:.0f} KiB)"
+        )
+
+        # read_resource memoizes parsed resources per process: a cold load parses the file,
+        # a warm load (the same resource read again within a command) unpickles a copy
+        toml_load = timed(lambda: toml.load(dataset_path))
+        report(
+            "load dataset (cold)",
+            toml_load,
+            timed(
+                lambda: project_resources.read_resource(dataset_path),
+                setup=project_resources.invalidate_resource_cache,
+            ),
+        )
+        report(
+            "load dataset (warm)",
+            toml_load,
+            timed(lambda: project_resources.read_resource(dataset_path)),
+        )
+        report(
+            "dump dataset",
+            timed(lambda: toml.dumps(dataset)),
+            timed(lambda: project_resources.codec.dumps(dataset)),
+        )
+
+        # Closing a command replaces its action: delete it, then append it again
+        action = project["actions"][10]
+
+        def toml_edit():
+            data = toml.load(project_path)
+            data["actions"] = [a for a in data["actions"] if a["id"] != action["id"]]
+            project_path.write_text(toml.dumps(data))
+            data = toml.load(project_path)
+            data["actions"].append(action)
+            project_path.write_text(toml.dumps(data))
+
+        def codec_edit():
+            project_resources.delete_resource_entity(
+                project_path, "actions", "id", action["id"]
+            )
+            project_resources.update_resource_entity(project_path, "actions", action)
+
+        project_path.write_text(toml.dumps(project))
+        baseline = timed(toml_edit)
+        project_path.write_text(toml.dumps(project))
+        report(
+            f"replace action in project.toml ({project_path.stat().st_size / 1024:.0f} KiB)",
+            baseline,
+            timed(codec_edit),
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
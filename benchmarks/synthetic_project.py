@@ -0,0 +1,225 @@
+"""Generate a synthetic cr8tor project for benchmarking.
+
+The project has N datasets x M tables x K columns, plus a long action history, and its
+project.toml already carries the ids that `cr8tor create` would add. It is ready for
+`build` and the later lifecycle commands with USE_TEST_DATA=true.
+
+Usage:
+    python benchmarks/synthetic_project.py OUT_DIR [--datasets N] [--tables M]
+        [--columns K] [--actions A] [--sharded]
+"""
+
+import argparse
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import toml
+
+LIFECYCLE_ACTIONS = [
+    ("Create", "CreateAction", None),
+    ("Validate", "AssessAction", "Semantic Validation"),
+    ("Sign-Off", "AssessAction", "Sign off"),
+    ("Stage-Transfer", "CreateAction", None),
+    ("Disclosure-Check", "AssessAction", "Disclosure Check"),
+]
+
+CONFIG = {
+    "bagit-info": {
+        "Source-Organization": "LSC SDE",
+        "Organization-Address": "Benchmark",
+        "Contact-Name": "cr8tor benchmarks",
+        "Contact-Email": "bench@example.com",
+    }
+}
+
+ACCESS = {
+    "source": {
+        "name": "Benchmark Connection",
+        "type": "databrickssql",
+        "host_url": "https://example.azuredatabricks.net",
+        "port": 443,
+        "catalog": "bench",
+        "schema_name": "bench",
+        "http_path": "/sql/1.0/warehouses/bench",
+    },
+    "credentials": {
+        "provider": "AzureKeyVault",
+        "spn_clientid": "bench_clientid_key",
+        "spn_secret": "bench_secret_key",
+    },
+}
+
+
+def make_action(
+    command: str,
+    action_type: str,
+    additional_type: str,
+    action_id: str,
+    start: datetime,
+) -> dict:
+    action = {
+        "id": action_id,
+        "type": action_type,
+        "name": f"{command} Data Project Action",
+        "start_time": start,
+        "end_time": start + timedelta(seconds=2),
+        "action_status": "CompletedActionStatus",
+        "agent": "bench@example.com",
+        "instrument": "cr8tor-cli",
+        "result": [{"@id": str(uuid.uuid4())}],
+        "phases": [
+            {
+                "name": phase,
+                "start_time": start,
+                "end_time": start + timedelta(seconds=1),
+                "duration_seconds": 0.5,
+                "count": 3,
+            }
+            for phase in ("gate_check", "resource_load", "remote_call")
+        ],
+    }
+    if additional_type:
+        action["additional_type"] = additional_type
+    return action
+
+
+def make_dataset(index: int, n_tables: int, n_columns: int) -> dict:
+    return {
+        "name": f"dataset_{index}",
+        "description": f"Synthetic dataset {index}",
+        "schema_name": "bench",
+        "tables": [
+            {
+                "name": f"table_{t}",
+                "description": "",
+                "columns": [
+                    {"name": f"column_{c}", "description": "", "datatype": "STRING"}
+                    for c in range(n_columns)
+                ],
+            }
+            for t in range(n_tables)
+        ],
+    }
+
+
+def generate_project(
+    root: Path,
+    n_datasets: int = 2,
+    n_tables: int = 20,
+    n_columns: int = 50,
+    n_actions: int = 50,
+    sharded: bool = False,
+) -> str:
+    """
+    Write a synthetic project under `root`.
+
+    Args:
+        root (Path): Project directory, created if missing.
+        n_datasets (int): Number of dataset resources.
+        n_tables (int): Tables per dataset.
+        n_columns (int): Columns per table.
+        n_actions (int): Additional historical actions in project.toml.
+        sharded (bool): Write datasets in the sharded (manifest + table files) layout.
+    Returns:
+        str: The project id.
+    """
+    root = Path(root)
+    resources_dir = root.joinpath("resources")
+    for sub_dir in ("governance", "access", "metadata"):
+        resources_dir.joinpath(sub_dir).mkdir(parents=True, exist_ok=True)
+
+    project_id = str(uuid.uuid4())
+    start = datetime(2025, 1, 1, 9, 0, 0)
+
+    actions = [
+        make_action(
+            command,
+            action_type,
+            additional_type,
+            f"{command}-{project_id}",
+            start + timedelta(minutes=i),
+        )
+        for i, (command, action_type, additional_type) in enumerate(LIFECYCLE_ACTIONS)
+    ]
+    actions.extend(
+        make_action(
+            "Validate",
+            "AssessAction",
+            "Semantic Validation",
+            f"Validate-{i}-{project_id}",
+            start + timedelta(hours=1, minutes=i),
+        )
+        for i in range(n_actions)
+    )
+
+    project = {
+        "project": {
+            "id": project_id,
+            "name": "Bench",
+            "description": "Synthetic project for benchmarking",
+            "reference": "bench",
+            "project_name": "Bench",
+            "project_start_time": "20250101_090000",
+            "destination": {"name": "LSC", "type": "filestore", "format": "duckdb"},
+        },
+        "repository": {
+            "codeRepository": "https://github.com/lsc-sde-crates/",
+            "description": "Benchmark repository",
+            "name": "Github Repo",
+        },
+        "requesting_agent": {
+            "name": "Bench Agent",
+            "affiliation": {"name": "Bench Uni", "url": "https://example.com"},
+        },
+        "actions": actions,
+    }
+
+    root.joinpath("config.toml").write_text(toml.dumps(CONFIG))
+    resources_dir.joinpath("governance", "project.toml").write_text(toml.dumps(project))
+    resources_dir.joinpath("access", "access.toml").write_text(toml.dumps(ACCESS))
+
+    for d in range(1, n_datasets + 1):
+        dataset = make_dataset(d, n_tables, n_columns)
+        if not sharded:
+            resources_dir.joinpath("metadata", f"dataset_{d}.toml").write_text(
+                toml.dumps(dataset)
+            )
+            continue
+
+        dataset_dir = resources_dir.joinpath("metadata", f"dataset_{d}")
+        dataset_dir.joinpath("tables").mkdir(parents=True, exist_ok=True)
+        table_files = []
+        for table in dataset.pop("tables"):
+            table_file = f"tables/{table['name']}.toml"
+            dataset_dir.joinpath(table_file).write_text(toml.dumps(table))
+            table_files.append(table_file)
+        dataset["table_files"] = table_files
+        dataset_dir.joinpath("manifest.toml").write_text(toml.dumps(dataset))
+
+    return project_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--datasets", type=int, default=2)
+    parser.add_argument("--tables", type=int, default=20)
+    parser.add_argument("--columns", type=int, default=50)
+    parser.add_argument("--actions", type=int, default=50)
+    parser.add_argument("--sharded", action="store_true")
+    args = parser.parse_args()
+
+    project_id = generate_project(
+        args.out_dir,
+        args.datasets,
+        args.tables,
+        args.columns,
+        args.actions,
+        args.sharded,
+    )
+    print(f"Generated project {project_id} at {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
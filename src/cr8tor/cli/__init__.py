@@ -6,6 +6,11 @@ from cr8tor.cli.sign_off import app as sign_off_command
 from cr8tor.cli.disclosure import app as disclosure_command
 from cr8tor.cli.stage_transfer import app as stage_transfer_command
 from cr8tor.cli.publish import app as publish_command
+from cr8tor.cli.profile import app as profile_command
+from cr8tor.cli.bench import app as bench_command
+from cr8tor.cli.diff import app as diff_command
+from cr8tor.cli.export import app as export_command
+from cr8tor.cli.fetch import app as fetch_command
 
 from dotenv import load_dotenv, find_dotenv
 
@@ -19,3 +24,8 @@ app.add_typer(sign_off_command)
 app.add_typer(disclosure_command)
 app.add_typer(stage_transfer_command)
 app.add_typer(publish_command)
+app.add_typer(profile_command)
+app.add_typer(bench_command)
+app.add_typer(diff_command)
+app.add_typer(export_command)
+app.add_typer(fetch_command)
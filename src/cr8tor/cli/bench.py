@@ -0,0 +1,249 @@
+import os
+import time
+import typer
+import rich
+import asyncio
+import functools
+import contextlib
+import statistics
+
+from typing import Annotated, List
+
+import cr8tor.core.api_client as api
+import cr8tor.core.schema as schemas
+import cr8tor.core.mock_services as mock_services
+
+from cr8tor.utils import console
+
+app = typer.Typer()
+
+BENCH_ENDPOINTS = {
+    # Every call must reach the mock service, and not the user's response cache
+    "validate": functools.partial(api.validate_access, use_cache=False),
+    "package": api.stage_transfer,
+    "publish": api.publish,
+}
+
+
+def make_bench_request(
+    endpoint: str, tables: int, columns: int
+) -> schemas.DataContractTransferRequest:
+    """Request for `endpoint`: a validate request for validate, a transfer request otherwise"""
+    request_model = (
+        schemas.DataContractValidateRequest
+        if endpoint == "validate"
+        else schemas.DataContractTransferRequest
+    )
+    return request_model(
+        project_name="Bench",
+        project_start_time="20250101_090000",
+        destination={"name": "LSC", "type": "filestore", "format": "duckdb"},
+        source={
+            "type": "databrickssql",
+            "host_url": "https://mock.azuredatabricks.net",
+            "http_path": "/sql/1.0/warehouses/mock",
+            "catalog": "mock",
+            "credentials": {
+                "provider": "AzureKeyVault",
+                "spn_clientid": "mock_clientid_key",
+                "spn_secret": "mock_secret_key",
+            },
+        },
+        dataset={
+            "name": "bench",
+            "schema_name": "bench",
+            "tables": [
+                {
+                    "name": f"table_{t}",
+                    "columns": [{"name": f"column_{c}"} for c in range(columns)],
+                }
+                for t in range(tables)
+            ],
+        },
+    )
+
+
+async def run_requests(
+    endpoint: str,
+    request: schemas.DataContractTransferRequest,
+    n_requests: int,
+    concurrency: int,
+) -> tuple[List[float], List[str]]:
+    """
+    Send `n_requests` service calls with at most `concurrency` in flight.
+
+    Returns:
+        tuple[List[float], List[str]]: Latency in seconds of each successful call, and the errors.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    service_call = BENCH_ENDPOINTS[endpoint]
+    latencies, errors = [], []
+
+    async def send():
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await service_call(request)
+                latencies.append(time.perf_counter() - start)
+            except Exception as e:
+                errors.append(str(e))
+
+    await asyncio.gather(*(send() for _ in range(n_requests)))
+    return latencies, errors
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@app.command(name="bench")
+def bench(
+    n_requests: Annotated[
+        int, typer.Option(default="-n", help="Number of service calls to send.")
+    ] = 200,
+    concurrency: Annotated[
+        int, typer.Option(default="-c", help="Maximum number of calls in flight.")
+    ] = 10,
+    endpoint: Annotated[
+        str,
+        typer.Option(
+            default="-e",
+            help="Service call to benchmark: validate, package or publish.",
+        ),
+    ] = "validate",
+    latency_ms: Annotated[
+        float, typer.Option(default="--latency-ms", help="Mean mock service latency.")
+    ] = 50,
+    jitter_ms: Annotated[
+        float,
+        typer.Option(
+            default="--jitter-ms",
+            help="Standard deviation of the mock service latency.",
+        ),
+    ] = 10,
+    failure_rate: Annotated[
+        float,
+        typer.Option(
+            default="--failure-rate",
+            help="Share of calls the mock services fail with a 500 (0-1).",
+        ),
+    ] = 0.0,
+    tables: Annotated[
+        int, typer.Option(default="--tables", help="Tables per request and response.")
+    ] = 1,
+    columns: Annotated[
+        int, typer.Option(default="--columns", help="Columns per table.")
+    ] = 20,
+    port: Annotated[
+        int,
+        typer.Option(default="--port", help="Mock services port. 0 picks a free port."),
+    ] = 0,
+    serve: Annotated[
+        bool,
+        typer.Option(
+            default="--serve",
+            help="Only run the mock services, for use by other cr8tor commands.",
+        ),
+    ] = False,
+):
+    """
+    Measures the throughput and tail latency of the cr8tor service client against local mock services.
+
+    Starts a local stand-in for the Approval, Metadata and Publish services with configurable
+    latency, failure rate and payload size, then sends service calls through the same API
+    client the commands use. No network access is needed. Validate calls bypass the response
+    cache, so every call reaches the mock services and the user's cache is left untouched.
+
+    Args:
+        n_requests (int): Number of service calls to send. Defaults to 200.
+        concurrency (int): Maximum number of calls in flight. Defaults to 10.
+        endpoint (str): Service call to benchmark: validate, package or publish. Defaults to "validate".
+        latency_ms (float): Mean mock service latency in milliseconds. Defaults to 50.
+        jitter_ms (float): Standard deviation of the mock service latency. Defaults to 10.
+        failure_rate (float): Share of calls failed with a 500. Defaults to 0.
+        tables (int): Tables per request and response. Defaults to 1.
+        columns (int): Columns per table. Defaults to 20.
+        port (int): Mock services port; 0 picks a free port. Defaults to 0.
+        serve (bool): Only run the mock services until interrupted. Defaults to False.
+
+    With --serve, point the other commands at the mock services with the printed
+    APPROVALS_HOST, APPROVALS_PORT and APPROVALS_API_TOKEN environment variables.
+
+    Example usage:
+        cr8tor bench -n 500 -c 20 -e validate --latency-ms 100 --failure-rate 0.01 --columns 500
+        cr8tor bench --serve --port 8765
+    """
+    if endpoint not in BENCH_ENDPOINTS:
+        raise typer.BadParameter(
+            f"Unknown endpoint '{endpoint}'. Choose one of: {', '.join(BENCH_ENDPOINTS)}"
+        )
+
+    config = mock_services.MockServiceConfig(
+        latency_ms=latency_ms,
+        latency_jitter_ms=jitter_ms,
+        failure_rate=failure_rate,
+        tables=tables,
+        columns=columns,
+    )
+    server = mock_services.start_mock_services(config, port=port)
+    host, bound_port = server.server_address[:2]
+
+    if serve:
+        typer.echo(f"Mock services listening on {server.url}")
+        typer.echo(
+            f"export APPROVALS_HOST=http://{host} APPROVALS_PORT={bound_port} "
+            "APPROVALS_API_TOKEN=mock USE_TEST_DATA=false"
+        )
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+        return
+
+    os.environ.update(
+        {
+            "APPROVALS_HOST": f"http://{host}",
+            "APPROVALS_PORT": str(bound_port),
+            "APPROVALS_API_TOKEN": "mock",
+            "USE_TEST_DATA": "false",
+        }
+    )
+    request = make_bench_request(endpoint, tables, columns)
+
+    start = time.perf_counter()
+    # The API client prints every request and response
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        latencies, errors = asyncio.run(
+            run_requests(endpoint, request, n_requests, concurrency)
+        )
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    table = rich.table.Table()
+    table.add_column("Metric", justify="right", style="cyan", no_wrap=True)
+    table.add_column("Value", style="magenta")
+    table.add_row("Endpoint", endpoint)
+    table.add_row("Requests", f"{n_requests} ({concurrency} concurrent)")
+    table.add_row("Mock latency", f"{latency_ms:.0f} ± {jitter_ms:.0f} ms")
+    table.add_row("Payload", f"{tables} tables x {columns} columns")
+    table.add_row("Succeeded", str(len(latencies)))
+    table.add_row("Failed", str(len(errors)))
+    table.add_row("Wall time", f"{elapsed:.2f} s")
+    table.add_row("Throughput", f"{n_requests / elapsed:.1f} req/s")
+    if latencies:
+        table.add_section()
+        table.add_row("Latency p50", f"{percentile(latencies, 50) * 1000:.1f} ms")
+        table.add_row("Latency p90", f"{percentile(latencies, 90) * 1000:.1f} ms")
+        table.add_row("Latency p99", f"{percentile(latencies, 99) * 1000:.1f} ms")
+        table.add_row("Latency max", f"{max(latencies) * 1000:.1f} ms")
+        table.add_row("Latency mean", f"{statistics.mean(latencies) * 1000:.1f} ms")
+    if errors:
+        table.add_section()
+        table.add_row("First error", errors[0][:200])
+
+    console.print(rich.panel.Panel(table, title="cr8tor service client benchmark"))
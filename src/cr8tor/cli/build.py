@@ -3,6 +3,10 @@ import typer
 import rocrate.model as m
 import cr8tor.core.schema as s
 import cr8tor.core.resourceops as project_resources
+import cr8tor.core.datasets as datasets
+import cr8tor.core.profiling as profiling
+import cr8tor.core.crate_writer as crate_writer
+import cr8tor.core.bag_fetch as bag_fetch
 from pathlib import Path
 from typing import Annotated
 from rocrate.rocrate import ROCrate
@@ -66,6 +70,14 @@ def build(
     - Includes resources from the specified directory into the RO-Crate.
     - If the `dryrun` option is provided, prints the crate details without writing to the "crate/" directory.
 
+    If a fetch base URL is configured (`base_url` in the `[fetch]` table of the configuration,
+    or CR8TOR_FETCH_BASE_URL), the staged and published artifacts of each dataset are listed
+    with their size and SHA-512 in the bag `fetch.txt` instead of being copied into the bag.
+    Use `cr8tor fetch` to download them.
+
+    The crate metadata is written in a stable entity order, and the root dataset is dated by
+    the latest project action, so rebuilding an unchanged project leaves the bag unchanged.
+
     Args:
         resources_dir (Path): Directory containing resources to include in the RO-Crate. Defaults to "./resources".
         config_file (Path): Location of the configuration TOML file. Defaults to "./config.toml".
@@ -119,7 +131,9 @@ def build(
     # Load project info and init RC 'Project' entity
     #
 
-    project_props = s.ProjectProps(**governance["project"])
+    project_props = project_resources.read_resource_model(
+        project_resource_path, s.ProjectProps, "project"
+    )
     log.info(
         f"[cyan]Creating RO-Crate for[/cyan] - [bold magenta]{project_props.name}[/bold magenta]",
     )
@@ -138,7 +152,9 @@ def build(
     #
     # Load requesting agent info and init RC 'Person' entity
     #
-    requesting_agent_props = s.AgentProps(**governance["requesting_agent"])
+    requesting_agent_props = project_resources.read_resource_model(
+        project_resource_path, s.AgentProps, "requesting_agent"
+    )
     person_entity = m.Person(
         crate,
         identifier=f"requesting-agent-{project_props.id}",
@@ -167,7 +183,9 @@ def build(
     #
     # Load project repository info and init RC 'SoftwareSourceCode' entity
     #
-    repo_props = s.SoftwareSourceCodeProps(**governance["repository"])
+    repo_props = project_resources.read_resource_model(
+        project_resource_path, s.SoftwareSourceCodeProps, "repository"
+    )
 
     repo_entity = m.ContextEntity(
         crate=crate,
@@ -224,19 +242,38 @@ def build(
     # Metadata resources
     #
 
-    for f in resources_dir.joinpath("metadata").glob("dataset*.toml"):
-        dataset_dict = project_resources.read_resource(f)
-        dataset_props = s.DatasetMetadata(**dataset_dict)
+    fetch_base_url = bag_fetch.fetch_base_url(config)
+    fetch_entries = []
+
+    for dataset in datasets.find_datasets(resources_dir):
+        # Sharded datasets are described from their manifest; table files are packaged unparsed
+        if dataset.is_sharded:
+            dataset_props = dataset.read_manifest_model()
+        else:
+            dataset_props = dataset.read_dataset_model()
 
         crate.add_file(
-            source=f,
-            dest_path=f"metadata/{f.name}",
+            source=dataset.manifest_path,
+            dest_path=dataset.manifest_path.relative_to(resources_dir).as_posix(),
             properties={
                 "name": dataset_props.name,
                 "description": dataset_props.description,
             },
         )
 
+        for table_path in dataset.table_paths():
+            crate.add_file(
+                source=table_path,
+                dest_path=table_path.relative_to(resources_dir).as_posix(),
+                properties={"name": f"{dataset_props.name} - {table_path.stem}"},
+            )
+
+        fetch_entries.extend(
+            bag_fetch.artifact_entries(
+                dataset_props.name, dataset_props, fetch_base_url
+            )
+        )
+
         hasparts = []
 
         if dataset_props.staging_path is not None:
@@ -327,12 +364,30 @@ def build(
     # Check for actions
     #
 
+    action_end_times = []
     for action in governance["actions"]:
         if action["type"] == "CreateAction":
             action_props = s.CreateActionProps(**action)
         elif action["type"] == "AssessAction":
             action_props = s.AssessActionProps(**action)
 
+        phase_refs = []
+        for phase in action_props.phases:
+            phase_entity = m.ContextEntity(
+                crate=crate,
+                identifier=f"{action_props.id}-{phase.name}",
+                properties={
+                    "@type": "Action",
+                    "name": phase.name,
+                    "startTime": phase.start_time.isoformat(),
+                    "endTime": phase.end_time.isoformat(),
+                    "durationSeconds": phase.duration_seconds,
+                    "count": phase.count,
+                },
+            )
+            crate.add(phase_entity)
+            phase_refs.append({"@id": phase_entity.id})
+
         crate.add_action(
             instrument=action_props.instrument,
             identifier=action_props.id,
@@ -344,8 +399,15 @@ def build(
                 "endTime": action_props.end_time.isoformat(),
                 "actionStatus": action_props.action_status,
                 "agent": action_props.agent,
+                **({"phases": phase_refs} if phase_refs else {}),
             },
         )
+        action_end_times.append(action_props.end_time)
+
+    # rocrate stamps the root dataset with the build time; use the latest action instead
+    # so that rebuilding an unchanged project rewrites identical crate metadata
+    if action_end_times:
+        crate.root_dataset["datePublished"] = max(action_end_times).isoformat()
 
     ###############################################################################
     # 7 Add Ro-crate meta to bagit directory structure
@@ -365,8 +427,10 @@ def build(
                 project_id=project_props.id, bagit_dir=bagit_dir, config=config
             )
 
-        crate.write(bagit_dir / "data")
-        bag.save(manifests=True)
+        with profiling.phase("bag_save"):
+            crate_writer.write_crate(crate, bagit_dir / "data")
+            bag.save(manifests=True)
+            bag_fetch.write_fetch_file(bag, fetch_entries)
 
         n_payload_files = len(list(bag.payload_files()))
         log.info(
@@ -0,0 +1,115 @@
+import json
+import typer
+import rich
+
+from pathlib import Path
+from typing import Annotated, Any
+
+import cr8tor.core.crate_diff as crate_diff
+
+from cr8tor.utils import console
+
+app = typer.Typer()
+
+MAX_VALUE_WIDTH = 80
+
+
+def format_value(value: Any) -> str:
+    if value is None:
+        return ""
+    text = value if isinstance(value, str) else json.dumps(value, sort_keys=True)
+    if len(text) > MAX_VALUE_WIDTH:
+        text = text[: MAX_VALUE_WIDTH - 1] + "…"
+    return rich.markup.escape(text)
+
+
+def format_type(entity_type: Any) -> str:
+    if isinstance(entity_type, list):
+        return ", ".join(str(t) for t in entity_type)
+    return str(entity_type or "")
+
+
+@app.command(name="diff")
+def diff(
+    old: Annotated[
+        Path,
+        typer.Argument(
+            help="Old ro-crate-metadata.json, or the crate or BagIt directory holding it."
+        ),
+    ],
+    new: Annotated[
+        Path,
+        typer.Argument(
+            help="New ro-crate-metadata.json, or the crate or BagIt directory holding it."
+        ),
+    ],
+    as_json: Annotated[
+        bool,
+        typer.Option("--json", help="Print the differences as JSON instead of tables."),
+    ] = False,
+    exit_code: Annotated[
+        bool,
+        typer.Option(
+            "--exit-code",
+            help="Exit with status 1 if the crates differ, like git diff --exit-code.",
+        ),
+    ] = False,
+):
+    """
+    Compares two revisions of an RO-Crate entity by entity.
+
+    Entities are matched on their `@id` and reported as added, removed or changed, with the
+    old and new value of every changed property. Use it to review sign-off and disclosure
+    pull requests without reading the raw JSON diff.
+
+    Args:
+        old (Path): Old ro-crate-metadata.json, or the crate or BagIt directory holding it.
+        new (Path): New ro-crate-metadata.json, or the crate or BagIt directory holding it.
+        as_json (bool): Print the differences as JSON instead of tables. Defaults to False.
+        exit_code (bool): Exit with status 1 if the crates differ. Defaults to False.
+
+    Example usage:
+        cr8tor diff old-bagit ./bagit
+
+        cr8tor diff <(git show main:bagit/data/ro-crate-metadata.json) ./bagit --json
+    """
+    result = crate_diff.diff_crates(old, new)
+
+    if as_json:
+        typer.echo(result.model_dump_json(indent=2))
+    else:
+        summary = rich.table.Table()
+        summary.add_column("Entities", justify="right", style="cyan", no_wrap=True)
+        summary.add_column("Count", style="magenta")
+        summary.add_row("Added", str(len(result.added)))
+        summary.add_row("Removed", str(len(result.removed)))
+        summary.add_row("Changed", str(len(result.changed)))
+        summary.add_row("Unchanged", str(result.unchanged))
+        console.print(rich.panel.Panel(summary, title="RO-Crate Diff"))
+
+        if not result.is_empty():
+            table = rich.table.Table()
+            table.add_column("Entity", style="cyan", overflow="fold")
+            table.add_column("Type")
+            table.add_column("Property", style="magenta")
+            table.add_column("Old", style="red", overflow="fold")
+            table.add_column("New", style="green", overflow="fold")
+
+            for ref in result.added:
+                table.add_row(ref.id, format_type(ref.type), "", "", "added")
+            for ref in result.removed:
+                table.add_row(ref.id, format_type(ref.type), "", "removed", "")
+            for change in result.changed:
+                for i, prop in enumerate(change.properties):
+                    table.add_row(
+                        change.id if i == 0 else "",
+                        format_type(change.type) if i == 0 else "",
+                        prop.name,
+                        format_value(prop.old),
+                        format_value(prop.new),
+                    )
+                table.add_section()
+            console.print(table)
+
+    if exit_code and not result.is_empty():
+        raise typer.Exit(code=1)
@@ -1,22 +1,285 @@
 """Command to initialize a new CR8 project using a specified cookiecutter template."""
 
+import contextvars
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional
 from pathlib import Path
 
+import csv
+import os
+import tempfile
 import typer
+import rich
 import sys
 import re
 
+from cookiecutter.config import get_user_config
 from cookiecutter.main import cookiecutter
+from cookiecutter.repository import determine_repo_dir
 from cookiecutter.exceptions import OutputDirExistsException, FailedHookException
-from cr8tor.utils import log
+from cr8tor.utils import console, log
 import cr8tor.core.resourceops as project_resources
 import cr8tor.core.schema as schemas
 import cr8tor.core.gh_rest_api_client as gh_rest_api_client
+import cr8tor.core.template_cache as template_cache
 
 app = typer.Typer()
 
+VALID_ENVIRONMENTS = ["DEV", "TEST", "PROD"]
+VALID_RUNNER_OS = ["Windows", "Linux"]
+MANIFEST_FIELDS = (
+    "project_name",
+    "environment",
+    "runner_os",
+    "git_org",
+    "cr8tor_branch",
+)
+
+
+def validate_target(environment: str, runner_os: str) -> None:
+    if environment.upper() not in VALID_ENVIRONMENTS:
+        raise typer.BadParameter(
+            f"Invalid environment. Choose from {VALID_ENVIRONMENTS}."
+        )
+    if runner_os not in VALID_RUNNER_OS:
+        raise typer.BadParameter(f"Invalid runner OS. Choose from {VALID_RUNNER_OS}.")
+
+
+def make_extra_context(
+    template_path: str, environment: str, cr8tor_branch: str, runner_os: str
+) -> dict:
+    return {
+        "__timestamp": datetime.now().isoformat(timespec="seconds"),
+        "__cr8_cc_template": template_path,
+        "environment": environment.upper(),
+        "__github_cr8tor_branch": cr8tor_branch,
+        "runner_os": runner_os,
+    }
+
+
+def read_project_manifest(manifest_path: Path) -> List[dict]:
+    """
+    Read the projects of a bulk initiation manifest.
+
+    A CSV manifest has a header row with the MANIFEST_FIELDS columns; a TOML manifest has a
+    `[[projects]]` table per project. Only `project_name` is required, the other fields
+    default to the command options. Empty values are ignored.
+    """
+    if not manifest_path.exists():
+        raise typer.BadParameter(f"Manifest {manifest_path} does not exist.")
+
+    if manifest_path.suffix.lower() == ".csv":
+        with manifest_path.open("r", newline="", encoding="utf-8") as f:
+            projects = list(csv.DictReader(f))
+    elif manifest_path.suffix.lower() == ".toml":
+        projects = project_resources.read_resource(manifest_path).get("projects", [])
+    else:
+        raise typer.BadParameter("The manifest must be a .csv or .toml file.")
+
+    rows = []
+    for index, project in enumerate(projects, start=1):
+        row = {
+            key.strip(): value.strip() if isinstance(value, str) else value
+            for key, value in project.items()
+            if key and value not in (None, "")
+        }
+        unknown = set(row) - set(MANIFEST_FIELDS)
+        if unknown:
+            raise typer.BadParameter(
+                f"Unknown manifest fields {sorted(unknown)} for project {index}. Expected {list(MANIFEST_FIELDS)}."
+            )
+        if "project_name" not in row:
+            raise typer.BadParameter(f"Project {index} has no project_name.")
+        rows.append(row)
+
+    names = [row["project_name"] for row in rows]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise typer.BadParameter(f"Duplicate projects in manifest: {duplicates}")
+    return rows
+
+
+def render_manifest_project(template_dir: str, extra_context: dict) -> str:
+    """
+    Render one manifest project from a local template directory, without prompts.
+    Runs in a worker process: cookiecutter changes the working directory to run hooks.
+    """
+    try:
+        return cookiecutter(template_dir, extra_context=extra_context, no_input=True)
+    except OutputDirExistsException as e:
+        log.info("Project directory already exists. Skipping creation...")
+        folder_name = re.search(r'"(.*?)"', str(e)).group(1)
+        return str(Path.cwd() / folder_name)
+    except FailedHookException as e:
+        error_msg = str(e)
+        if "VALIDATION_ERROR:" in error_msg:
+            error_msg = (
+                f"Validation failed: {error_msg.split('VALIDATION_ERROR:')[1].strip()}"
+            )
+        raise RuntimeError(error_msg) from None
+
+
+def provision_github(
+    gh_client: gh_rest_api_client.GHApiClient, project_dir
+) -> tuple[str, Optional[Dict[str, float]]]:
+    """
+    Create, push and configure the GitHub repository of a rendered project.
+
+    Returns:
+        tuple[str, Optional[Dict[str, float]]]: The repository name (the project reference),
+        and the git timings if the repository was created and pushed.
+    """
+    project_resource_path = Path(project_dir).joinpath(
+        "resources", "governance", "project.toml"
+    )
+    project_dict = project_resources.read_resource_entity(
+        project_resource_path, "project"
+    )
+    repo_name = schemas.ProjectProps(**project_dict).reference
+
+    # Create the repository and push the project to GitHub, then apply the rule set,
+    # contributor teams and Signing Off environments concurrently
+    git_timings = gh_rest_api_client.provision_project_repository(
+        gh_client, project_dir, repo_name
+    )
+    return repo_name, git_timings
+
+
+def initiate_from_manifest(
+    manifest_path: Path,
+    template_path: str,
+    checkout: str,
+    push_to_github: bool,
+    defaults: dict,
+    workers: int,
+    github_concurrency: int,
+    refresh_template: bool = False,
+) -> Dict[str, dict]:
+    """
+    Render every manifest project from one template checkout on a process pool, and
+    provision the GitHub repository of each project as soon as it is rendered, with at
+    most `github_concurrency` projects provisioned at once.
+
+    Returns:
+        Dict[str, dict]: Outcome per project name: directory, render and github status, error.
+    """
+    contexts = {}
+    for row in read_project_manifest(manifest_path):
+        settings = {**defaults, **row}
+        validate_target(settings["environment"], settings["runner_os"])
+        extra_context = make_extra_context(
+            template_path,
+            settings["environment"],
+            settings["cr8tor_branch"],
+            settings["runner_os"],
+        )
+        extra_context.update(
+            {
+                "project_name": settings["project_name"],
+                "github_organization": settings["git_org"],
+            }
+        )
+        contexts[settings["project_name"]] = (extra_context, settings["git_org"])
+
+    outcomes = {
+        name: {
+            "directory": None,
+            "render": "pending",
+            "github": "skipped",
+            "git": "",
+            "error": "",
+        }
+        for name in contexts
+    }
+    gh_clients: Dict[str, gh_rest_api_client.GHApiClient] = {}
+    template_dir, template_checkout = template_cache.resolve_template(
+        template_path, checkout, refresh=refresh_template
+    )
+
+    with tempfile.TemporaryDirectory(prefix="cr8tor-template-") as clone_dir:
+        # Clone or unpack the template once for every project when it is not cached
+        template_dir, _ = determine_repo_dir(
+            template=template_dir,
+            abbreviations=get_user_config()["abbreviations"],
+            clone_to_dir=clone_dir,
+            checkout=template_checkout,
+            no_input=True,
+        )
+
+        with (
+            ProcessPoolExecutor(max_workers=workers) as render_pool,
+            ThreadPoolExecutor(max_workers=github_concurrency) as github_pool,
+        ):
+            renders = {
+                render_pool.submit(
+                    render_manifest_project, template_dir, extra_context
+                ): name
+                for name, (extra_context, _) in contexts.items()
+            }
+            provisions = {}
+            for future in as_completed(renders):
+                name = renders[future]
+                try:
+                    outcomes[name]["directory"] = future.result()
+                    outcomes[name]["render"] = "rendered"
+                except Exception as e:
+                    outcomes[name]["render"] = "failed"
+                    outcomes[name]["error"] = str(e)
+                    continue
+
+                git_org = contexts[name][1]
+                if push_to_github and git_org:
+                    if git_org not in gh_clients:
+                        gh_clients[git_org] = gh_rest_api_client.GHApiClient(git_org)
+                    outcomes[name]["github"] = "pending"
+                    # Copy the context so provisioning spans keep the command span as parent
+                    provisions[
+                        github_pool.submit(
+                            contextvars.copy_context().run,
+                            provision_github,
+                            gh_clients[git_org],
+                            outcomes[name]["directory"],
+                        )
+                    ] = name
+
+            for future in as_completed(provisions):
+                name = provisions[future]
+                try:
+                    repo_name, git_timings = future.result()
+                    if git_timings:
+                        outcomes[name]["git"] = gh_rest_api_client.format_git_timings(
+                            git_timings
+                        )
+                    outcomes[name]["github"] = f"{contexts[name][1]}/{repo_name}"
+                except Exception as e:
+                    outcomes[name]["github"] = "failed"
+                    outcomes[name]["error"] = str(e)
+
+    for gh_client in gh_clients.values():
+        gh_client.close()
+    return outcomes
+
+
+def print_manifest_report(outcomes: Dict[str, dict]) -> None:
+    table = rich.table.Table(title="cr8tor initiate")
+    table.add_column("Project", style="cyan", no_wrap=True)
+    table.add_column("Directory")
+    table.add_column("Render")
+    table.add_column("GitHub")
+    table.add_column("Git push")
+    table.add_column("Error", style="red")
+    for name, outcome in outcomes.items():
+        table.add_row(
+            name,
+            str(outcome["directory"] or ""),
+            outcome["render"],
+            outcome["github"],
+            outcome["git"],
+            outcome["error"],
+        )
+    console.print(table)
+
 
 @app.command(name="initiate")
 def initiate(
@@ -82,6 +345,34 @@ def initiate(
             show_choices=True,
         ),
     ] = "Windows",
+    from_manifest: Annotated[
+        Path,
+        typer.Option(
+            "--from-manifest",
+            help="CSV or TOML manifest of projects to initiate in bulk. Manifest fields override -n, -org, -e, -cb and -ros.",
+        ),
+    ] = None,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            help="Number of projects rendered in parallel with --from-manifest.",
+        ),
+    ] = os.cpu_count() or 1,
+    github_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--github-concurrency",
+            help="Number of projects provisioned on GitHub at once with --from-manifest.",
+        ),
+    ] = 4,
+    refresh_template: Annotated[
+        bool,
+        typer.Option(
+            "--refresh-template",
+            help="Fetch the template again instead of using the cached checkout.",
+        ),
+    ] = False,
 ):
     """
     Initializes a new CR8 project using a specified cookiecutter template.
@@ -96,12 +387,25 @@ def initiate(
         environment (str): The target environment (DEV, TEST, PROD). Defaults to "PROD".
         cr8tor_branch (str, optional): For development and debugging. Specifies the GitHub cr8tor branch to be used in the orchestration layer.
         runner_os (str): The target runner OS for GitHub Actions workflows (Windows, Linux). Defaults to "Windows".
+        from_manifest (Path, optional): A CSV or TOML manifest of projects to initiate in bulk (see below).
+        workers (int): Number of projects rendered in parallel with `from_manifest`. Defaults to the CPU count.
+        github_concurrency (int): Number of projects provisioned on GitHub at once with `from_manifest`. Defaults to 4.
+        refresh_template (bool): Fetch a remote template again instead of using the cached checkout. Defaults to False.
 
     This command performs the following actions:
     - Generates a new project by applying the specified cookiecutter template.
     - Adds a timestamp to the context used by the template.
+    - Remote templates are cached per URL and checkout revision (see `cr8tor prewarm-template`), so
+      later initiations reuse the checkout without network access until `--refresh-template` is given.
     - If `push_to_github` is True, creates a GitHub repository under the specified organization and pushes the generated project to GitHub using the personal access token (retrieved from `os.getenv("GH_TOKEN")`).
 
+    With `from_manifest`, the template is cloned once and every project of the manifest is
+    rendered without prompts. A CSV manifest has a header row, a TOML manifest a `[[projects]]`
+    table per project. The fields are `project_name` (required), `environment`, `runner_os`,
+    `git_org` and `cr8tor_branch`; missing fields default to the command options. Each
+    project is pushed to GitHub as soon as it is rendered. The command prints the outcome
+    of every project and exits with code 1 if any project failed.
+
     Example usage:
         cr8tor initiate -t https://github.com/lsc-sde-crates/cr8-cookiecutter
 
@@ -110,24 +414,37 @@ def initiate(
         cr8tor initiate -t path-to-local-cr8-cookiecutter-dir -n "my-project" -org "lsc-sde-crates" --push
 
         cr8tor initiate -t path-to-local-cr8-cookiecutter-dir -n "my-project" -org "lsc-sde-crates" -ros "Linux" --push
+
+        cr8tor initiate -t https://github.com/lsc-sde-crates/cr8-cookiecutter --from-manifest projects.csv -org "lsc-sde-crates" --push
     """
-    valid_environments = ["DEV", "TEST", "PROD"]
-    if environment.upper() not in valid_environments:
-        raise typer.BadParameter(
-            f"Invalid environment. Choose from {valid_environments}."
+    if from_manifest is not None:
+        outcomes = initiate_from_manifest(
+            manifest_path=from_manifest,
+            template_path=template_path,
+            checkout=checkout,
+            push_to_github=push_to_github,
+            defaults={
+                "environment": environment,
+                "runner_os": runner_os,
+                "git_org": git_org,
+                "cr8tor_branch": cr8tor_branch,
+            },
+            workers=max(1, workers),
+            github_concurrency=max(1, github_concurrency),
+            refresh_template=refresh_template,
         )
+        print_manifest_report(outcomes)
+        if any(outcome["error"] for outcome in outcomes.values()):
+            raise typer.Exit(code=1)
+        return
 
-    valid_runner_os = ["Windows", "Linux"]
-    if runner_os not in valid_runner_os:
-        raise typer.BadParameter(f"Invalid runner OS. Choose from {valid_runner_os}.")
-
-    extra_context = {
-        "__timestamp": datetime.now().isoformat(timespec="seconds"),
-        "__cr8_cc_template": template_path,
-        "environment": environment.upper(),
-        "__github_cr8tor_branch": cr8tor_branch,
-        "runner_os": runner_os,
-    }
+    validate_target(environment, runner_os)
+    extra_context = make_extra_context(
+        template_path, environment, cr8tor_branch, runner_os
+    )
+    template_dir, template_checkout = template_cache.resolve_template(
+        template_path, checkout, refresh=refresh_template
+    )
 
     # Generate the project with cookiecutter
     if project_name is not None:
@@ -135,8 +452,8 @@ def initiate(
         extra_context.update({"github_organization": git_org})
         try:
             project_dir = cookiecutter(
-                template_path,
-                checkout=checkout,
+                template_dir,
+                checkout=template_checkout,
                 extra_context=extra_context,
                 no_input=True,
             )
@@ -148,7 +465,7 @@ def initiate(
     else:
         try:
             project_dir = cookiecutter(
-                template_path, checkout=checkout, extra_context=extra_context
+                template_dir, checkout=template_checkout, extra_context=extra_context
             )
         except FailedHookException as e:
             # Extract error message from the exception
@@ -165,23 +482,6 @@ def initiate(
             folder_name = re.search(r'"(.*?)"', str(e)).group(1)
             project_dir = Path.cwd() / folder_name
 
-    resources_dir = Path(project_dir).joinpath("resources")
-    project_resource_path = resources_dir.joinpath("governance", "project.toml")
-    project_dict = project_resources.read_resource_entity(
-        project_resource_path, "project"
-    )
-    project_info = schemas.ProjectProps(**project_dict)
-
     if push_to_github and git_org:
-        repo_name = project_info.reference
-
-        gh_client = gh_rest_api_client.GHApiClient(git_org)
-
-        # Create the repository and push the project to GitHub
-        gh_rest_api_client.create_and_push_project(gh_client, project_dir, repo_name)
-
-        # Check and create contributor teams
-        gh_rest_api_client.check_and_create_teams(gh_client, repo_name)
-
-        # Create repository environments for Signing Off experience
-        gh_rest_api_client.create_github_environments(gh_client, repo_name)
+        with gh_rest_api_client.GHApiClient(git_org) as gh_client:
+            provision_github(gh_client, project_dir)
@@ -0,0 +1,82 @@
+"""Command to fetch cookiecutter templates into the local template cache ahead of `cr8tor initiate`."""
+
+from typing import Annotated, List
+
+import typer
+import rich
+
+import cr8tor.core.template_cache as template_cache
+from cr8tor.utils import console
+
+app = typer.Typer()
+
+
+@app.command(name="prewarm-template")
+def prewarm_template(
+    template_paths: Annotated[
+        List[str],
+        typer.Option(
+            "-t",
+            help="GitHub URL of a cr8-cookiecutter template. Repeat to cache several templates.",
+        ),
+    ],
+    checkouts: Annotated[
+        List[str],
+        typer.Option(
+            "-chk",
+            help="Branch, tag or commit to cache for every template. Repeat to cache several revisions; the default branch when omitted.",
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        typer.Option(
+            "--refresh",
+            help="Fetch the templates again even if they are already cached.",
+        ),
+    ] = False,
+):
+    """
+    Fetches cookiecutter templates into the local template cache used by `cr8tor initiate`.
+
+    Args:
+        template_paths (List[str]): GitHub URLs of cr8-cookiecutter templates.
+        checkouts (List[str], optional): Branches, tags or commits to cache for every template.
+                                         The default branch is cached when omitted.
+        refresh (bool): Fetch the templates again even if they are already cached. Defaults to False.
+
+    Run it when building runner images so that initiations on the runners need no network
+    access to the template. The cache lives under CR8TOR_CACHE_DIR (default ~/.cache/cr8tor);
+    `cr8tor initiate` must use the same `-t` and `-chk` values to hit it.
+
+    Example usage:
+        cr8tor prewarm-template -t https://github.com/lsc-sde-crates/cr8-cookiecutter -chk v1.2.0
+
+        cr8tor prewarm-template -t https://github.com/lsc-sde-crates/cr8-cookiecutter --refresh
+    """
+    if not template_cache.cache_enabled():
+        raise typer.BadParameter("The template cache is disabled by CR8TOR_NO_CACHE.")
+
+    table = rich.table.Table(title="cr8tor template cache")
+    table.add_column("Template", style="cyan")
+    table.add_column("Checkout")
+    table.add_column("Revision")
+    table.add_column("Path")
+
+    for template_path in template_paths:
+        if template_cache.is_local_template(template_path):
+            raise typer.BadParameter(
+                f"{template_path} is a local directory and is used without caching."
+            )
+        for checkout in checkouts or [None]:
+            template_dir, _ = template_cache.resolve_template(
+                template_path, checkout, refresh=refresh
+            )
+            info = template_cache.read_template_info(template_dir)
+            table.add_row(
+                template_path,
+                checkout or "(default)",
+                info.get("revision") or "",
+                template_dir,
+            )
+
+    console.print(table)
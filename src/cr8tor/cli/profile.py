@@ -0,0 +1,89 @@
+import typer
+import rich
+import cr8tor.core.schema as schemas
+import cr8tor.core.resourceops as project_resources
+
+from pathlib import Path
+from typing import Annotated
+
+from cr8tor.exception import DirectoryNotFoundError
+from cr8tor.utils import console
+
+app = typer.Typer()
+
+
+@app.command(name="profile")
+def profile(
+    resources_dir: Annotated[
+        Path,
+        typer.Option(
+            default="-i", help="Directory containing resources to include in RO-Crate."
+        ),
+    ] = "./resources",
+):
+    """
+    Summarises where the time of each project action was spent, per phase of the command.
+
+    Args:
+        resources_dir (Path): Path to the directory containing the project resources. Defaults to "./resources".
+
+    Phase timings are recorded by every action command and are also rendered as the `phases`
+    property of the action entities in the RO-Crate:
+    - gate_check: loading the RO-Crate graph and checking the previous action completed
+    - resource_load / resource_write: reading and writing resource TOML files
+    - remote_call: requests to the cr8tor services
+    - merge: merging retrieved metadata into the dataset resources
+
+    The phases cover the command up to the end of its action. The RO-Crate build and bag save
+    that follow are not included, as the bag they write must match project.toml; they are
+    recorded as trace spans when tracing is enabled. Phases may nest, so they do not add up to
+    the action duration.
+
+    Example usage:
+        cr8tor profile -i path-to-resources-dir
+    """
+    if not resources_dir.exists():
+        raise DirectoryNotFoundError(resources_dir)
+
+    project_resource_path = resources_dir.joinpath("governance", "project.toml")
+    governance = project_resources.read_resource(project_resource_path)
+
+    table = rich.table.Table()
+    table.add_column("Action", style="cyan", no_wrap=True)
+    table.add_column("Phase", style="magenta")
+    table.add_column("Spans", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("% of command", justify="right")
+
+    for action in governance.get("actions", []):
+        action_props = schemas.ActionProps.model_validate({**action, "type": "Action"})
+        action_seconds = (
+            action_props.end_time - action_props.start_time
+        ).total_seconds()
+
+        table.add_row(
+            action_props.id,
+            "[bold]total[/bold]",
+            "",
+            f"{action_seconds:.3f}",
+            "",
+            style="bold",
+        )
+        for phase in sorted(
+            action_props.phases, key=lambda p: p.duration_seconds, reverse=True
+        ):
+            share = (
+                f"{100 * phase.duration_seconds / action_seconds:.1f}"
+                if action_seconds > 0
+                else ""
+            )
+            table.add_row(
+                "",
+                phase.name,
+                str(phase.count),
+                f"{phase.duration_seconds:.3f}",
+                share,
+            )
+        table.add_section()
+
+    console.print(rich.panel.Panel(table, title="Action Phase Timings"))
@@ -1,12 +1,15 @@
 import os
 import typer
 import asyncio
+import time
 import uuid
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Dict, Tuple, Union
 import cr8tor.core.schema as schemas
 import cr8tor.core.resourceops as project_resources
 import cr8tor.core.crate_graph as proj_graph
+import cr8tor.core.datasets as datasets
+import cr8tor.core.integrity as integrity
 import cr8tor.cli.utils as cli_utils
 
 from datetime import datetime
@@ -16,6 +19,35 @@ import cr8tor.core.api_client as api
 app = typer.Typer()
 
 
+async def publish_datasets(
+    publish_requests: Dict[str, schemas.DataContractPublishRequest],
+    max_concurrency: int,
+) -> Dict[str, Union[Tuple[dict, float], Exception]]:
+    """
+    Publish datasets concurrently, with at most `max_concurrency` requests in flight.
+
+    Args:
+        publish_requests (Dict[str, DataContractPublishRequest]): Publish request per dataset name.
+        max_concurrency (int): Maximum number of concurrent publish requests.
+    Returns:
+        Dict[str, Union[Tuple[dict, float], Exception]]: Response payload and elapsed seconds,
+            or the raised exception, per dataset name.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def publish_dataset(publish_request: schemas.DataContractPublishRequest):
+        async with semaphore:
+            transfer_start = time.perf_counter()
+            response = await api.publish(publish_request)
+            return response, time.perf_counter() - transfer_start
+
+    responses = await asyncio.gather(
+        *(publish_dataset(request) for request in publish_requests.values()),
+        return_exceptions=True,
+    )
+    return dict(zip(publish_requests.keys(), responses))
+
+
 @app.command(name="publish")
 def publish(
     agent: Annotated[
@@ -34,6 +66,14 @@ def publish(
             default="-i", help="Directory containing resources to include in RO-Crate."
         ),
     ] = "./resources",
+    max_concurrency: Annotated[
+        int,
+        typer.Option(
+            "--max-concurrency",
+            "-mc",
+            help="Maximum number of datasets published concurrently.",
+        ),
+    ] = 4,
 ):
     """
     Publishes the data by transferring it from staging to production storage, making it accessible to a TRE and/or authorised TRE workspace.
@@ -42,13 +82,15 @@ def publish(
         agent (str): The agent label triggering the validation. Defaults to None.
         bagit_dir (Path): Path to the Bagit directory containing the RO-Crate data directory. Defaults to "./bagit".
         resources_dir (Path): Path to the directory containing resources to include in the RO-Crate. Defaults to "./resources".
+        max_concurrency (int): Maximum number of datasets published concurrently. Defaults to 4.
 
     This command performs the following actions:
-    - Transfers the staged data to production storage.
+    - Transfers the staged data of each dataset to production storage, publishing datasets in parallel.
+    - Records the publish location of each dataset, and reports datasets that failed to publish.
     - Ensures the data is accessible to the TRE or authorised TRE workspace.
 
     Example usage:
-        cr8tor publish -a <agent_label> -b <path-to-bagit-dir> -i <path-to-resources-dir>
+        cr8tor publish -a <agent_label> -b <path-to-bagit-dir> -i <path-to-resources-dir> --max-concurrency 8
     """
     if agent is None:
         agent = os.getenv("AGENT_USER")
@@ -86,33 +128,94 @@ def publish(
             instrument=os.getenv("PUBLISH_NAME"),
         )
 
-    dataset_meta_file = None
-
-    # TODO: Discuss with Piotr whether the publish function should be called per dataset or per project?
-    # Currently assumes 1 dataset file in metadata
+    project_datasets = datasets.find_datasets(resources_dir)
+    if not project_datasets:
+        cli_utils.close_create_action_command(
+            command_type=schemas.Cr8torCommandType.PUBLISH,
+            start_time=start_time,
+            project_id=project_info["project"]["id"],
+            agent=agent,
+            project_resource_path=project_resource_path,
+            resources_dir=resources_dir,
+            exit_msg=f"No dataset metadata found in {resources_dir.joinpath('metadata')}",
+            exit_code=schemas.Cr8torReturnCode.ACTION_EXECUTION_ERROR,
+            instrument=os.getenv("PUBLISH_NAME"),
+        )
 
     try:
-        for f in resources_dir.joinpath("metadata").glob("dataset*.toml"):
-            dataset_meta_file = f
-            break
-
-        publish_req = schemas.DataContractPublishRequest(
-            project_name=project_info["project"]["project_name"],
-            project_start_time=project_info["project"]["project_start_time"],
-            destination=project_info["project"]["destination"],
-        )
+        publish_requests = {
+            dataset.path.name: schemas.DataContractPublishRequest(
+                project_name=project_info["project"]["project_name"],
+                project_start_time=project_info["project"]["project_start_time"],
+                destination=project_info["project"]["destination"],
+                dataset=dataset.read_manifest_model(),
+            )
+            for dataset in project_datasets
+        }
+
+        responses = asyncio.run(publish_datasets(publish_requests, max_concurrency))
+
+        failures = []
+        for dataset in project_datasets:
+            dataset_name = (
+                publish_requests[dataset.path.name].dataset.name or dataset.path.stem
+            )
+            response = responses[dataset.path.name]
+            if isinstance(response, Exception):
+                failures.append(f"{dataset_name}: {response}")
+                continue
+            response, elapsed_seconds = response
+            staged_location = publish_requests[dataset.path.name].dataset.staging_path
+
+            response["destination_type"] = project_info["project"]["destination"][
+                "type"
+            ]
+            validate_resp = schemas.PublishPayload(**response)
+
+            dataset_results = []
+            for publish_location in validate_resp.data_published:
+                publish_location_dict = publish_location.model_dump(exclude_none=True)
+                publish_location_dict["@id"] = str(uuid.uuid4())
+                dataset_results.append(publish_location_dict)
 
-        resp_dict = asyncio.run(api.publish(publish_req))
-        resp_dict["destination_type"] = project_info["project"]["destination"]["type"]
-        validate_resp = schemas.PublishPayload(**resp_dict)
-        if validate_resp.data_published:
-            publish_location_dict = validate_resp.data_published[0].model_dump()
-            publish_location_dict["@id"] = str(uuid.uuid4())
+            for result in dataset_results:
+                verification_status, mismatches = integrity.verify_publish(
+                    staged_location, result
+                )
+                if mismatches:
+                    failures.append(
+                        f"{dataset_name}: integrity check failed ({'; '.join(mismatches)})"
+                    )
+                publish_results.append(
+                    {
+                        **result,
+                        "dataset": dataset_name,
+                        "verification_status": verification_status,
+                        **integrity.transfer_metrics(
+                            elapsed_seconds,
+                            result.get("total_bytes"),
+                            result.get("row_count"),
+                        ),
+                    }
+                )
 
-            publish_results.append(publish_location_dict)
+            if len(dataset_results) > 1:
+                # A dataset records a single publish_path; keep every location in the
+                # action result, but do not pick one of them silently
+                failures.append(
+                    f"{dataset_name}: the publish service reported {len(dataset_results)} "
+                    "locations, but a dataset has a single publish_path"
+                )
+            elif dataset_results:
+                project_resources.create_resource_entity(
+                    dataset.manifest_path, "publish_path", dataset_results[0]
+                )
 
-            project_resources.create_resource_entity(
-                dataset_meta_file, "publish_path", publish_location_dict
+        if failures:
+            exit_code = schemas.Cr8torReturnCode.ACTION_EXECUTION_ERROR
+            exit_msg = (
+                f"Publish failed for {len(failures)} of {len(project_datasets)} datasets - "
+                + "; ".join(failures)
             )
 
     except Exception as e:
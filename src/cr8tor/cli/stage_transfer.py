@@ -1,6 +1,7 @@
 import os
 import typer
 import asyncio
+import time
 import uuid
 
 from pathlib import Path
@@ -11,6 +12,8 @@ import cr8tor.core.api_client as api
 import cr8tor.core.schema as schemas
 import cr8tor.core.resourceops as project_resources
 import cr8tor.core.crate_graph as proj_graph
+import cr8tor.core.datasets as datasets
+import cr8tor.core.integrity as integrity
 import cr8tor.cli.utils as cli_utils
 
 
@@ -92,12 +95,11 @@ def stage_transfer(
             instrument=os.getenv("PUBLISH_NAME"),
         )
 
-    for dataset_meta_file in resources_dir.joinpath("metadata").glob("dataset*.toml"):
-        dataset_dict = project_resources.read_resource(dataset_meta_file)
-        dataset_props = schemas.DatasetMetadata(**dataset_dict)
+    access = project_resources.read_resource(access_resource_path)
+    for dataset in datasets.find_datasets(resources_dir):
+        dataset_props = dataset.read_dataset_model()
 
         try:
-            access = project_resources.read_resource(access_resource_path)
             source_data = {}
             source_data["source"] = access["source"].copy()
             source_data["source"]["type"] = source_data["source"]["type"].lower()
@@ -113,7 +115,9 @@ def stage_transfer(
                 dataset=dataset_props,
             )
 
+            transfer_start = time.perf_counter()
             resp_dict = asyncio.run(api.stage_transfer(access_contract))
+            elapsed_seconds = time.perf_counter() - transfer_start
             resp_dict["destination_type"] = project_info["project"]["destination"][
                 "type"
             ]
@@ -123,13 +127,25 @@ def stage_transfer(
             # TODO: Add error response handler for action error property
 
             if validate_resp.data_retrieved:
-                staging_location_dict = validate_resp.data_retrieved[0].model_dump()
+                staging_location_dict = validate_resp.data_retrieved[0].model_dump(
+                    exclude_none=True
+                )
                 staging_location_dict["@id"] = str(uuid.uuid4())
 
-                staging_results.append(staging_location_dict)
+                staging_results.append(
+                    {
+                        **staging_location_dict,
+                        "dataset": dataset_props.name or dataset.path.stem,
+                        **integrity.transfer_metrics(
+                            elapsed_seconds,
+                            staging_location_dict.get("total_bytes"),
+                            staging_location_dict.get("row_count"),
+                        ),
+                    }
+                )
 
                 project_resources.create_resource_entity(
-                    dataset_meta_file, "staging_path", staging_location_dict
+                    dataset.manifest_path, "staging_path", staging_location_dict
                 )
 
         except Exception as e:
@@ -2,6 +2,7 @@ import typer
 import cr8tor.core.schema as schemas
 import cr8tor.cli.build as ro_crate_builder
 import cr8tor.core.resourceops as project_resources
+import cr8tor.core.profiling as profiling
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -42,16 +43,19 @@ def close_create_action_command(
         error=err,
         instrument=instrument,
         result=result,
+        phases=profiling.timer.summary(),
     )
 
-    project_resources.delete_resource_entity(
-        project_resource_path, "actions", "id", f"{command_type}-{project_id}"
-    )
-    project_resources.update_resource_entity(
-        project_resource_path, "actions", action_props.model_dump()
-    )
+    with project_resources.resource_lock(project_resource_path):
+        project_resources.delete_resource_entity(
+            project_resource_path, "actions", "id", f"{command_type}-{project_id}"
+        )
+        project_resources.update_resource_entity(
+            project_resource_path, "actions", action_props.model_dump()
+        )
 
-    ro_crate_builder.build(resources_dir, config_file, dryrun)
+    with profiling.phase("build"):
+        ro_crate_builder.build(resources_dir, config_file, dryrun)
     exit_command(command_type, exit_code, exit_msg)
 
 
@@ -90,6 +94,7 @@ def close_assess_action_command(
         instrument=instrument,
         additional_type=additional_type,
         result=result,
+        phases=profiling.timer.summary(),
     )
 
     #
@@ -98,14 +103,16 @@ def close_assess_action_command(
     # actions is updated with the new action entity
     #
 
-    project_resources.delete_resource_entity(
-        project_resource_path, "actions", "id", f"{command_type}-{project_id}"
-    )
-    project_resources.update_resource_entity(
-        project_resource_path, "actions", action_props.model_dump()
-    )
+    with project_resources.resource_lock(project_resource_path):
+        project_resources.delete_resource_entity(
+            project_resource_path, "actions", "id", f"{command_type}-{project_id}"
+        )
+        project_resources.update_resource_entity(
+            project_resource_path, "actions", action_props.model_dump()
+        )
 
-    ro_crate_builder.build(resources_dir)
+    with profiling.phase("build"):
+        ro_crate_builder.build(resources_dir)
     exit_command(command_type, exit_code, exit_msg)
 
 
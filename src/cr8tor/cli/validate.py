@@ -5,6 +5,8 @@ import cr8tor.core.api_client as api
 import cr8tor.core.schema as schemas
 import cr8tor.core.resourceops as project_resources
 import cr8tor.core.crate_graph as proj_graph
+import cr8tor.core.datasets as datasets
+import cr8tor.core.profiling as profiling
 import cr8tor.cli.utils as cli_utils
 
 from pathlib import Path
@@ -14,58 +16,179 @@ from datetime import datetime
 app = typer.Typer()
 
 
+def _merge_table_metadata(
+    existing_table: dict, meta_table: schemas.TableMetadata
+) -> None:
+    existing_columns = existing_table.setdefault("columns", [])
+    if meta_table.description:
+        existing_table["description"] = meta_table.description
+
+    existing_col_lookup = {col["name"]: col for col in existing_columns}
+
+    meta_columns = meta_table.columns.rows() if meta_table.columns else []
+    for col_name, col_datatype, col_description in meta_columns:
+        if col_name not in existing_col_lookup:
+            new_col = {"name": col_name}
+            if col_datatype:
+                new_col["datatype"] = col_datatype
+            if col_description:
+                new_col["description"] = col_description
+            existing_columns.append(new_col)
+        else:
+            existing_col = existing_col_lookup[col_name]
+            if col_description and "description" not in existing_col:
+                existing_col["description"] = col_description
+            if col_datatype and "datatype" not in existing_col:
+                existing_col["datatype"] = col_datatype
+
+
+def _new_table_metadata(meta_table: schemas.TableMetadata) -> dict:
+    new_table = {"name": meta_table.name}
+    if meta_table.columns:
+        new_table["columns"] = []
+        for col_name, col_datatype, col_description in meta_table.columns.rows():
+            col_dict = {"name": col_name}
+            if col_datatype:
+                col_dict["datatype"] = col_datatype
+            if col_description:
+                col_dict["description"] = col_description
+            new_table["columns"].append(col_dict)
+    return new_table
+
+
+@profiling.timed("merge")
 def merge_metadata_into_dataset(
     resource_path: Path, metadata: schemas.DatasetMetadata
 ) -> None:
-    resource_data = project_resources.read_resource(resource_path)
-
-    if "tables" not in resource_data:
-        resource_data["tables"] = []
-
-    table_lookup = {table["name"]: table for table in resource_data["tables"]}
-
-    for meta_table in metadata.tables or []:
-        if meta_table.name in table_lookup:
-            existing_table = table_lookup[meta_table.name]
-            existing_columns = existing_table.setdefault("columns", [])
-            if meta_table.description:
-                existing_table["description"] = meta_table.description
-
-            existing_col_lookup = {col["name"]: col for col in existing_columns}
-
-            for meta_col in meta_table.columns or []:
-                if meta_col.name not in existing_col_lookup:
-                    new_col = {"name": meta_col.name}
-                    if meta_col.datatype:
-                        new_col["datatype"] = meta_col.datatype
-                    if meta_col.description:
-                        new_col["description"] = meta_col.description
-                    existing_columns.append(new_col)
-                else:
-                    existing_col = existing_col_lookup[meta_col.name]
-                    if meta_col.description and "description" not in existing_col:
-                        existing_col["description"] = meta_col.description
-                    if meta_col.datatype and "datatype" not in existing_col:
-                        existing_col["datatype"] = meta_col.datatype
+    """
+    Merge remote schema metadata into a dataset resource (dataset TOML or sharded dataset directory).
+    For sharded datasets only the manifest and the table files of the returned tables are rewritten.
 
-        else:
-            new_table = {"name": meta_table.name}
-            if meta_table.columns:
-                new_table["columns"] = []
-                for col in meta_table.columns:
-                    col_dict = {"name": col.name}
-                    if col.datatype:
-                        col_dict["datatype"] = col.datatype
-                    if col.description:
-                        col_dict["description"] = col.description
-                    new_table["columns"].append(col_dict)
+    Raises:
+        ValueError: If a new table of a sharded dataset has a name that is not a plain file name.
+    """
+    dataset = datasets.DatasetResource(resource_path)
+    if dataset.is_sharded:
+        _merge_metadata_into_sharded_dataset(dataset, metadata)
+        return
+
+    with project_resources.resource_lock(resource_path):
+        resource_data = project_resources.read_resource(resource_path)
+
+        if "tables" not in resource_data:
+            resource_data["tables"] = []
+
+        table_lookup = {table["name"]: table for table in resource_data["tables"]}
+
+        for meta_table in metadata.tables or []:
+            if meta_table.name in table_lookup:
+                _merge_table_metadata(table_lookup[meta_table.name], meta_table)
+            else:
+                resource_data["tables"].append(_new_table_metadata(meta_table))
+
+        if metadata.description:
+            resource_data["description"] = metadata.description
 
-            resource_data["tables"].append(new_table)
+        project_resources.update_resource(resource_path, resource_data)
 
-    if metadata.description:
-        resource_data["description"] = metadata.description
 
-    project_resources.update_resource(resource_path, resource_data)
+def _merge_metadata_into_sharded_dataset(
+    dataset: datasets.DatasetResource, metadata: schemas.DatasetMetadata
+) -> None:
+    with project_resources.resource_lock(dataset.manifest_path):
+        manifest = project_resources.read_resource(dataset.manifest_path)
+        table_files = manifest.setdefault("table_files", [])
+        table_lookup = {
+            project_resources.read_resource_entity(
+                dataset.path.joinpath(table_file), "name"
+            ): dataset.path.joinpath(table_file)
+            for table_file in table_files
+        }
+        # Check every new table name before writing anything
+        new_table_paths = {
+            meta_table.name: dataset.table_file_path(meta_table.name)
+            for meta_table in metadata.tables or []
+            if meta_table.name not in table_lookup
+        }
+
+        for meta_table in metadata.tables or []:
+            table_path = table_lookup.get(meta_table.name)
+            if table_path is not None:
+                with project_resources.resource_lock(table_path):
+                    table_data = project_resources.read_resource(table_path)
+                    _merge_table_metadata(table_data, meta_table)
+                    project_resources.update_resource(table_path, table_data)
+            else:
+                table_path = new_table_paths[meta_table.name]
+                project_resources.create_resource(
+                    table_path, _new_table_metadata(meta_table)
+                )
+                table_files.append(table_path.relative_to(dataset.path).as_posix())
+
+        if metadata.description:
+            manifest["description"] = metadata.description
+
+        project_resources.update_resource(dataset.manifest_path, manifest)
+
+
+def projected_dataset(dataset_meta: schemas.DatasetMetadata) -> schemas.DatasetMetadata:
+    """
+    Copy of the dataset with only the table and column names, as sent in a column-projected
+    validate request. Descriptions and datatypes are left for the service to fill in.
+    """
+    tables = None
+    if dataset_meta.tables is not None:
+        tables = [
+            schemas.TableMetadata(
+                name=table.name,
+                columns=schemas.ColumnSet(
+                    table.columns.names,
+                    (None,) * len(table.columns),
+                    (None,) * len(table.columns),
+                )
+                if table.columns is not None
+                else None,
+            )
+            for table in dataset_meta.tables
+        ]
+    return dataset_meta.model_copy(update={"tables": tables})
+
+
+def project_tables_metadata(
+    remote_metadata: List[schemas.TableMetadata],
+    local_metadata: List[schemas.TableMetadata],
+) -> List[schemas.TableMetadata]:
+    """
+    Restrict the remote tables and columns to those named in the dataset resource. Tables
+    without a column list keep every column. Applied to every projected response, so
+    services that ignore `column_projection` behave the same.
+    """
+    if not local_metadata:
+        return remote_metadata
+
+    requested = {
+        table.name: frozenset(table.columns.names) if table.columns else None
+        for table in local_metadata
+    }
+    projected = []
+    for table in remote_metadata or []:
+        if table.name not in requested:
+            continue
+        columns = requested[table.name]
+        if columns is None or table.columns is None:
+            projected.append(table)
+            continue
+        rows = [row for row in table.columns.rows() if row[0] in columns]
+        projected.append(
+            table.model_copy(
+                update={
+                    "columns": schemas.ColumnSet(*zip(*rows))
+                    if rows
+                    else schemas.ColumnSet()
+                }
+            )
+        )
+    return projected
 
 
 def verify_tables_metadata(
@@ -73,7 +196,8 @@ def verify_tables_metadata(
     local_metadata: List[schemas.TableMetadata],
 ) -> Tuple[bool, Optional[str]]:
     remote_lookup = {
-        table.name: {col.name for col in table.columns} for table in remote_metadata
+        table.name: frozenset(table.columns.names if table.columns else ())
+        for table in remote_metadata
     }
 
     if local_metadata is not None:
@@ -89,11 +213,11 @@ def verify_tables_metadata(
             if local_table.columns is None:
                 continue
 
-            for filter_col in local_table.columns:
-                if filter_col.name not in remote_table_columns:
+            for filter_col_name in local_table.columns.names:
+                if filter_col_name not in remote_table_columns:
                     return (
                         False,
-                        f"Validation Error: Column '{filter_col.name}' is missing from target schema table '{table_name}' metadata.",
+                        f"Validation Error: Column '{filter_col_name}' is missing from target schema table '{table_name}' metadata.",
                     )
 
     return True, None
@@ -117,6 +241,20 @@ def validate(
             default="-i", help="Directory containing resources to include in RO-Crate."
         ),
     ] = "./resources",
+    enrich: Annotated[
+        bool,
+        typer.Option(
+            default="--enrich",
+            help="Fetch the full schema of the requested tables and add every column to the dataset resources.",
+        ),
+    ] = False,
+    no_cache: Annotated[
+        bool,
+        typer.Option(
+            default="--no-cache",
+            help="Always fetch the full schema metadata instead of reusing cached responses.",
+        ),
+    ] = False,
 ):
     """
     Validate the contents of a Bagit directory containing an RO-Crate data directory.
@@ -127,10 +265,17 @@ def validate(
                           Defaults to "./bagit".
         resources_dir (Path): The directory containing resources to include in the RO-Crate.
                               Defaults to "./resources".
+        enrich (bool): Fetch every column of the requested tables and add the missing
+                       columns to the dataset resources. By default only the tables and
+                       columns named in the dataset resources are requested. Defaults to False.
+        no_cache (bool): Always fetch the full schema metadata instead of reusing cached
+                         responses. Defaults to False.
 
     This function performs the following:
     - Validates the contents of the specified Bagit directory and its RO-Crate data directory.
-    - Validates access and governance metadata resources.
+    - Validates access and governance metadata resources. Schema metadata responses are cached
+      (see CR8TOR_CACHE_DIR and CR8TOR_CACHE_TTL) and revalidated with the service, so an
+      unchanged source schema is not downloaded again.
     - Rebuilds the Bagit contents, including the RO-Crate metadata.
 
     Example usage:
@@ -169,10 +314,10 @@ def validate(
             instrument=os.getenv("METADATA_NAME"),
         )
 
-    for dataset_meta_file in resources_dir.joinpath("metadata").glob("dataset_*.toml"):
+    access = project_resources.read_resource(access_resource_path)
+    for dataset in datasets.find_datasets(resources_dir):
         try:
-            access = project_resources.read_resource(access_resource_path)
-            dataset_meta = project_resources.read_resource(dataset_meta_file)
+            dataset_meta = dataset.read_dataset()
             source_data = {}
             source_data["source"] = access["source"].copy()
             source_data["source"]["type"] = source_data["source"]["type"].lower()
@@ -180,16 +325,26 @@ def validate(
             source_data["extract_config"] = (
                 access["extract_config"] if "extract_config" in access else None
             )
+            requested_dataset = schemas.DatasetMetadata(**dataset_meta)
+            if not enrich:
+                requested_dataset = projected_dataset(requested_dataset)
             access_contract = schemas.DataContractValidateRequest(
                 project_name=project_dict["project_name"],
                 project_start_time=project_dict["project_start_time"],
                 destination=project_dict["destination"],
                 source=source_data["source"],
                 extract_config=source_data.get("extract_config"),
-                dataset=schemas.DatasetMetadata(**dataset_meta),
+                dataset=requested_dataset,
+                column_projection=not enrich,
+            )
+            metadata = asyncio.run(
+                api.validate_access(access_contract, use_cache=not no_cache)
             )
-            metadata = asyncio.run(api.validate_access(access_contract))
             validate_dataset_info = schemas.DatasetMetadata(**metadata)
+            if not enrich:
+                validate_dataset_info.tables = project_tables_metadata(
+                    validate_dataset_info.tables, requested_dataset.tables
+                )
 
         except Exception as e:
             cli_utils.close_assess_action_command(
@@ -212,7 +367,12 @@ def validate(
             exit_code = schemas.Cr8torReturnCode.VALIDATION_ERROR
             break
 
-        merge_metadata_into_dataset(dataset_meta_file, validate_dataset_info)
+        try:
+            merge_metadata_into_dataset(dataset.path, validate_dataset_info)
+        except ValueError as e:
+            exit_msg = str(e)
+            exit_code = schemas.Cr8torReturnCode.VALIDATION_ERROR
+            break
     #
     # This assumes validate can be run multiple times on a project
     # Ensures previous run entities for this action are cleared in "actions" before
@@ -4,6 +4,10 @@ from pydantic import BaseModel
 from typing import Optional, Union, Literal, Any, Dict
 from dotenv import load_dotenv, find_dotenv
 import json
+import cr8tor.core.profiling as profiling
+import cr8tor.core.response_cache as response_cache
+import cr8tor.core.tracing as tracing
+from cr8tor.utils import log
 from cr8tor.core.schema import (
     DataContractPublishRequest,
     DataContractValidateRequest,
@@ -23,10 +27,17 @@ class HTTPResponse(BaseModel, frozen=True):
 class SuccessResponse(BaseModel):
     # status: Literal["success"]
     # payload: dict
+    etag: Optional[str] = None
+
     class Config:
         extra = "allow"
 
 
+class NotModifiedResponse(BaseModel):
+    status: Literal["not_modified"] = "not_modified"
+    etag: Optional[str] = None
+
+
 class ErrorResponse(BaseModel):
     status: Literal["error"]
     # error_code: str
@@ -49,27 +60,45 @@ class APIClient:
             "x-api-key": f"{self.token}",
         }
 
+    async def send(
+        self, method: str, url: str, headers: dict = None, **kwargs
+    ) -> httpx.Response:
+        """Send a request within a client trace span, propagating the trace context in headers"""
+        with tracing.span(
+            f"HTTP {method}",
+            tracing.SPAN_KIND_CLIENT,
+            **{"http.request.method": method, "url.full": url},
+        ) as span:
+            headers = {
+                **self.get_headers(),
+                **tracing.tracer.propagation_headers(),
+                **(headers or {}),
+            }
+            response = await self.client.request(method, url, headers=headers, **kwargs)
+            span.set_attribute("http.response.status_code", response.status_code)
+            span.set_attribute("http.request.body.size", len(response.request.content))
+            span.set_attribute("http.response.body.size", len(response.content))
+            if response.status_code >= 400:
+                span.set_error(f"HTTP {response.status_code}")
+            return response
+
     async def get(
         self, endpoint: str, params: dict = None
     ) -> Union[SuccessResponse, ErrorResponse]:
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = await self.client.get(
-                url, params=params, headers=self.get_headers()
-            )
+            response = await self.send("GET", url, params=params)
             return self.handle_response(response)
         except httpx.RequestError as exc:
             raise RuntimeError(f"GET Request {url} failed: {exc}") from exc
 
     async def post(
-        self, endpoint: str, data: dict = None
-    ) -> Union[SuccessResponse, ErrorResponse]:
+        self, endpoint: str, data: dict = None, headers: dict = None
+    ) -> Union[SuccessResponse, ErrorResponse, NotModifiedResponse]:
         url = f"{self.base_url}/{endpoint}"
         try:
             print(data)
-            response = await self.client.post(
-                url, json=data, headers=self.get_headers()
-            )
+            response = await self.send("POST", url, headers=headers, json=data)
             return self.handle_response(response)
         except httpx.RequestError as exc:
             raise RuntimeError(f"POST request {url} failed: {exc}") from exc
@@ -79,7 +108,7 @@ class APIClient:
     ) -> Union[SuccessResponse, ErrorResponse]:
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = await self.client.put(url, json=data, headers=self.get_headers())
+            response = await self.send("PUT", url, json=data)
             return self.handle_response(response)
         except httpx.RequestError as exc:
             raise RuntimeError(f"PUT request {url} failed: {exc}") from exc
@@ -87,16 +116,21 @@ class APIClient:
     async def delete(self, endpoint: str) -> Union[SuccessResponse, ErrorResponse]:
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = await self.client.delete(url, headers=self.get_headers())
+            response = await self.send("DELETE", url)
             return self.handle_response(response)
         except httpx.RequestError as exc:
             raise RuntimeError(f"DELETE Request {url} failed: {exc}") from exc
 
     def handle_response(
         self, response: httpx.Response
-    ) -> Union[SuccessResponse, ErrorResponse]:
+    ) -> Union[SuccessResponse, ErrorResponse, NotModifiedResponse]:
         if response.status_code == 200:
-            return SuccessResponse(**response.json())
+            # The ETag header wins over an `etag` key the payload may carry
+            return SuccessResponse.model_validate(
+                {**response.json(), "etag": response.headers.get("ETag")}
+            )
+        elif response.status_code == 304:
+            return NotModifiedResponse(etag=response.headers.get("ETag"))
         else:
             return ErrorResponse(**response.json())
 
@@ -136,7 +170,36 @@ def get_service_api(service: str) -> APIClient:
     return APIClient(base_url, token, port)
 
 
-async def validate_access(access_info: DataContractValidateRequest) -> HTTPResponse:
+def validate_cache_key(base_url: str, access_info: DataContractValidateRequest) -> str:
+    """
+    Response cache key of a validate request: the service, the source connection without its
+    credentials, the schema name, the requested tables and columns and whether the response
+    is projected to them.
+    """
+    dataset = access_info.dataset
+    return response_cache.make_cache_key(
+        url=f"{base_url}/project/validate",
+        source=access_info.source.model_dump(mode="json", exclude={"credentials"}),
+        schema_name=dataset.schema_name,
+        tables=[
+            [table.name, list(table.columns.names) if table.columns else None]
+            for table in dataset.tables or []
+        ],
+        column_projection=access_info.column_projection,
+    )
+
+
+@profiling.timed("remote_call")
+async def validate_access(
+    access_info: DataContractValidateRequest, use_cache: bool = True
+) -> HTTPResponse:
+    """
+    Fetch the source schema metadata of the requested dataset from the metadata service.
+
+    Unless `use_cache` is False (or CR8TOR_NO_CACHE=true), the payload is cached with the
+    schema fingerprint returned by the service, and later calls send it in `If-None-Match`
+    so an unchanged schema is answered with a 304 and served from the cache.
+    """
     test = os.getenv("USE_TEST_DATA", "false").lower() == "true"
     if test:
         json_str = """{
@@ -244,17 +307,43 @@ async def validate_access(access_info: DataContractValidateRequest) -> HTTPRespo
 
     service = "ApprovalService"
     async with get_service_api(service) as approval_service_client:
+        cache = response_cache.ResponseCache()
+        cache_key = None
+        cached = None
+        if use_cache and response_cache.cache_enabled():
+            cache_key = validate_cache_key(
+                approval_service_client.base_url, access_info
+            )
+            cached = cache.get(cache_key)
+
+        headers = None
+        if cached and cached.fingerprint:
+            headers = {"If-None-Match": cached.fingerprint}
+
         response = await approval_service_client.post(
-            endpoint="project/validate", data=access_info.model_dump(mode="json")
+            endpoint="project/validate",
+            data=access_info.model_dump(mode="json"),
+            headers=headers,
         )
+        if isinstance(response, NotModifiedResponse) and cached:
+            log.info(
+                f"Schema metadata of '{access_info.dataset.schema_name}' is unchanged, using the cached response"
+            )
+            cache.touch(cache_key, cached)
+            return cached.payload
         if isinstance(response, SuccessResponse):
             print("Success:", response)
         else:
             print("Error:", response)
             raise Exception(response)
+
+        fingerprint = response.etag or response.payload.get("schema_fingerprint")
+        if cache_key and fingerprint:
+            cache.put(cache_key, response.payload, fingerprint)
         return response.payload
 
 
+@profiling.timed("remote_call")
 async def stage_transfer(access_info: DataContractTransferRequest) -> HTTPResponse:
     test = os.getenv("USE_TEST_DATA", "false").lower() == "true"
     if test:
@@ -263,7 +352,10 @@ async def stage_transfer(access_info: DataContractTransferRequest) -> HTTPRespon
             "payload": {
                 "data_retrieved": [
                     {
-                        "file_path": "lsc/staging/data/outputs/database.duckdb"
+                        "file_path": "lsc/staging/data/outputs/database.duckdb",
+                        "hash_value": "f12190d5b8bd373103a6ecbd3e6f059d211c85fc3843888115c53f647c806afffdb2a55a6d98af4c78ecf5ee534d044a708240696a5852b484928ee10580f087",
+                        "total_bytes": 1585152,
+                        "row_count": 4213
                     }
                 ]
             }
@@ -283,6 +375,7 @@ async def stage_transfer(access_info: DataContractTransferRequest) -> HTTPRespon
         return response.payload
 
 
+@profiling.timed("remote_call")
 async def publish(access_info: DataContractPublishRequest) -> HTTPResponse:
     test = os.getenv("USE_TEST_DATA", "false").lower() == "true"
     if test:
@@ -293,7 +386,8 @@ async def publish(access_info: DataContractPublishRequest) -> HTTPResponse:
                     {
                         "file_path": "lsc/production/data/outputs/database.duckdb",
                         "hash_value": "f12190d5b8bd373103a6ecbd3e6f059d211c85fc3843888115c53f647c806afffdb2a55a6d98af4c78ecf5ee534d044a708240696a5852b484928ee10580f087",
-                        "total_bytes": 1585152
+                        "total_bytes": 1585152,
+                        "row_count": 4213
                     }
                 ]
             }
@@ -313,6 +407,7 @@ async def publish(access_info: DataContractPublishRequest) -> HTTPResponse:
         return response.payload
 
 
+@profiling.timed("remote_call")
 async def approve(project_url: str) -> HTTPResponse:
     service = "ApprovalService"
     async with get_service_api(service) as approval_service_client:
@@ -0,0 +1,225 @@
+"""Module serialising a BagIt bag into a single archive to hand over to another TRE.
+
+The bag is written to the archive in one sequential pass with a fixed size buffer, so
+memory use does not depend on the payload size. The SHA-256 digest of the archive is
+computed from the bytes as they are written, rather than by reading the archive back.
+
+The bag is checked with its Payload-Oxum (file count and total size) before export instead
+of re-hashing the payload; the payload manifests travel inside the archive for the receiving
+TRE to validate. With `verify=True`, each payload file is also checked against the manifest
+from the same read that writes it to the archive.
+
+Following the BagIt serialisation rules (RFC 8493, section 4.2), the archive holds a single
+top level directory named after the archive. Entries are sorted and their ownership is
+cleared, so exporting an unchanged bag twice gives archives with the same content.
+
+`tar.zst` needs the optional `zstandard` package (`pip install cr8tor[zstd]`).
+"""
+
+import hashlib
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Tuple
+
+import bagit
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+import cr8tor.core.bag_fetch as bag_fetch
+from cr8tor.utils import log, set_default_file_mode
+
+ARCHIVE_FORMATS = ("zip", "tar.gz", "tar.zst")
+ARCHIVE_DIGEST_ALGORITHM = "sha256"
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class HashingWriter:
+    """Write-only file wrapper that hashes and counts the bytes written through it"""
+
+    def __init__(self, fileobj: BinaryIO, algorithm: str = ARCHIVE_DIGEST_ALGORITHM):
+        self.fileobj = fileobj
+        self.digest = hashlib.new(algorithm)
+        self.bytes_written = 0
+
+    def write(self, data) -> int:
+        self.digest.update(data)
+        self.bytes_written += len(data)
+        return self.fileobj.write(data)
+
+    def tell(self) -> int:
+        # zipfile writes data descriptors when the output is not seekable
+        return self.bytes_written
+
+    def flush(self):
+        self.fileobj.flush()
+
+
+class VerifyingReader:
+    """Read-only file wrapper that hashes the bytes read through it"""
+
+    def __init__(self, fileobj: BinaryIO, algorithm: str):
+        self.fileobj = fileobj
+        self.digest = hashlib.new(algorithm)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.fileobj.read(size)
+        self.digest.update(data)
+        return data
+
+
+def archive_suffix(archive_format: str) -> str:
+    return f".{archive_format}"
+
+
+def archive_root_name(output: Path, archive_format: str) -> str:
+    name = Path(output).name
+    suffix = archive_suffix(archive_format)
+    return name[: -len(suffix)] if name.endswith(suffix) else Path(output).stem
+
+
+def bag_files(bag_dir: Path) -> List[Path]:
+    """Every file of the bag relative to its directory, tag files first"""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(bag_dir):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            files.append(Path(dirpath, filename).relative_to(bag_dir))
+    return sorted(files, key=lambda path: (path.parts[0] == "data", path.as_posix()))
+
+
+def check_bag(bag_dir: Path) -> bagit.Bag:
+    """
+    Load the bag and check it is complete from its Payload-Oxum, without hashing. Files
+    listed in fetch.txt may still be missing; the receiver fetches them.
+    """
+    bag = bagit.Bag(str(bag_dir))
+    bag_fetch.validate_fast(bag)
+    return bag
+
+
+@contextmanager
+def open_archive(writer: HashingWriter, archive_format: str):
+    """Yield an `add(path, arcname, fileobj)` function writing to the archive stream"""
+    if archive_format == "zip":
+        with zipfile.ZipFile(
+            writer, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
+        ) as archive:
+
+            def add(path: Path, arcname: str, fileobj: BinaryIO):
+                zinfo = zipfile.ZipInfo.from_file(path, arcname)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                with archive.open(zinfo, "w") as dest:
+                    shutil.copyfileobj(fileobj, dest, COPY_BUFFER_SIZE)
+
+            yield add
+        return
+
+    if archive_format == "tar.zst":
+        if zstandard is None:
+            raise ImportError(
+                "Exporting to tar.zst needs the zstandard package: pip install cr8tor[zstd]"
+            )
+        compressed = zstandard.ZstdCompressor(threads=-1).stream_writer(
+            writer, closefd=False
+        )
+        tar_stream, mode = compressed, "w|"
+    elif archive_format == "tar.gz":
+        compressed, tar_stream, mode = None, writer, "w|gz"
+    else:
+        raise ValueError(
+            f"Unknown archive format '{archive_format}'. Choose one of: {', '.join(ARCHIVE_FORMATS)}"
+        )
+
+    with tarfile.open(
+        fileobj=tar_stream,
+        mode=mode,
+        bufsize=COPY_BUFFER_SIZE,
+        format=tarfile.PAX_FORMAT,
+    ) as archive:
+
+        def add(path: Path, arcname: str, fileobj: BinaryIO):
+            tarinfo = archive.gettarinfo(str(path), arcname)
+            if tarinfo.islnk():
+                # `cr8tor fetch` hard links duplicate artifacts. Store every file in full,
+                # as in zip, so each payload file is read (and verified) from the archive
+                tarinfo.type = tarfile.REGTYPE
+                tarinfo.linkname = ""
+                tarinfo.size = os.stat(path).st_size
+            tarinfo.uid = tarinfo.gid = 0
+            tarinfo.uname = tarinfo.gname = ""
+            archive.addfile(tarinfo, fileobj)
+
+        yield add
+    if compressed is not None:
+        compressed.close()
+
+
+def export_bag(
+    bag_dir: Path,
+    output: Path,
+    archive_format: str = "zip",
+    verify: bool = False,
+) -> Tuple[str, int, int]:
+    """
+    Write the bag at `bag_dir` to the archive `output`.
+
+    The archive is written to a temporary file next to `output` and renamed into place once
+    complete, together with a `<output>.sha256` file in `sha256sum` format.
+
+    Args:
+        bag_dir (Path): The BagIt directory.
+        output (Path): Archive file to write.
+        archive_format (str): One of zip, tar.gz or tar.zst. Defaults to zip.
+        verify (bool): Check each payload file against the bag manifest while exporting it.
+    Returns:
+        Tuple[str, int, int]: SHA-256 digest and size of the archive, and the number of files.
+    Raises:
+        bagit.BagValidationError: If the bag is incomplete, or a payload file does not match
+            the manifest when `verify` is set.
+    """
+    bag_dir = Path(bag_dir)
+    output = Path(output)
+    bag = check_bag(bag_dir)
+    payload_entries: Dict[str, Dict[str, str]] = bag.payload_entries() if verify else {}
+    root = archive_root_name(output, archive_format)
+    files = bag_files(bag_dir)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=output.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer = HashingWriter(f)
+            with open_archive(writer, archive_format) as add:
+                for relative_path in files:
+                    path = bag_dir.joinpath(relative_path)
+                    expected = payload_entries.get(relative_path.as_posix(), {})
+                    with open(path, "rb") as src:
+                        reader = src
+                        if expected:
+                            algorithm, expected_digest = next(iter(expected.items()))
+                            reader = VerifyingReader(src, algorithm)
+                        add(path, f"{root}/{relative_path.as_posix()}", reader)
+                    if expected and reader.digest.hexdigest() != expected_digest:
+                        raise bagit.BagValidationError(
+                            f"{relative_path} does not match its {algorithm} manifest entry"
+                        )
+        set_default_file_mode(tmp_path)
+        os.replace(tmp_path, output)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+    digest = writer.digest.hexdigest()
+    output.with_name(output.name + ".sha256").write_text(
+        f"{digest}  {output.name}\n", encoding="utf-8"
+    )
+    log.info(f"Exported {len(files)} files from {bag_dir} to {output}")
+    return digest, writer.bytes_written, len(files)
@@ -0,0 +1,345 @@
+"""Module listing large external artifacts in the bag `fetch.txt` instead of copying them.
+
+Staged and published datasets live in TRE storage and are only referenced by URL in the
+RO-Crate. When a fetch base URL is configured (`base_url` in the `[fetch]` table of
+config.toml, or CR8TOR_FETCH_BASE_URL), `cr8tor build` lists the `staging_path` and
+`publish_path` artifact of each dataset in the bag `fetch.txt` (RFC 8493, section 2.2.3):
+
+    <base_url>/<file_path>  <total_bytes>  data/artifacts/<dataset>/<staging|publish>/<file name>
+
+Their SHA-512 `hash_value` is added to the payload manifest and their size to the
+Payload-Oxum, so the bag describes its complete payload without holding it. `cr8tor fetch`
+downloads the artifacts into the bag when they are needed, after which the bag validates as
+complete with any BagIt tool. Artifacts without a recorded hash or size are not listed.
+
+The base URL is an http(s) URL, or a file URL for storage mounted locally. File URLs are
+written with an explicit `localhost` host (`file://localhost/mnt/tre/...`), as BagIt tools
+reject fetch.txt URLs without a host.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import quote, urljoin, urlparse, urlunparse
+from urllib.request import url2pathname
+
+import bagit
+import httpx
+from pydantic import BaseModel
+
+from cr8tor.core.integrity import HASH_ALGORITHM
+from cr8tor.utils import log, set_default_file_mode
+
+FETCH_FILE = "fetch.txt"
+ARTIFACT_DIR = "artifacts"
+ARTIFACT_LOCATIONS = ("staging_path", "publish_path")
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+class FetchEntry(BaseModel):
+    url: str
+    length: Optional[int] = None
+    path: str
+    digest: Optional[str] = None
+
+
+class FetchResult(BaseModel):
+    path: str
+    url: str
+    status: str
+    bytes: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+
+def fetch_url(url: str) -> str:
+    """
+    `url` in the form fetch.txt needs: BagIt tools reject URLs without a host, so
+    `file:///path` is written as `file://localhost/path`.
+
+    Raises:
+        ValueError: If `url` has no scheme, or no host and is not a file URL.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "file" and not parsed.netloc:
+        return urlunparse(parsed._replace(netloc="localhost"))
+    if not parsed.scheme or not parsed.netloc:
+        raise ValueError(
+            f"Fetch URLs must be absolute with a host, e.g. https://storage.example.org/tre/ "
+            f"or file://localhost/mnt/tre/: {url}"
+        )
+    return url
+
+
+def fetch_base_url(config: dict) -> Optional[str]:
+    base_url = os.getenv("CR8TOR_FETCH_BASE_URL") or config.get("fetch", {}).get(
+        "base_url"
+    )
+    return fetch_url(base_url) if base_url else None
+
+
+def artifact_url(base_url: str, file_path: str) -> str:
+    if urlparse(file_path).scheme:
+        return fetch_url(file_path)
+    return urljoin(base_url.rstrip("/") + "/", quote(file_path.lstrip("/")))
+
+
+def artifact_entries(
+    dataset_name: str, dataset_props, base_url: Optional[str]
+) -> List[FetchEntry]:
+    """Fetch entries for the staged and published artifacts of a dataset"""
+    if not base_url:
+        return []
+
+    entries = []
+    for location_name in ARTIFACT_LOCATIONS:
+        location = getattr(dataset_props, location_name, None)
+        if not location or not location.get("file_path"):
+            continue
+        if location.get("hash_value") is None or location.get("total_bytes") is None:
+            log.warning(
+                f"Not listing {location['file_path']} in {FETCH_FILE}: "
+                "its hash_value or total_bytes is not recorded"
+            )
+            continue
+        file_name = PurePosixPath(location["file_path"]).name
+        stage = location_name.removesuffix("_path")
+        entries.append(
+            FetchEntry(
+                url=artifact_url(base_url, location["file_path"]),
+                length=int(location["total_bytes"]),
+                path=f"data/{ARTIFACT_DIR}/{dataset_name}/{stage}/{file_name}",
+                digest=location["hash_value"],
+            )
+        )
+    return entries
+
+
+def read_fetch_entries(bag: bagit.Bag) -> List[FetchEntry]:
+    """Entries of the bag fetch.txt, with their digest from the payload manifest"""
+    payload_entries = bag.payload_entries()
+    entries = []
+    for url, length, path in bag.fetch_entries():
+        digests = payload_entries.get(path, {})
+        entries.append(
+            FetchEntry(
+                url=url,
+                length=None if length == "-" else int(length),
+                path=path,
+                digest=digests.get(HASH_ALGORITHM),
+            )
+        )
+    return entries
+
+
+def pending_entries(bag: bagit.Bag) -> List[FetchEntry]:
+    """Fetch entries whose file is not in the bag yet"""
+    return [
+        entry
+        for entry in read_fetch_entries(bag)
+        if not Path(bag.path, entry.path).is_file()
+    ]
+
+
+def write_fetch_file(bag: bagit.Bag, entries: List[FetchEntry]) -> None:
+    """
+    Write `entries` to the fetch.txt of a bag whose manifests were just regenerated from
+    the files on disk, and add the entries not fetched yet to the payload manifest and
+    Payload-Oxum. Removes fetch.txt when there are no entries.
+    """
+    bag_dir = Path(bag.path)
+    fetch_path = bag_dir.joinpath(FETCH_FILE)
+    if not entries:
+        if fetch_path.exists():
+            fetch_path.unlink()
+            bag.save()
+        return
+    if HASH_ALGORITHM not in bag.algorithms:
+        raise bagit.BagError(
+            f"Listing artifacts in {FETCH_FILE} needs a {HASH_ALGORITHM} payload manifest"
+        )
+
+    with open(fetch_path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(f"{entry.url}  {entry.length}  {entry.path}\n")
+
+    oxum_bytes, oxum_files = (int(n) for n in bag.info["Payload-Oxum"].split("."))
+    manifest_path = bag_dir.joinpath(f"manifest-{HASH_ALGORITHM}.txt")
+    with open(manifest_path, "a", encoding="utf-8") as manifest:
+        for entry in entries:
+            # Files already fetched were hashed with the rest of the payload
+            if bag_dir.joinpath(entry.path).is_file():
+                continue
+            manifest.write(f"{entry.digest}  {entry.path}\n")
+            oxum_bytes += entry.length
+            oxum_files += 1
+    bag.info["Payload-Oxum"] = f"{oxum_bytes}.{oxum_files}"
+    bag.save()
+
+    log.info(f"Listed {len(entries)} artifacts in {fetch_path}")
+
+
+def validate_fast(bag: bagit.Bag) -> None:
+    """
+    `bag.validate(fast=True)` for bags with files still to fetch, whose Payload-Oxum
+    counts the pending files.
+    """
+    pending = pending_entries(bag)
+    if not pending:
+        bag.validate(fast=True)
+        return
+
+    bag.validate_fetch()
+    expected = bag.info.get("Payload-Oxum")
+    total_bytes = sum(entry.length or 0 for entry in pending)
+    total_files = len(pending)
+    for payload_file in bag.payload_files():
+        total_bytes += os.stat(os.path.join(bag.path, payload_file)).st_size
+        total_files += 1
+    if expected != f"{total_bytes}.{total_files}":
+        raise bagit.BagValidationError(
+            f"Payload-Oxum validation failed. Expected {expected}, found "
+            f"{total_bytes}.{total_files} including {len(pending)} files to fetch"
+        )
+
+
+@contextmanager
+def open_chunks(url: str, token: Optional[str] = None) -> Iterator[Iterator[bytes]]:
+    """Yield the content at a file:// or http(s):// URL as an iterator of chunks"""
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        with open(url2pathname(parsed.path), "rb") as f:
+            yield iter(lambda: f.read(COPY_BUFFER_SIZE), b"")
+        return
+    if parsed.scheme not in ("http", "https"):
+        raise ValueError(f"Unsupported URL scheme in {FETCH_FILE}: {url}")
+
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    with httpx.stream(
+        "GET", url, headers=headers, follow_redirects=True, timeout=60.0
+    ) as response:
+        response.raise_for_status()
+        yield response.iter_bytes(COPY_BUFFER_SIZE)
+
+
+def download(entry: FetchEntry, bag_dir: Path, token: Optional[str] = None) -> int:
+    """
+    Download a fetch entry into the bag, checking its size and digest before moving it
+    into place. Returns the number of bytes downloaded.
+    """
+    target = bag_dir.joinpath(entry.path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.new(HASH_ALGORITHM)
+    total_bytes = 0
+
+    fd, tmp_path = tempfile.mkstemp(dir=target.parent, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as dest, open_chunks(entry.url, token) as chunks:
+            for chunk in chunks:
+                digest.update(chunk)
+                dest.write(chunk)
+                total_bytes += len(chunk)
+        if entry.length is not None and total_bytes != entry.length:
+            raise bagit.BagValidationError(
+                f"{entry.path}: fetched {total_bytes} bytes, expected {entry.length}"
+            )
+        if entry.digest and digest.hexdigest() != entry.digest:
+            raise bagit.BagValidationError(
+                f"{entry.path}: {HASH_ALGORITHM} of the fetched file does not match the manifest"
+            )
+        set_default_file_mode(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return total_bytes
+
+
+def _link_or_copy(source: Path, target: Path):
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def fetch_bag(
+    bag_dir: Path, max_workers: int = 4, token: Optional[str] = None
+) -> List[FetchResult]:
+    """
+    Download the files listed in the bag fetch.txt that are not in the bag yet.
+
+    Files are downloaded concurrently by up to `max_workers` threads. Entries with the same
+    digest (e.g. the staged and published copy of a dataset) are downloaded once and linked.
+    Files already present with the expected size are skipped.
+    """
+    bag_dir = Path(bag_dir)
+    bag = bagit.Bag(str(bag_dir))
+    token = token or os.getenv("CR8TOR_FETCH_TOKEN")
+
+    results: Dict[str, FetchResult] = {}
+    groups: Dict[str, List[FetchEntry]] = defaultdict(list)
+    for entry in read_fetch_entries(bag):
+        target = bag_dir.joinpath(entry.path)
+        if target.is_file() and (
+            entry.length is None or target.stat().st_size == entry.length
+        ):
+            results[entry.path] = FetchResult(
+                path=entry.path,
+                url=entry.url,
+                status="present",
+                bytes=target.stat().st_size,
+            )
+        else:
+            groups[entry.digest or entry.path].append(entry)
+
+    def fetch_group(entries: List[FetchEntry]) -> List[FetchResult]:
+        first, *duplicates = entries
+        start = time.perf_counter()
+        try:
+            n_bytes = download(first, bag_dir, token)
+        except Exception as e:
+            log.error(f"Could not fetch {first.url}: {e}")
+            return [
+                FetchResult(
+                    path=entry.path, url=entry.url, status="failed", error=str(e)
+                )
+                for entry in entries
+            ]
+        group_results = [
+            FetchResult(
+                path=first.path,
+                url=first.url,
+                status="fetched",
+                bytes=n_bytes,
+                seconds=time.perf_counter() - start,
+            )
+        ]
+        for duplicate in duplicates:
+            _link_or_copy(
+                bag_dir.joinpath(first.path), bag_dir.joinpath(duplicate.path)
+            )
+            group_results.append(
+                FetchResult(
+                    path=duplicate.path,
+                    url=duplicate.url,
+                    status=f"linked to {first.path}",
+                    bytes=n_bytes,
+                )
+            )
+        return group_results
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for group_results in executor.map(fetch_group, groups.values()):
+            for result in group_results:
+                results[result.path] = result
+
+    return [results[path] for path in sorted(results)]
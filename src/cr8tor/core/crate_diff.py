@@ -0,0 +1,131 @@
+"""Module comparing two revisions of an RO-Crate metadata file entity by entity.
+
+Entities are keyed on their `@id` and compared by a digest of their canonical JSON, so two
+crates are compared in a single pass over each file. Only entities whose digest differs are
+compared property by property. `entity_digests` can also be stored on its own, e.g. by an
+index of previously built crates, and compared against a new crate later.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+import cr8tor.core.jsonld as jsonld
+from cr8tor.utils import log
+
+METADATA_FILE = "ro-crate-metadata.json"
+
+
+class EntityRef(BaseModel):
+    id: str
+    type: Optional[Any] = None
+
+
+class PropertyChange(BaseModel):
+    name: str
+    old: Any = None
+    new: Any = None
+
+
+class EntityChange(EntityRef):
+    properties: List[PropertyChange]
+
+
+class CrateDiff(BaseModel):
+    added: List[EntityRef] = []
+    removed: List[EntityRef] = []
+    changed: List[EntityChange] = []
+    unchanged: int = 0
+
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+def metadata_path(path: Path) -> Path:
+    """
+    Resolve the metadata file of a crate from the file itself, a crate directory or a
+    BagIt directory holding the crate in `data/`.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return path
+    for candidate in (
+        path.joinpath(METADATA_FILE),
+        path.joinpath("data", METADATA_FILE),
+    ):
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"No {METADATA_FILE} found in {path}")
+
+
+def entity_digest(entity: dict) -> str:
+    content = json.dumps(entity, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def read_entities(path: Path) -> Dict[str, dict]:
+    """The entities of the `@graph` of a crate, keyed on `@id`"""
+    entities = {}
+    with open(metadata_path(path), "r", encoding="utf-8") as f:
+        for key, value in jsonld.iter_document_members(f):
+            if key != "@graph":
+                continue
+            for entity in value:
+                entity_id = entity.get("@id")
+                if entity_id in entities:
+                    log.warning(
+                        f"Duplicate entity {entity_id} in {path}, keeping the last"
+                    )
+                entities[entity_id] = entity
+    return entities
+
+
+def entity_digests(entities: Dict[str, dict]) -> Dict[str, str]:
+    return {entity_id: entity_digest(entity) for entity_id, entity in entities.items()}
+
+
+def diff_properties(old: dict, new: dict) -> List[PropertyChange]:
+    changes = []
+    for name in sorted(old.keys() | new.keys()):
+        if old.get(name) != new.get(name):
+            changes.append(
+                PropertyChange(name=name, old=old.get(name), new=new.get(name))
+            )
+    return changes
+
+
+def diff_entities(old: Dict[str, dict], new: Dict[str, dict]) -> CrateDiff:
+    """Compare two sets of entities keyed on `@id`"""
+    diff = CrateDiff()
+    old_digests = entity_digests(old)
+
+    for entity_id, entity in new.items():
+        old_digest = old_digests.get(entity_id)
+        if old_digest is None:
+            diff.added.append(EntityRef(id=entity_id, type=entity.get("@type")))
+        elif old_digest == entity_digest(entity):
+            diff.unchanged += 1
+        else:
+            diff.changed.append(
+                EntityChange(
+                    id=entity_id,
+                    type=entity.get("@type"),
+                    properties=diff_properties(old[entity_id], entity),
+                )
+            )
+
+    for entity_id, entity in old.items():
+        if entity_id not in new:
+            diff.removed.append(EntityRef(id=entity_id, type=entity.get("@type")))
+
+    diff.added.sort(key=lambda ref: ref.id)
+    diff.removed.sort(key=lambda ref: ref.id)
+    diff.changed.sort(key=lambda ref: ref.id)
+    return diff
+
+
+def diff_crates(old_path: Path, new_path: Path) -> CrateDiff:
+    return diff_entities(read_entities(old_path), read_entities(new_path))
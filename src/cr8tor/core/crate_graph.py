@@ -1,11 +1,16 @@
 from rdflib import Graph
 from rdflib.query import Result
 import sys
+import logging
 from pathlib import Path
 import cr8tor.core.schema as schemas
+import cr8tor.core.profiling as profiling
+import cr8tor.core.jsonld as jsonld
+from cr8tor.utils import log
 
 
 class ROCrateGraph:
+    @profiling.timed("gate_check")
     def __init__(
         self, rocrate_metadata_path: Path, base_uri="https://lscsde.org/crate/"
     ):
@@ -14,23 +19,22 @@ class ROCrateGraph:
 
         rocrate_metadata_path = Path(rocrate_metadata_path)
 
-        with open(
+        jsonld.load_graph(
+            self.graph,
             rocrate_metadata_path.joinpath("data", "ro-crate-metadata.json"),
-            "r",
-            encoding="utf-8",
-        ) as f:
-            ro_crate_jsonld = f.read()
-
-        self.graph.parse(data=ro_crate_jsonld, format="json-ld", publicID=base_uri)
-        print("\n=== DEBUG: RDF Triples ===")
-        for stmt in self.graph:
-            print(stmt)
+            base=base_uri,
+        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("=== RDF Triples ===")
+            for stmt in self.graph:
+                log.debug(stmt)
 
     def run_query(self, sparql_query) -> Result:
         """Execute SPARQL query on the graph."""
         triples = self.graph.query(sparql_query)
         return triples
 
+    @profiling.timed("gate_check")
     def is_project_action_complete(
         self,
         command_type: schemas.Cr8torCommandType,
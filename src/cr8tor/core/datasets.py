@@ -0,0 +1,126 @@
+"""Module to locate and load dataset metadata resources in either supported layout.
+
+Single file layout (default):
+
+    resources/metadata/dataset_1.toml          # dataset properties and all [[tables]]
+
+Sharded layout, for datasets with many or very wide tables:
+
+    resources/metadata/dataset_1/manifest.toml # dataset properties and `table_files`
+    resources/metadata/dataset_1/tables/concept.toml
+    resources/metadata/dataset_1/tables/person.toml
+
+The manifest carries everything except the tables (name, description, schema_name,
+staging_path, publish_path) plus `table_files`, the table TOMLs relative to the
+dataset directory. Commands that only need dataset names or paths read the manifest
+and never load the table files.
+"""
+
+from pathlib import Path
+from typing import List
+
+import cr8tor.core.resourceops as project_resources
+import cr8tor.core.schema as schemas
+
+MANIFEST_FILE_NAME = "manifest.toml"
+TABLES_DIR_NAME = "tables"
+
+
+class DatasetResource:
+    def __init__(self, path: Path):
+        """Dataset metadata stored at `path`, a dataset TOML or a sharded dataset directory"""
+        self.path = Path(path)
+
+    def __repr__(self) -> str:
+        return f"DatasetResource({str(self.path)!r})"
+
+    @property
+    def is_sharded(self) -> bool:
+        return self.path.is_dir()
+
+    @property
+    def manifest_path(self) -> Path:
+        """Resource holding the dataset level properties (e.g. staging_path, publish_path)"""
+        if self.is_sharded:
+            return self.path.joinpath(MANIFEST_FILE_NAME)
+        return self.path
+
+    def table_paths(self) -> List[Path]:
+        if not self.is_sharded:
+            return []
+        manifest = project_resources.read_resource(self.manifest_path)
+        return [self.path.joinpath(f) for f in manifest.get("table_files", [])]
+
+    def resource_paths(self) -> List[Path]:
+        """All files making up the dataset, manifest first"""
+        return [self.manifest_path, *self.table_paths()]
+
+    def read_manifest(self) -> dict:
+        """Dataset level properties. Loads only the manifest for sharded datasets."""
+        manifest = project_resources.read_resource(self.manifest_path)
+        manifest.pop("table_files", None)
+        if not self.is_sharded:
+            manifest.pop("tables", None)
+        return manifest
+
+    def read_dataset(self) -> dict:
+        """The full dataset, including all tables"""
+        if not self.is_sharded:
+            return project_resources.read_resource(self.path)
+
+        dataset = self.read_manifest()
+        dataset["tables"] = [
+            project_resources.read_resource(table_path)
+            for table_path in self.table_paths()
+        ]
+        return dataset
+
+    def read_manifest_model(self) -> schemas.DatasetMetadata:
+        """Dataset level properties validated as DatasetMetadata without any tables"""
+        return schemas.DatasetMetadata(**self.read_manifest())
+
+    def read_dataset_model(self) -> schemas.DatasetMetadata:
+        if not self.is_sharded:
+            return project_resources.read_resource_model(
+                self.path, schemas.DatasetMetadata
+            )
+        return schemas.DatasetMetadata(**self.read_dataset())
+
+    def table_file_path(self, table_name: str) -> Path:
+        """
+        Table TOML for `table_name` in the dataset `tables` directory.
+
+        Raises:
+            ValueError: If the table name (which the metadata service supplies) is not a
+                plain file name, e.g. `../../governance/project`.
+        """
+        tables_dir = self.path.joinpath(TABLES_DIR_NAME)
+        if (
+            not table_name
+            or table_name in (".", "..")
+            or any(c in table_name for c in ("/", "\\", "\0"))
+        ):
+            raise ValueError(f"Invalid table name for a table file: {table_name!r}")
+        table_path = tables_dir.joinpath(f"{table_name}.toml")
+        if not table_path.resolve().is_relative_to(tables_dir.resolve()):
+            raise ValueError(f"Invalid table name for a table file: {table_name!r}")
+        return table_path
+
+
+def find_datasets(resources_dir: Path) -> List[DatasetResource]:
+    """
+    Find all dataset metadata resources in the project resources directory.
+
+    Args:
+        resources_dir (Path): Directory containing the project resources.
+    Returns:
+        List[DatasetResource]: Datasets in both single file and sharded layouts, sorted by path.
+    """
+    metadata_dir = Path(resources_dir).joinpath("metadata")
+    datasets = [
+        DatasetResource(f)
+        for f in metadata_dir.glob("dataset*")
+        if (f.is_file() and f.suffix == ".toml")
+        or f.joinpath(MANIFEST_FILE_NAME).is_file()
+    ]
+    return sorted(datasets, key=lambda d: d.path.name)
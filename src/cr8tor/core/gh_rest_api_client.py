@@ -1,19 +1,157 @@
-from typing import Any, Dict
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
 import requests
 import os
 import git
 import json
+import threading
 import time
 
-from cr8tor.utils import log
+import base64
+import hashlib
+
+from requests.adapters import HTTPAdapter
+
+import cr8tor.core.response_cache as response_cache
+from cr8tor.utils import get_cache_dir, log
+
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+
+def rate_limit_delay(response: requests.Response) -> Optional[float]:
+    """Seconds to wait before retrying a rate limited response, or None if it was not rate limited"""
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        return float(retry_after)
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset = float(response.headers.get("X-RateLimit-Reset", time.time() + 60))
+        return max(1.0, reset - time.time())
+    # Secondary rate limits: GitHub asks clients to wait at least a minute
+    if response.status_code == 429 or "secondary rate limit" in response.text.lower():
+        return 60.0
+    return None
+
+
+class GitHubRateLimiter:
+    def __init__(self, reserve: int = 10, secondary_mutation_interval: float = 1.0):
+        """
+        Schedules GitHub requests within the rate limit budget of the token.
+
+        The primary budget is tracked from the `X-RateLimit-*` headers and decremented
+        locally for requests in flight; once only `reserve` requests remain, callers wait
+        for the reset instead of spending the budget. A rate limited response pauses every
+        caller for the advertised delay. After a secondary rate limit, mutating requests are
+        spaced `secondary_mutation_interval` seconds apart for the rest of the process, as
+        GitHub recommends for bulk content creation.
+        """
+        self.reserve = reserve
+        self.secondary_mutation_interval = secondary_mutation_interval
+        self.remaining: Optional[int] = None
+        self.reset_at: float = 0.0
+        self.paused_until: float = 0.0
+        self.mutation_interval: float = 0.0
+        self._next_mutation_at: float = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, method: str):
+        """Block until a request of `method` may be sent, and reserve it from the budget"""
+        while True:
+            with self._lock:
+                now = time.time()
+                wait = self.paused_until - now
+                if (
+                    wait <= 0
+                    and self.remaining is not None
+                    and self.remaining <= self.reserve
+                    and self.reset_at > now
+                ):
+                    wait = self.reset_at - now
+                if wait <= 0 and method in MUTATING_METHODS:
+                    wait = self._next_mutation_at - now
+                if wait <= 0:
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    if method in MUTATING_METHODS:
+                        self._next_mutation_at = now + self.mutation_interval
+                    return
+            if wait > 5:
+                log.info(f"Waiting {wait:.0f}s for the GitHub rate limit to reset...")
+            time.sleep(wait)
+
+    def update(self, response: requests.Response):
+        """Refresh the budget from the rate limit headers of a response"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None:
+            return
+        with self._lock:
+            reset_at = float(reset) if reset else self.reset_at
+            if reset_at > self.reset_at:
+                # A new window has started; the response budget replaces the local count
+                self.remaining = int(remaining)
+            else:
+                self.remaining = min(int(remaining), self.remaining or int(remaining))
+            self.reset_at = reset_at
+
+    def pause(self, delay: float, secondary: bool):
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.time() + delay)
+            if secondary:
+                self.mutation_interval = self.secondary_mutation_interval
+
+
+# The budget belongs to the token, so every client of the process shares one limiter
+rate_limiter = GitHubRateLimiter()
+
+
+def _cached_response(
+    not_modified: requests.Response, payload: dict
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = payload["content"].encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers.update(payload["headers"])
+    response.url = not_modified.url
+    response.request = not_modified.request
+    return response
 
 
 class GHApiClient:
-    def __init__(self, git_org: str):
+    def __init__(self, git_org: str, max_workers: int = 8):
+        """
+        GitHub REST client for an organisation. Requests go through a pooled session so
+        concurrent provisioning calls reuse connections, and team lookups are cached.
+        Requests are scheduled by the process wide `rate_limiter`, and GET responses are
+        revalidated with their ETag (see `conditional_get`).
+        """
         self.base_url = "https://api.github.com"
         self.git_org = git_org
+        self.max_workers = max_workers
+        self.max_rate_limit_retries = 3
+        self.rate_limiter = rate_limiter
+        self.etag_cache = response_cache.ResponseCache(
+            cache_dir=get_cache_dir().joinpath("github")
+        )
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+        self.session.mount("https://", adapter)
+        self._teams: Dict[str, dict] = {}
+        self._teams_lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
     def get_headers(self) -> dict:
         return {
@@ -23,32 +161,89 @@ class GHApiClient:
             "X-GitHub-Api-Version": "2022-11-28",
         }
 
-    def get(self, endpoint: str, params: dict = None):
+    def request(
+        self, method: str, endpoint: str, headers: dict = None, **kwargs
+    ) -> requests.Response:
+        """
+        Send a request within the rate limit budget. A 403 or 429 rate limit response pauses
+        every request of the process for the advertised delay (`Retry-After`, the primary
+        limit reset, or a minute for secondary limits) and is retried, up to
+        `max_rate_limit_retries` times.
+        """
         url = f"{self.base_url}/{endpoint}"
-        try:
-            response = requests.get(url, params=params, headers=self.get_headers())
-            return response
-        except requests.RequestException as exc:
-            raise RuntimeError(f"GET Request {url} failed: {exc}") from exc
+        for attempt in range(self.max_rate_limit_retries + 1):
+            self.rate_limiter.acquire(method)
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers={**self.get_headers(), **(headers or {})},
+                    **kwargs,
+                )
+            except requests.RequestException as exc:
+                raise RuntimeError(f"{method} Request {url} failed: {exc}") from exc
+            self.rate_limiter.update(response)
+
+            delay = rate_limit_delay(response)
+            if delay is None or attempt == self.max_rate_limit_retries:
+                return response
+            secondary = response.headers.get("X-RateLimit-Remaining") != "0"
+            self.rate_limiter.pause(delay, secondary)
+            log.warning(
+                f"GitHub rate limit reached on {method} {endpoint}. Retrying in {delay:.0f}s..."
+            )
+
+    def conditional_get(self, endpoint: str, params: dict = None) -> requests.Response:
+        """
+        GET with `If-None-Match` from the local ETag cache. A `304 Not Modified`, which
+        GitHub does not count against the rate limit, is answered from the cache.
+        """
+        if not response_cache.cache_enabled():
+            return self.request("GET", endpoint, params=params)
+
+        token = os.getenv("GH_TOKEN") or ""
+        key = response_cache.make_cache_key(
+            url=f"{self.base_url}/{endpoint}",
+            params=params,
+            token=hashlib.sha256(token.encode()).hexdigest(),
+        )
+        cached = self.etag_cache.get(key)
+        headers = {"If-None-Match": cached.fingerprint} if cached else None
+
+        response = self.request("GET", endpoint, headers=headers, params=params)
+        if response.status_code == 304 and cached:
+            self.etag_cache.touch(key, cached)
+            return _cached_response(response, cached.payload)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            headers = {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() in ("content-type", "etag", "link")
+            }
+            self.etag_cache.put(
+                key, {"content": response.text, "headers": headers}, etag
+            )
+        return response
+
+    def get(self, endpoint: str, params: dict = None):
+        return self.conditional_get(endpoint, params=params)
 
     def post(self, endpoint: str, json: dict = None):
-        url = f"{self.base_url}/{endpoint}"
-        try:
-            response = requests.post(url, json=json, headers=self.get_headers())
-            return response
-        except requests.RequestException as exc:
-            raise RuntimeError(f"POST Request {url} failed: {exc}") from exc
+        return self.request("POST", endpoint, json=json)
 
     def put(self, endpoint: str, json: dict = None):
-        url = f"{self.base_url}/{endpoint}"
-        try:
-            response = requests.put(url, json=json, headers=self.get_headers())
-            return response
-        except requests.RequestException as exc:
-            raise RuntimeError(f"PUT Request {url} failed: {exc}") from exc
+        return self.request("PUT", endpoint, json=json)
 
-    def get_team(self, team_slug):
+    def get_team(self, team_slug, use_cache: bool = True):
         # https://docs.github.com/en/rest/teams/teams?apiVersion=2022-11-28#get-a-team-by-name
+        if use_cache:
+            with self._teams_lock:
+                team = self._teams.get(team_slug)
+            if team is not None:
+                return team
+
         endpoint = f"orgs/{self.git_org}/teams/{team_slug}"
         response = self.get(endpoint)
 
@@ -56,7 +251,30 @@ class GHApiClient:
         if response.status_code != 404:
             response.raise_for_status()
 
-        return response.json() if response.ok else None
+        team = response.json() if response.ok else None
+        if team is not None:
+            self._cache_team(team_slug, team)
+        return team
+
+    def _cache_team(self, team_slug, team: dict):
+        with self._teams_lock:
+            self._teams[team_slug] = team
+            self._teams[team["slug"]] = team
+
+    def wait_for_team(
+        self, team_slug, timeout: float = 30.0, interval: float = 0.5
+    ) -> Optional[dict]:
+        """
+        Poll until a newly created team is visible to the API, backing off up to 4 seconds
+        between attempts. Returns the team, or None if it is still missing after `timeout`.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            team = self.get_team(team_slug, use_cache=False)
+            if team is not None or time.monotonic() >= deadline:
+                return team
+            time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+            interval = min(interval * 2, 4.0)
 
     def create_team(self, team_name, description):
         # https://docs.github.com/en/rest/teams/teams?apiVersion=2022-11-28#create-a-team
@@ -72,7 +290,10 @@ class GHApiClient:
 
         response = self.post(endpoint, json=payload)
         response.raise_for_status()
-        return response.json() if response.ok else None
+        team = response.json() if response.ok else None
+        if team is not None:
+            self._cache_team(team["slug"], team)
+        return team
 
     def add_or_update_team_repository_permission(
         self, repo_name, team_slug, permission="push"
@@ -122,6 +343,7 @@ class GHApiClient:
         endpoint = f"repos/{self.git_org}/{repo_name}/environments/{enviroment_name}"
 
         # reviewers should be like like [{"type":"Team","id":1},{"type":"Team","id":2},{"type":"User","id":3}]
+        # Team lookups are cached, so environments sharing reviewers look each team up once
         reviewers = []
         for team_name in reviewers_team_list:
             reviewers.append({"type": "Team", "id": self.get_team(team_name)["id"]})
@@ -135,11 +357,77 @@ class GHApiClient:
         return response.json() if response.ok else None
 
 
+def run_concurrently(
+    gh_client: GHApiClient, calls: List[Callable[[], Any]]
+) -> List[Any]:
+    """
+    Run independent GitHub calls on a thread pool sharing the client session.
+
+    Returns:
+        List[Any]: The results in call order. The first failure is raised once every call has finished.
+    """
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(gh_client.max_workers, len(calls)))
+    ) as pool:
+        # Each call runs in a copy of the caller's context, so its spans keep their parent
+        futures = [pool.submit(contextvars.copy_context().run, call) for call in calls]
+    return [future.result() for future in futures]
+
+
+def push_new_project(
+    project_dir: str, remote_url: str, token: str, branch: str = "main"
+) -> Dict[str, float]:
+    """
+    Commit a rendered project as the first commit of a new repository and push it.
+
+    Three git processes run per project: `git init`, `git add -A` and `git push`. The
+    branch is set and the commit is written in process by GitPython. Files are still
+    hashed by `git add`, which is several times faster than adding them to the index
+    in process. The token reaches the push as an `http.extraheader` through the
+    environment. It is therefore neither stored in the remote URL in .git/config nor
+    visible in the process arguments, and no credential helper is consulted (git 2.31 or later
+    reads GIT_CONFIG_COUNT).
+
+    Returns:
+        Dict[str, float]: Seconds spent per step (init, add, commit, push) and the file count.
+    """
+    timings = {}
+    project_dir = Path(project_dir)
+
+    start = time.perf_counter()
+    repo = git.Repo.init(project_dir)
+    repo.head.set_reference(git.Head(repo, f"refs/heads/{branch}"))
+    timings["init"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    repo.git.add(A=True)
+    timings["add"] = time.perf_counter() - start
+    timings["files"] = len(repo.index.entries)
+
+    start = time.perf_counter()
+    repo.index.commit("Initial commit")
+    timings["commit"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    repo.create_remote("origin", remote_url)
+    credentials = base64.b64encode(f"x-access-token:{token}".encode()).decode()
+    push_env = {
+        "GIT_CONFIG_COUNT": "1",
+        "GIT_CONFIG_KEY_0": "http.extraheader",
+        "GIT_CONFIG_VALUE_0": f"AUTHORIZATION: basic {credentials}",
+        "GIT_TERMINAL_PROMPT": "0",
+    }
+    repo.git.push("--set-upstream", "origin", branch, env=push_env)
+    timings["push"] = time.perf_counter() - start
+
+    return timings
+
+
 def create_and_push_project(
     gh_client: GHApiClient,
     project_dir: str,
     repo_name: str,
-):
+) -> Optional[Dict[str, float]]:
     """
 
     Create a GitHub repository and push the generated project.
@@ -149,6 +437,10 @@ def create_and_push_project(
         project_dir (str): The local directory of the generated project.
         repo_name (str): The repository name to be created.
 
+    Returns:
+        Optional[Dict[str, float]]: The git timings of `push_new_project` if the repository
+        was created, None if it already existed.
+
     """
 
     # Step 1: Check if the repository already exists
@@ -159,7 +451,7 @@ def create_and_push_project(
         log.info(
             f"GitHub repository '{gh_client.git_org}/{repo_name}' already exists. Skipping creation..."
         )
-        return
+        return None
 
     # Step 2: Create a new repository under the organization
     response = gh_client.create_repository(repo_name)
@@ -173,21 +465,35 @@ def create_and_push_project(
 
     # Step 3: Initialize git, add, commit and push the local project
     try:
-        repo = git.Repo.init(project_dir)
-        repo.git.checkout("-b", "main")  # Ensure 'main' branch exists
-        repo.git.add(A=True)
-        repo.index.commit("Initial commit")
-
-        auth_repo_url = f"https://{os.getenv('GH_TOKEN')}@github.com/{gh_client.git_org}/{repo_name}.git"
-        repo.create_remote("origin", auth_repo_url)
-        repo.git.push("--set-upstream", "origin", "main")
+        repo_url = f"https://github.com/{gh_client.git_org}/{repo_name}.git"
+        timings = push_new_project(project_dir, repo_url, os.getenv("GH_TOKEN"))
         log.info(
-            f"Project pushed to GitHub repository '{gh_client.git_org}/{repo_name}'."
+            f"Project pushed to GitHub repository '{gh_client.git_org}/{repo_name}'. "
+            f"Git: {format_git_timings(timings)}"
         )
     except Exception as e:
         raise ValueError(f"An error occurred while pushing to GitHub: {e}")
 
-    # Step 4: Apply the rule set for the repository
+    return timings
+
+
+def format_git_timings(timings: Dict[str, float]) -> str:
+    steps = ", ".join(
+        f"{step} {timings[step]:.2f}s" for step in ("init", "add", "commit", "push")
+    )
+    total = sum(timings[step] for step in ("init", "add", "commit", "push"))
+    return f"{total:.2f}s ({steps}; {timings['files']} files)"
+
+
+def apply_repo_ruleset(gh_client: GHApiClient, project_dir: str, repo_name: str):
+    """
+    Apply the branch rule set shipped with the project template to the repository.
+
+    Args:
+        gh_client (GHApiClient): The GitHub API client.
+        project_dir (str): The local directory of the generated project.
+        repo_name (str): The repository name.
+    """
     project_repo_ruleset_path = Path(project_dir).joinpath(
         ".github", "branch_rules", "protect_main.json"
     )
@@ -210,6 +516,9 @@ def check_and_create_teams(
 
     Ensure GitHub teams exist and assign repository permissions.
 
+    The permissions of the existing teams are granted while the contributor team is
+    created. A new team is polled until GitHub serves it before its permission is added.
+
     Args:
         gh_client (GHApiClient): The GitHub API client.
         repo_name (str): The repository name.
@@ -221,40 +530,43 @@ def check_and_create_teams(
     approver_team = "cr8-ALL-projects-approver"
     devops_admin_team = "devops_admin"
 
-    team_response = gh_client.get_team(contributor_team)
-    team_slug = team_response["slug"] if team_response else None
-
-    if not team_slug:
-        team_slug = gh_client.create_team(
-            contributor_team, f"Team for contributor members for project {repo_name}"
-        )["slug"]
-        log.info(f"Created team {contributor_team}")
-
-        # wait 5 seconds for the team to be created in GitHub...
-        time.sleep(5)
-
-    else:
-        log.info(f"Team {contributor_team} already exists. Skipping creation...")
-
-    gh_client.add_or_update_team_repository_permission(
-        repo_name, devops_admin_team, permission="push"
-    )
-    log.info(
-        f"Added {repo_name} repository with 'push/write' permission to GitHub Team {devops_admin_team}"
-    )
-
-    gh_client.add_or_update_team_repository_permission(
-        repo_name, team_slug, permission="push"
-    )
-    log.info(
-        f"Added {repo_name} repository with 'push/write' permission to GitHub Team {contributor_team}"
-    )
+    def add_permission(team_slug, team_name, permission, label):
+        gh_client.add_or_update_team_repository_permission(
+            repo_name, team_slug, permission=permission
+        )
+        log.info(
+            f"Added {repo_name} repository with '{label}' permission to GitHub Team {team_name}"
+        )
 
-    gh_client.add_or_update_team_repository_permission(
-        repo_name, approver_team, permission="pull"
-    )
-    log.info(
-        f"Added {repo_name} repository with 'pull/read' permission to GitHub Team {approver_team}"
+    def add_contributor_permission():
+        team_response = gh_client.get_team(contributor_team)
+        team_slug = team_response["slug"] if team_response else None
+
+        if not team_slug:
+            team_slug = gh_client.create_team(
+                contributor_team,
+                f"Team for contributor members for project {repo_name}",
+            )["slug"]
+            log.info(f"Created team {contributor_team}")
+
+            if gh_client.wait_for_team(team_slug) is None:
+                log.warning(
+                    f"Team {contributor_team} is not visible yet, adding its permission anyway"
+                )
+        else:
+            log.info(f"Team {contributor_team} already exists. Skipping creation...")
+
+        add_permission(team_slug, contributor_team, "push", "push/write")
+
+    run_concurrently(
+        gh_client,
+        [
+            lambda: add_permission(
+                devops_admin_team, devops_admin_team, "push", "push/write"
+            ),
+            add_contributor_permission,
+            lambda: add_permission(approver_team, approver_team, "pull", "pull/read"),
+        ],
     )
 
 
@@ -267,14 +579,49 @@ def create_github_environments(gh_client: GHApiClient, repo_name: str) -> None:
         repo_name (str): The repository name.
     """
 
-    # Create signoff environment
-    gh_client.create_or_update_repo_env(
-        repo_name, "signoff", ["cr8-ALL-projects-approver"]
+    # Resolve the shared reviewer team once, before both environments are created concurrently
+    reviewers = ["cr8-ALL-projects-approver"]
+    for team_name in reviewers:
+        gh_client.get_team(team_name)
+
+    def create_environment(environment_name, label):
+        gh_client.create_or_update_repo_env(repo_name, environment_name, reviewers)
+        log.info(f"Created {label} environment for {repo_name}")
+
+    run_concurrently(
+        gh_client,
+        [
+            # Create signoff environment
+            lambda: create_environment("signoff", "Signing Off"),
+            # Create the Production environment
+            lambda: create_environment("disclosure", "Disclosure"),
+        ],
     )
-    log.info(f"Created Signing Off environment for {repo_name}")
 
-    # Create the Production environment
-    gh_client.create_or_update_repo_env(
-        repo_name, "disclosure", ["cr8-ALL-projects-approver"]
-    )
-    log.info(f"Created Disclosure environment for {repo_name}")
+
+def provision_project_repository(
+    gh_client: GHApiClient, project_dir: str, repo_name: str
+) -> Optional[Dict[str, float]]:
+    """
+    Create and push the project repository, then apply its rule set, team permissions and
+    environments concurrently.
+
+    Args:
+        gh_client (GHApiClient): The GitHub API client.
+        project_dir (str): The local directory of the generated project.
+        repo_name (str): The repository name.
+
+    Returns:
+        Optional[Dict[str, float]]: The git timings if the repository was created and pushed.
+    """
+    git_timings = create_and_push_project(gh_client, project_dir, repo_name)
+    created = git_timings is not None
+
+    calls = [
+        lambda: check_and_create_teams(gh_client, repo_name),
+        lambda: create_github_environments(gh_client, repo_name),
+    ]
+    if created:
+        calls.append(lambda: apply_repo_ruleset(gh_client, project_dir, repo_name))
+    run_concurrently(gh_client, calls)
+    return git_timings
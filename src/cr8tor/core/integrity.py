@@ -0,0 +1,147 @@
+"""Module to measure and verify the integrity of data moved by the stage-transfer and publish actions.
+
+Stage-transfer records the size, SHA-512 hash and row count of each staged artifact in the
+dataset `staging_path`. Publish compares them with the values reported for the published
+artifact and, when the TRE storage is mounted locally (`CR8TOR_VERIFY_ROOT`), with a hash of
+the published file itself. Both actions add the transfer throughput to their results, so slow
+or corrupt transfers are visible in the RO-Crate.
+"""
+
+import hashlib
+import os
+from enum import StrEnum
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from cr8tor.utils import log
+
+HASH_ALGORITHM = "sha512"
+INTEGRITY_FIELDS = ("hash_value", "total_bytes", "row_count")
+
+
+class VerificationStatus(StrEnum):
+    VERIFIED = "verified"
+    MISMATCH = "mismatch"
+    UNVERIFIED = "unverified"
+
+
+def file_digest(
+    path: Path, algorithm: str = HASH_ALGORITHM, chunk_size: int = 1024 * 1024
+) -> Tuple[str, int]:
+    """
+    Hash a file in fixed size chunks.
+
+    Args:
+        path (Path): File to hash.
+        algorithm (str): hashlib algorithm name. Defaults to sha512, as used by the bag manifests.
+        chunk_size (int): Bytes read per chunk.
+    Returns:
+        Tuple[str, int]: Hex digest and total number of bytes read.
+    """
+    digest = hashlib.new(algorithm)
+    total_bytes = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+            total_bytes += len(chunk)
+    return digest.hexdigest(), total_bytes
+
+
+def transfer_metrics(
+    elapsed_seconds: float,
+    total_bytes: Optional[int] = None,
+    row_count: Optional[int] = None,
+) -> dict:
+    """
+    Throughput of a single transfer, for inclusion in the action results.
+
+    Args:
+        elapsed_seconds (float): Wall clock duration of the transfer.
+        total_bytes (Optional[int]): Bytes transferred, if reported.
+        row_count (Optional[int]): Rows transferred, if reported.
+    Returns:
+        dict: `duration_seconds` and, where known, `bytes_per_second` and `rows_per_second`.
+    """
+    metrics = {"duration_seconds": round(elapsed_seconds, 3)}
+    if elapsed_seconds > 0:
+        if total_bytes is not None:
+            metrics["bytes_per_second"] = round(total_bytes / elapsed_seconds)
+        if row_count is not None:
+            metrics["rows_per_second"] = round(row_count / elapsed_seconds)
+    return metrics
+
+
+def _compare(expected: dict, actual: dict, label: str) -> Tuple[int, List[str]]:
+    compared = 0
+    mismatches = []
+    for field in INTEGRITY_FIELDS:
+        expected_value = expected.get(field)
+        actual_value = actual.get(field)
+        if expected_value is None or actual_value is None:
+            continue
+        compared += 1
+        if field == "hash_value":
+            equal = str(expected_value).lower() == str(actual_value).lower()
+        else:
+            equal = expected_value == actual_value
+        if not equal:
+            mismatches.append(f"{field} {label} {actual_value} != {expected_value}")
+    return compared, mismatches
+
+
+def verify_local_copy(location: dict, root: Optional[Path] = None) -> List[str]:
+    """
+    Hash the published file under a locally mounted storage root and compare it with the
+    reported `hash_value` and `total_bytes`.
+
+    Args:
+        location (dict): Published location with `file_path`, `hash_value` and `total_bytes`.
+        root (Optional[Path]): Storage root. Defaults to the CR8TOR_VERIFY_ROOT environment variable.
+    Returns:
+        List[str]: Mismatches found, empty if the local copy matches.
+    """
+    root = Path(root or os.getenv("CR8TOR_VERIFY_ROOT")).resolve()
+    # Paths are relative to the storage root even with a leading slash, as in fetch.txt.
+    # Anything resolving outside the root (e.g. `../../etc/passwd`) is not read.
+    local_path = root.joinpath(location["file_path"].lstrip("/")).resolve()
+    if not local_path.is_relative_to(root):
+        return [f"file_path {location['file_path']} is outside the storage root {root}"]
+    if not local_path.is_file():
+        return [f"file_path {local_path} not found"]
+
+    hash_value, total_bytes = file_digest(local_path)
+    _, mismatches = _compare(
+        location,
+        {"hash_value": hash_value, "total_bytes": total_bytes},
+        "local copy",
+    )
+    return mismatches
+
+
+def verify_publish(
+    staged: Optional[dict], published: dict
+) -> Tuple[VerificationStatus, List[str]]:
+    """
+    Verify a published artifact against the metrics recorded when it was staged and, if
+    CR8TOR_VERIFY_ROOT is set, against the published file itself.
+
+    Args:
+        staged (Optional[dict]): Dataset `staging_path` recorded by stage-transfer.
+        published (dict): Published location reported by the publish service.
+    Returns:
+        Tuple[VerificationStatus, List[str]]: Verification status and the list of mismatches.
+    """
+    compared, mismatches = _compare(staged or {}, published, "published")
+
+    if os.getenv("CR8TOR_VERIFY_ROOT") and published.get("file_path"):
+        compared += 1
+        mismatches.extend(verify_local_copy(published))
+
+    if mismatches:
+        log.warning(
+            f"Integrity check failed for {published.get('file_path')}: {'; '.join(mismatches)}"
+        )
+        return VerificationStatus.MISMATCH, mismatches
+    if not compared:
+        return VerificationStatus.UNVERIFIED, []
+    return VerificationStatus.VERIFIED, []
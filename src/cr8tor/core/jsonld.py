@@ -0,0 +1,281 @@
+"""Module loading JSON-LD documents, such as RO-Crate metadata, into rdflib graphs.
+
+`Graph.parse(format="json-ld")` decodes the whole document into memory before converting
+it, and resolves remote `@context` URLs (for RO-Crates, the RO-Crate context on w3id.org)
+over the network on every load. Here the document is read from a file stream and the
+entities of its `@graph` array are decoded and converted in batches, so only one batch of
+decoded entities is held at a time.
+
+Remote `@context` URLs are resolved without network access where possible, in order:
+
+- contexts bundled with cr8tor under `cr8tor/data/jsonld`, one file per context version
+  (currently the RO-Crate 1.1 context)
+- contexts fetched by an earlier load, cached under `get_cache_dir()/jsonld`; they are
+  versioned by URL, so cached copies do not expire
+- the network, unless CR8TOR_OFFLINE=true, in which case an unknown context is an error
+
+Set CR8TOR_NO_CACHE=true to skip the on-disk cache (bundled contexts are still used).
+"""
+
+import inspect
+import json
+import os
+import tempfile
+from importlib import resources
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any, Iterator, Optional, Tuple
+from urllib.request import Request, urlopen
+
+from rdflib import Graph
+
+# Streaming goes through the internals of rdflib's JSON-LD parser (tested with rdflib
+# 7.1). When they move or change, documents are parsed whole with `Graph.parse` instead.
+try:
+    from rdflib.plugins.parsers.jsonld import Parser
+    from rdflib.plugins.shared.jsonld.context import Context
+except ImportError:
+    Parser = Context = None
+
+from cr8tor.core.response_cache import cache_enabled, make_cache_key
+from cr8tor.exception import ContextNotAvailableError
+from cr8tor.utils import get_cache_dir, log
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_BATCH_SIZE = 1000
+
+BUNDLED_CONTEXTS = {
+    "https://w3id.org/ro/crate/1.1/context": "ro-crate-1.1.jsonld",
+    "http://w3id.org/ro/crate/1.1/context": "ro-crate-1.1.jsonld",
+}
+
+_context_documents: dict[str, Any] = {}
+
+
+def streaming_supported() -> bool:
+    """Whether the installed rdflib has the parser internals `load_graph` streams with"""
+    if Parser is None or Context is None:
+        return False
+    parameters = list(inspect.signature(Parser.parse).parameters)
+    return parameters == ["self", "data", "context", "dataset"]
+
+
+def offline() -> bool:
+    return os.getenv("CR8TOR_OFFLINE", "false").lower() == "true"
+
+
+def context_cache_dir() -> Path:
+    return get_cache_dir().joinpath("jsonld")
+
+
+def read_bundled_context(url: str) -> Optional[Any]:
+    filename = BUNDLED_CONTEXTS.get(url)
+    if filename is None:
+        return None
+    bundled = resources.files("cr8tor").joinpath("data", "jsonld", filename)
+    return json.loads(bundled.read_bytes())
+
+
+def fetch_context_document(url: str) -> Any:
+    """Return the remote context document at `url`, bundled or cached when possible"""
+    if url in _context_documents:
+        return _context_documents[url]
+
+    document = read_bundled_context(url)
+    if document is not None:
+        _context_documents[url] = document
+        return document
+
+    cache_path = context_cache_dir().joinpath(f"{make_cache_key(url=url)[:32]}.json")
+    document = None
+    if cache_enabled() and cache_path.exists():
+        try:
+            document = json.loads(cache_path.read_bytes())
+        except ValueError as e:
+            log.debug(f"Discarding unreadable context cache entry {cache_path}: {e}")
+
+    if document is None:
+        if offline():
+            raise ContextNotAvailableError(url)
+        log.debug(f"Fetching JSON-LD context {url}")
+        request = Request(
+            url, headers={"Accept": "application/ld+json, application/json"}
+        )
+        with urlopen(request, timeout=60) as response:
+            document = json.load(response)
+        if cache_enabled():
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(document, f)
+                os.replace(tmp_path, cache_path)
+            except OSError as e:
+                log.debug(f"Could not cache JSON-LD context {url}: {e}")
+
+    _context_documents[url] = document
+    return document
+
+
+def resolve_context(context_data: Any) -> Any:
+    """Replace the remote context URLs in `context_data` with their context documents"""
+    if isinstance(context_data, list):
+        return [resolve_context(item) for item in context_data]
+    if isinstance(context_data, str):
+        return fetch_context_document(context_data)
+    return context_data
+
+
+class _JsonStream:
+    """Incremental reader of JSON values from a text stream"""
+
+    def __init__(self, fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int = None) -> bool:
+        if self.eof:
+            return False
+        if self.pos > self.chunk_size:
+            self.buffer = self.buffer[self.pos :]
+            self.pos = 0
+        chunk = self.fp.read(size or self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of the stream"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill():
+                return self.buffer[self.pos : self.pos + 1]
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected '{char}' in JSON document, found '{found}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Read more than the buffered value so large values are not re-decoded often
+                if not self._fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # A number may continue past the end of the buffer
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Values of the array at the current position"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self.pos += 1
+                continue
+            self.expect("]")
+            return
+
+
+def iter_document_members(
+    fp: IO[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield the members of the top-level JSON object in `fp` as (key, value) pairs.
+
+    The value of "@graph" is an iterator over the array items, which must be consumed
+    before the next member is read.
+    """
+    stream = _JsonStream(fp, chunk_size)
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.expect(":")
+        if key == "@graph" and stream.peek() == "[":
+            items = stream.items()
+            yield key, items
+            for _ in items:
+                pass
+        else:
+            yield key, stream.value()
+        if stream.peek() == ",":
+            stream.pos += 1
+            continue
+        stream.expect("}")
+        return
+
+
+def _batches(items: Iterator[Any], size: int) -> Iterator[list]:
+    while batch := list(islice(items, size)):
+        yield batch
+
+
+def load_graph(
+    graph: Graph,
+    document_path: Path,
+    base: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Graph:
+    """
+    Add the triples of the JSON-LD document at `document_path` to `graph`.
+
+    Documents starting with their "@context", as written by rocrate and cr8tor, are
+    streamed. Any other document, or any document when `streaming_supported()` is False,
+    is decoded whole and parsed with `Graph.parse`, still with the cached contexts.
+    """
+    if not streaming_supported():
+        log.debug("rdflib JSON-LD parser internals changed, not streaming")
+        return _parse_whole(graph, document_path, base)
+
+    with open(document_path, "r", encoding="utf-8") as f:
+        members = iter_document_members(f)
+        try:
+            first = next(members, None)
+        except ValueError:
+            first = None
+        if first is not None and first[0] == "@context":
+            context = Context(base=base)
+            context.load(resolve_context(first[1]))
+            parser = Parser()
+            node = {}
+            for key, value in members:
+                if key == "@graph":
+                    for batch in _batches(value, batch_size):
+                        parser.parse(batch, context, graph)
+                else:
+                    node[key] = value
+            if node:
+                # Top-level properties besides @context and @graph describe a node
+                parser.parse([node], context, graph)
+            return graph
+
+    log.debug(f"{document_path} does not start with its @context, decoding it whole")
+    return _parse_whole(graph, document_path, base)
+
+
+def _parse_whole(graph: Graph, document_path: Path, base: Optional[str]) -> Graph:
+    with open(document_path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if isinstance(document, dict) and "@context" in document:
+        document = {**document, "@context": resolve_context(document["@context"])}
+    return graph.parse(data=json.dumps(document), format="json-ld", base=base)
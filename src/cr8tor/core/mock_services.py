@@ -0,0 +1,213 @@
+"""Module providing a local stand-in for the cr8tor Approval, Metadata and Publish services.
+
+Unlike USE_TEST_DATA, which short-circuits the API client, the mock services answer real
+HTTP requests so the client, its concurrency and timeouts are exercised end to end. Latency,
+failure rate and payload size are configurable, and the server only uses the standard
+library so it runs on machines without network access.
+
+Routes (all POST) follow the service APIs documented under docs/cr8tor-publisher:
+
+- /project/validate, /metadata/project, /data-publish/validate: dataset metadata, with an
+  ETag schema fingerprint and 304 answers to matching If-None-Match requests
+- /project/package, /data-publish/package: staged data location
+- /project/publish, /data-publish/publish: published data location
+- /approve: approval acknowledgement
+"""
+
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+VALIDATE_ROUTES = ("/project/validate", "/metadata/project", "/data-publish/validate")
+PACKAGE_ROUTES = ("/project/package", "/data-publish/package")
+PUBLISH_ROUTES = ("/project/publish", "/data-publish/publish")
+APPROVE_ROUTES = ("/approve",)
+
+
+class MockServiceConfig(BaseModel):
+    latency_ms: float = Field(default=50, description="Mean response latency")
+    latency_jitter_ms: float = Field(
+        default=10, description="Standard deviation of the response latency"
+    )
+    failure_rate: float = Field(
+        default=0.0, ge=0.0, le=1.0, description="Share of requests answered with a 500"
+    )
+    tables: int = Field(
+        default=1, description="Tables returned by validate when none are requested"
+    )
+    columns: int = Field(default=20, description="Columns returned per table")
+    api_key: Optional[str] = Field(
+        default=None, description="Expected x-api-key header; not checked when unset"
+    )
+    seed: Optional[int] = Field(default=None, description="Seed for reproducible runs")
+
+
+def _validate_payload(request: dict, config: MockServiceConfig) -> dict:
+    dataset = request.get("dataset") or {}
+    requested_tables = [t.get("name") for t in dataset.get("tables") or []]
+    table_names = requested_tables or [f"table_{t}" for t in range(config.tables)]
+
+    tables = []
+    for table_name, requested in zip(
+        table_names, dataset.get("tables") or [{}] * len(table_names)
+    ):
+        # Return every requested column, padded with generated columns up to `columns`
+        # unless the request is projected to the requested columns
+        column_names = [c.get("name") for c in requested.get("columns") or []]
+        if not (request.get("column_projection") and column_names):
+            column_names += [
+                f"column_{c}" for c in range(max(0, config.columns - len(column_names)))
+            ]
+        tables.append(
+            {
+                "name": table_name,
+                "description": "",
+                "columns": [
+                    {"name": name, "description": "", "datatype": "STRING"}
+                    for name in column_names
+                ],
+            }
+        )
+
+    return {
+        "name": dataset.get("name"),
+        "description": dataset.get("description"),
+        "schema_name": dataset.get("schema_name", "mock"),
+        "tables": tables,
+    }
+
+
+def _artifact(request: dict, stage: str) -> dict:
+    project = request.get("project_name", "project")
+    dataset = (request.get("dataset") or {}).get("name") or "dataset"
+    digest = hashlib.sha512(f"{project}/{dataset}".encode()).hexdigest()
+    return {
+        "file_path": f"lsc/{stage}/{project}/{dataset}/database.duckdb",
+        "hash_value": digest,
+        "total_bytes": 1024 * 1024 + len(digest),
+        "row_count": 1000,
+    }
+
+
+class MockServiceHandler(BaseHTTPRequestHandler):
+    server: "MockServiceServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: dict, etag: Optional[str] = None):
+        content = json.dumps(body).encode("utf-8") if status != 304 else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def do_POST(self):
+        config = self.server.config
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        self.server.record_request()
+
+        time.sleep(self.server.sample_latency())
+
+        if config.api_key and self.headers.get("x-api-key") != config.api_key:
+            self._send_json(
+                401, {"status": "error", "payload": {"detail": "Invalid API key"}}
+            )
+            return
+        if self.server.sample_failure():
+            self._send_json(
+                500, {"status": "error", "payload": {"detail": "Injected failure"}}
+            )
+            return
+
+        try:
+            request = json.loads(body) if body else {}
+        except json.JSONDecodeError:
+            self._send_json(
+                422, {"status": "error", "payload": {"detail": "Invalid JSON"}}
+            )
+            return
+
+        path = self.path.split("?")[0].rstrip("/")
+        if path in VALIDATE_ROUTES:
+            payload = _validate_payload(request, config)
+            # The mock schema never changes, so its fingerprint is the payload digest
+            etag = '"' + hashlib.sha256(json.dumps(payload).encode()).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send_json(304, {}, etag)
+            else:
+                self._send_json(200, {"status": "success", "payload": payload}, etag)
+            return
+        elif path in PACKAGE_ROUTES:
+            payload = {"data_retrieved": [_artifact(request, "staging")]}
+        elif path in PUBLISH_ROUTES:
+            payload = {"data_published": [_artifact(request, "production")]}
+        elif path in APPROVE_ROUTES:
+            payload = {"project_url": request.get("project_url")}
+        else:
+            self._send_json(
+                404, {"status": "error", "payload": {"detail": "Not found"}}
+            )
+            return
+
+        self._send_json(200, {"status": "success", "payload": payload})
+
+
+class MockServiceServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: MockServiceConfig):
+        super().__init__(address, MockServiceHandler)
+        self.config = config
+        self.request_count = 0
+        self._random = random.Random(config.seed)
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record_request(self):
+        with self._lock:
+            self.request_count += 1
+
+    def sample_latency(self) -> float:
+        with self._lock:
+            latency_ms = self._random.gauss(
+                self.config.latency_ms, self.config.latency_jitter_ms
+            )
+        return max(0.0, latency_ms) / 1000
+
+    def sample_failure(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.config.failure_rate
+
+
+def start_mock_services(
+    config: MockServiceConfig, host: str = "127.0.0.1", port: int = 0
+) -> MockServiceServer:
+    """
+    Start the mock services on a background thread.
+
+    Args:
+        config (MockServiceConfig): Latency, failure and payload settings.
+        host (str): Interface to bind. Defaults to localhost.
+        port (int): Port to bind; 0 picks a free port.
+    Returns:
+        MockServiceServer: The running server; call `shutdown()` to stop it.
+    """
+    server = MockServiceServer((host, port), config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
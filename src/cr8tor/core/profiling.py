@@ -0,0 +1,123 @@
+"""Module to time the phases of a cr8tor command.
+
+Each command records spans for its phases (gate check, resource load and write, remote call,
+merge) on a process wide timer. When the command closes its action, the spans are aggregated
+per phase and stored in the action `phases` property, which is rendered on the action entity
+of the RO-Crate. The build and bag save that follow are timed too, but only reach traces:
+
+    with profiling.phase("remote_call"):
+        resp = asyncio.run(api.stage_transfer(access_contract))
+
+    @profiling.timed("merge")
+    def merge_metadata_into_dataset(...): ...
+
+Phases may nest (e.g. resource_write within merge), so phase durations do not add up to
+the action duration. Every span is also recorded as a trace span when tracing is enabled (see
+cr8tor.core.tracing).
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+import cr8tor.core.schema as schemas
+import cr8tor.core.tracing as tracing
+
+
+class PhaseTimer:
+    def __init__(self):
+        """Collects (phase, start time, duration) spans for the current process"""
+        self._spans: List[tuple[str, datetime, float]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str, attributes: Optional[dict] = None):
+        start_time = datetime.now()
+        start = time.perf_counter()
+        try:
+            with tracing.span(f"cr8tor.{name}", **(attributes or {})):
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._spans.append((name, start_time, elapsed))
+
+    def reset(self):
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self) -> List[schemas.PhaseProps]:
+        """
+        Aggregate the recorded spans per phase, in order of first occurrence.
+
+        Returns:
+            List[PhaseProps]: Phase name, number of spans, first start, last end and total duration.
+        """
+        phases: Dict[str, schemas.PhaseProps] = {}
+        with self._lock:
+            spans = list(self._spans)
+
+        for name, start_time, elapsed in spans:
+            end_time = start_time + timedelta(seconds=elapsed)
+            phase = phases.get(name)
+            if phase is None:
+                phases[name] = schemas.PhaseProps(
+                    name=name,
+                    start_time=start_time,
+                    end_time=end_time,
+                    duration_seconds=elapsed,
+                    count=1,
+                )
+                continue
+            phase.start_time = min(phase.start_time, start_time)
+            phase.end_time = max(phase.end_time, end_time)
+            phase.duration_seconds += elapsed
+            phase.count += 1
+
+        for phase in phases.values():
+            phase.duration_seconds = round(phase.duration_seconds, 6)
+        return list(phases.values())
+
+
+timer = PhaseTimer()
+
+
+def phase(name: str, attributes: Optional[dict] = None):
+    """Context manager recording a span for `name` on the process wide timer"""
+    return timer.phase(name, attributes)
+
+
+def timed(name: str, attributes: Optional[Callable[..., dict]] = None) -> Callable:
+    """
+    Decorator recording a span for `name` per call, for both sync and async functions.
+
+    Args:
+        name (str): Phase name.
+        attributes (Optional[Callable[..., dict]]): Called with the arguments of the decorated
+            function to get the trace span attributes.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                span_attributes = attributes(*args, **kwargs) if attributes else None
+                with timer.phase(name, span_attributes):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            span_attributes = attributes(*args, **kwargs) if attributes else None
+            with timer.phase(name, span_attributes):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,117 @@
+"""Module caching service responses between cr8tor invocations.
+
+`cr8tor validate` fetches the full schema metadata of every dataset from the metadata
+service, although source schemas rarely change between runs. Responses are cached on disk,
+keyed on the service endpoint, the source connection (without credentials), the schema name
+and the requested tables, together with the schema fingerprint the service returned (its
+ETag header, or a `schema_fingerprint` field in the payload).
+
+Later requests send the fingerprint in `If-None-Match`; a `304 Not Modified` answer reuses
+the cached payload, so re-validating an unchanged source only costs a metadata round trip.
+Entries older than the TTL (CR8TOR_CACHE_TTL seconds, default 24 hours) are evicted and
+fetched again in full. The cache lives under `get_cache_dir()/responses` and is disabled
+with CR8TOR_NO_CACHE=true or the `--no-cache` option of the commands using it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from cr8tor.utils import get_cache_dir, log
+
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+class CachedResponse(BaseModel):
+    key: str
+    fingerprint: Optional[str] = None
+    stored_at: float
+    payload: Any
+
+
+def cache_enabled() -> bool:
+    return os.getenv("CR8TOR_NO_CACHE", "false").lower() != "true"
+
+
+def make_cache_key(**parts) -> str:
+    """Stable key for the JSON serialisable request `parts`"""
+    content = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, cache_dir: Path = None, ttl_seconds: float = None):
+        """On-disk cache of service payloads with TTL based eviction"""
+        self.cache_dir = Path(cache_dir or get_cache_dir().joinpath("responses"))
+        if ttl_seconds is None:
+            ttl_seconds = float(os.getenv("CR8TOR_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        self.ttl_seconds = ttl_seconds
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir.joinpath(f"{key}.json")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the entry for `key`, evicting it when it has expired or is unreadable"""
+        entry_path = self._entry_path(key)
+        try:
+            entry = CachedResponse.model_validate_json(entry_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.debug(f"Discarding unreadable cache entry {entry_path}: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        if time.time() - entry.stored_at > self.ttl_seconds:
+            entry_path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def put(self, key: str, payload: Any, fingerprint: Optional[str]):
+        """Store `payload` atomically so concurrent commands never read a partial entry"""
+        entry = CachedResponse(
+            key=key, fingerprint=fingerprint, stored_at=time.time(), payload=payload
+        )
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(entry.model_dump_json().encode("utf-8"))
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException as e:
+            if tmp_path is not None:
+                Path(tmp_path).unlink(missing_ok=True)
+            if not isinstance(e, OSError):
+                raise
+            # The cache is an optimisation; a read-only home directory must not fail a command
+            log.debug(f"Could not write cache entry {key}: {e}")
+            return
+        self.prune()
+
+    def touch(self, key: str, entry: CachedResponse):
+        """Restart the TTL of an entry the service confirmed as unchanged"""
+        self.put(key, entry.payload, entry.fingerprint)
+
+    def prune(self) -> int:
+        """Remove every expired entry. Returns the number of entries removed."""
+        removed = 0
+        now = time.time()
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                if now - entry_path.stat().st_mtime > self.ttl_seconds:
+                    entry_path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
+
+    def clear(self):
+        for entry_path in self.cache_dir.glob("*.json"):
+            entry_path.unlink(missing_ok=True)
@@ -2,9 +2,20 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterable, Iterator, Sequence
 from enum import StrEnum, IntEnum
-from typing import List, Annotated, Literal
-from pydantic import BaseModel, Field, HttpUrl, field_validator, Tag, model_validator
+from typing import Any, List, Annotated, Literal
+from pydantic import (
+    BaseModel,
+    Field,
+    GetCoreSchemaHandler,
+    HttpUrl,
+    field_validator,
+    Tag,
+    model_validator,
+)
+from pydantic_core import core_schema
 from datetime import datetime
 from typing import Optional, Union
 
@@ -92,6 +103,20 @@ class ResultItem(BaseModel):
         extra = "allow"
 
 
+class PhaseProps(BaseModel):
+    name: str = Field(
+        description="Phase of the action (e.g. gate_check, remote_call, build)"
+    )
+    start_time: datetime = Field(
+        description="Start time of the first span of the phase"
+    )
+    end_time: datetime = Field(description="End time of the last span of the phase")
+    duration_seconds: float = Field(
+        description="Total time spent in the phase across all spans"
+    )
+    count: int = Field(default=1, description="Number of spans recorded for the phase")
+
+
 class ActionProps(BaseRoCrateEntityProperties, use_enum_values=True):
     type: Literal["Action"] = Field(default="Action", alias="@type")
     name: str = Field(description="Action name")
@@ -113,6 +138,10 @@ class ActionProps(BaseRoCrateEntityProperties, use_enum_values=True):
         default=None,
         description="Instrument performing the execution of the action (e.g. cr8tor, specific TRE service)",
     )
+    phases: List[PhaseProps] = Field(
+        default=[],
+        description="Time spent per phase of the command (e.g. remote calls, resource writes, build)",
+    )
 
     @field_validator("action_status", mode="before")
     @classmethod
@@ -222,9 +251,136 @@ class ColumnMetadata(BaseModel):
     description: Optional[str] = None
 
 
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+
+class ColumnSet(Sequence):
+    """
+    Compact, columnar storage for the columns of a table.
+
+    Very wide schemas (100k+ columns across a catalog) would otherwise hold one
+    ColumnMetadata model, with its own instance dict, per column. ColumnSet keeps the
+    column names, datatypes and descriptions as parallel tuples of interned strings,
+    so repeated values ("STRING", "") are stored once. It validates from and
+    serialises to the same list-of-columns shape as List[ColumnMetadata], and indexing
+    or iterating yields ColumnMetadata objects one at a time for code that expects them.
+    Bulk operations should use `names`, `datatypes`, `descriptions` or `rows()` directly.
+    """
+
+    __slots__ = ("names", "datatypes", "descriptions")
+
+    def __init__(
+        self,
+        names: Iterable[str] = (),
+        datatypes: Iterable[Optional[str]] = (),
+        descriptions: Iterable[Optional[str]] = (),
+    ):
+        self.names = tuple(map(_intern, names))
+        self.datatypes = tuple(map(_intern, datatypes))
+        self.descriptions = tuple(map(_intern, descriptions))
+        if not len(self.names) == len(self.datatypes) == len(self.descriptions):
+            raise ValueError("Column names, datatypes and descriptions must align")
+
+    @classmethod
+    def from_columns(cls, columns: Iterable[dict | ColumnMetadata]) -> ColumnSet:
+        rows = [
+            (column["name"], column.get("datatype"), column.get("description"))
+            if isinstance(column, dict)
+            else (column.name, column.datatype, column.description)
+            for column in columns
+        ]
+        return cls(*zip(*rows)) if rows else cls()
+
+    def rows(self) -> Iterator[tuple[str, Optional[str], Optional[str]]]:
+        """Iterate (name, datatype, description) tuples without building column objects."""
+        return zip(self.names, self.datatypes, self.descriptions)
+
+    def to_list(self) -> List[dict]:
+        return [
+            {"name": name, "datatype": datatype, "description": description}
+            for name, datatype, description in self.rows()
+        ]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ColumnSet(
+                self.names[index], self.datatypes[index], self.descriptions[index]
+            )
+        return ColumnMetadata.model_construct(
+            name=self.names[index],
+            datatype=self.datatypes[index],
+            description=self.descriptions[index],
+        )
+
+    def __iter__(self) -> Iterator[ColumnMetadata]:
+        for name, datatype, description in self.rows():
+            yield ColumnMetadata.model_construct(
+                name=name, datatype=datatype, description=description
+            )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ColumnSet):
+            return NotImplemented
+        return (self.names, self.datatypes, self.descriptions) == (
+            other.names,
+            other.datatypes,
+            other.descriptions,
+        )
+
+    def __repr__(self) -> str:
+        return f"ColumnSet({len(self)} columns)"
+
+    def __copy__(self) -> ColumnSet:
+        column_set = ColumnSet.__new__(ColumnSet)
+        column_set.names = self.names
+        column_set.datatypes = self.datatypes
+        column_set.descriptions = self.descriptions
+        return column_set
+
+    def __deepcopy__(self, memo) -> ColumnSet:
+        # The columns are immutable tuples of strings, so a deep copy can share them
+        return self.__copy__()
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Columns are validated as plain typed dicts (not models) and packed straight
+        # into the columnar form, so validation never keeps one object per column.
+        optional_str = core_schema.nullable_schema(core_schema.str_schema())
+        column_schema = core_schema.typed_dict_schema(
+            {
+                "name": core_schema.typed_dict_field(core_schema.str_schema()),
+                "datatype": core_schema.typed_dict_field(optional_str, required=False),
+                "description": core_schema.typed_dict_field(
+                    optional_str, required=False
+                ),
+            }
+        )
+        from_dicts = core_schema.no_info_after_validator_function(
+            cls.from_columns, core_schema.list_schema(column_schema)
+        )
+        from_models = core_schema.no_info_after_validator_function(
+            cls.from_columns, handler.generate_schema(List[ColumnMetadata])
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_dicts,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_dicts, from_models]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda columns: columns.to_list()
+            ),
+        )
+
+
 class TableMetadata(BaseModel):
     name: str
-    columns: Optional[List[ColumnMetadata]] = None
+    columns: Optional[ColumnSet] = None
     description: Optional[str] = None
 
 
@@ -363,6 +519,10 @@ class DataContractBaseProjectRequest(BaseModel):
 
 class DataContractPublishRequest(DataContractBaseProjectRequest):
     destination: Destination = Field(description="Target destination configuration")
+    dataset: Optional[DatasetMetadata] = Field(
+        default=None,
+        description="Dataset to publish. When omitted, all staged data of the project is published",
+    )
 
 
 class ExtractConfig(BaseModel):
@@ -396,7 +556,10 @@ class DataContractTransferRequest(DataContractSourceAccessRequest):
 
 
 class DataContractValidateRequest(DataContractTransferRequest):
-    pass
+    column_projection: bool = Field(
+        default=False,
+        description="Only return the requested tables and columns. When false, every column of the requested tables is returned",
+    )
 
 
 #
@@ -406,10 +569,22 @@ class DataContractValidateRequest(DataContractTransferRequest):
 
 class StageTransferLocationFilestore(BaseModel):
     file_path: str
+    hash_value: Optional[str] = Field(
+        default=None, description="SHA-512 hex digest of the staged file"
+    )
+    total_bytes: Optional[int] = Field(
+        default=None, description="Size of the staged file in bytes"
+    )
+    row_count: Optional[int] = Field(
+        default=None, description="Total number of rows staged across all tables"
+    )
 
 
 class StageTransferLocationSqlDatabase(BaseModel):
     table_name: str
+    row_count: Optional[int] = Field(
+        default=None, description="Number of rows staged in the table"
+    )
 
 
 class StageTransferPayload(BaseModel):
@@ -441,6 +616,9 @@ class PublishLocationFilestore(BaseModel):
     file_path: str
     hash_value: str
     total_bytes: int
+    row_count: Optional[int] = Field(
+        default=None, description="Total number of rows published across all tables"
+    )
 
 
 class PublishLocationSqlDatabase(BaseModel):
@@ -0,0 +1,149 @@
+"""Module caching cookiecutter templates between cr8tor invocations.
+
+`cr8tor initiate` is usually given the GitHub URL of the cr8-cookiecutter template, which
+cookiecutter clones (or downloads and unpacks) on every run. Remote templates are instead
+checked out once per (URL, checkout revision) under `get_cache_dir()/templates` and reused
+without network access. Pin a tag or commit with `-chk` for reproducible projects; a branch
+(or the default branch) is only updated when the cache is refreshed explicitly, e.g. with
+`cr8tor initiate --refresh-template` or `cr8tor prewarm-template --refresh`.
+
+Local template directories are used in place. Set CR8TOR_NO_CACHE=true to bypass the cache.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+import git
+from cookiecutter.config import get_user_config
+from cookiecutter.repository import determine_repo_dir
+
+from cr8tor.core.resourceops import resource_lock
+from cr8tor.core.response_cache import cache_enabled, make_cache_key
+from cr8tor.utils import get_cache_dir, log
+
+TEMPLATE_INFO_FILE = ".cr8tor-template.json"
+
+
+def template_cache_dir() -> Path:
+    return get_cache_dir().joinpath("templates")
+
+
+def is_local_template(template_path: str) -> bool:
+    return Path(template_path).expanduser().is_dir()
+
+
+def cached_template_path(template_path: str, checkout: Optional[str]) -> Path:
+    key = make_cache_key(template=template_path, checkout=checkout)
+    return template_cache_dir().joinpath(key[:32])
+
+
+def _resolved_revision(template_dir: Path) -> Optional[str]:
+    try:
+        return git.Repo(template_dir).head.commit.hexsha
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError, ValueError):
+        return None
+
+
+def read_template_info(template_dir: Path) -> dict:
+    info_path = Path(template_dir).joinpath(TEMPLATE_INFO_FILE)
+    if not info_path.exists():
+        return {}
+    return json.loads(info_path.read_text(encoding="utf-8"))
+
+
+def fetch_template(template_path: str, checkout: Optional[str]) -> Path:
+    """
+    Clone or unpack a remote template into the cache, replacing any cached copy.
+
+    The template is fetched into a staging directory and renamed into place while holding
+    the lock of its cache entry, so concurrent initiations never see a partial or missing
+    checkout, and concurrent fetches of the same template do not interleave their swaps.
+
+    Returns:
+        Path: The cached template directory.
+    """
+    target = cached_template_path(template_path, checkout)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    with (
+        resource_lock(target),
+        tempfile.TemporaryDirectory(dir=target.parent, prefix=".fetch-") as staging,
+    ):
+        clone_dir = Path(staging).joinpath("clone")
+        clone_dir.mkdir()
+        repo_dir, cleanup = determine_repo_dir(
+            template=template_path,
+            abbreviations=get_user_config()["abbreviations"],
+            clone_to_dir=clone_dir,
+            checkout=checkout,
+            no_input=True,
+        )
+        fetched = Path(staging).joinpath("template")
+        # Zip templates are unpacked outside clone_to_dir
+        shutil.copytree(repo_dir, fetched, symlinks=True)
+        if cleanup:
+            shutil.rmtree(repo_dir, ignore_errors=True)
+
+        info = {
+            "template": template_path,
+            "checkout": checkout,
+            "revision": _resolved_revision(fetched),
+            "fetched_at": time.time(),
+        }
+        fetched.joinpath(TEMPLATE_INFO_FILE).write_text(
+            json.dumps(info, indent=2), encoding="utf-8"
+        )
+
+        previous = None
+        if target.exists():
+            previous = Path(staging).joinpath("previous")
+            os.replace(target, previous)
+        os.replace(fetched, target)
+
+    log.info(
+        f"Cached template {template_path}"
+        f"{f' at {checkout}' if checkout else ''} ({info['revision'] or 'no revision'})"
+    )
+    return target
+
+
+def resolve_template(
+    template_path: str, checkout: Optional[str] = None, refresh: bool = False
+) -> tuple[str, Optional[str]]:
+    """
+    Return a local directory to render `template_path` from, and the checkout cookiecutter
+    should still apply to it.
+
+    Remote templates come from the cache, fetched on first use or when `refresh` is True;
+    the cached copy is already at `checkout`. Local templates, and every template when
+    caching is disabled, are returned unchanged with their checkout.
+    """
+    if is_local_template(template_path) or not cache_enabled():
+        return template_path, checkout
+
+    target = cached_template_path(template_path, checkout)
+    # Check the cache entry under its lock: a concurrent fetch of the same template is then
+    # either complete or not started, and a missing template is fetched only once
+    with resource_lock(target):
+        if not target.exists():
+            target = fetch_template(template_path, checkout)
+        elif refresh:
+            try:
+                target = fetch_template(template_path, checkout)
+            except Exception as e:
+                # The cached copy is only replaced once a fetch succeeds, so it is still usable
+                log.warning(
+                    f"Could not refresh template {template_path}, using the cached copy: {e}"
+                )
+        else:
+            info = read_template_info(target)
+            log.info(
+                f"Using cached template {template_path}"
+                f"{f' at {checkout}' if checkout else ''} ({info.get('revision') or 'no revision'})"
+            )
+    return str(target), None
@@ -0,0 +1,282 @@
+"""Module for optional, OpenTelemetry compatible tracing of cr8tor commands.
+
+Tracing is off unless one of the following environment variables is set:
+
+- `CR8TOR_TRACE_FILE`: append finished spans to this file as OTLP/JSON, one export request
+  per line (readable by the OpenTelemetry Collector `otlpjsonfile` receiver).
+- `CR8TOR_OTLP_ENDPOINT`: POST finished spans as OTLP/JSON to `<endpoint>/v1/traces`
+  (e.g. http://localhost:4318 for a local collector or Jaeger).
+
+Each command, API request, resource read/write, merge, build and bag save is a span. API
+requests carry the W3C `traceparent` header (and `x-correlation-id` with the trace id), so
+spans of the approval, metadata and publish services join the same trace. Set `TRACEPARENT`
+to continue a trace started by the caller (e.g. an orchestration workflow).
+"""
+
+import atexit
+import contextvars
+import json
+import os
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from cr8tor.utils import log
+
+TRACE_FILE_ENV = "CR8TOR_TRACE_FILE"
+OTLP_ENDPOINT_ENV = "CR8TOR_OTLP_ENDPOINT"
+TRACEPARENT_ENV = "TRACEPARENT"
+SERVICE_NAME = "cr8tor"
+
+# OTLP span kinds and status codes
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_CLIENT = 3
+STATUS_CODE_OK = 1
+STATUS_CODE_ERROR = 2
+
+
+class Span:
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "name",
+        "kind",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status_code",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_span_id: Optional[str],
+        kind: int,
+        attributes: Dict[str, Any],
+    ):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent_span_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = dict(attributes)
+        self.status_code = 0
+        self.status_message = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def update_name(self, name: str):
+        self.name = name
+
+    def set_error(self, message: str):
+        self.status_code = STATUS_CODE_ERROR
+        self.status_message = message
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status_code},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    traceparent = None
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def update_name(self, name: str):
+        pass
+
+    def set_error(self, message: str):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        otlp_value = {"boolValue": value}
+    elif isinstance(value, int):
+        otlp_value = {"intValue": str(value)}
+    elif isinstance(value, float):
+        otlp_value = {"doubleValue": value}
+    else:
+        otlp_value = {"stringValue": str(value)}
+    return {"key": key, "value": otlp_value}
+
+
+def _parse_traceparent(
+    traceparent: Optional[str],
+) -> tuple[Optional[str], Optional[str]]:
+    parts = (traceparent or "").strip().split("-")
+    if len(parts) == 4 and len(parts[1]) == 32 and len(parts[2]) == 16:
+        return parts[1], parts[2]
+    return None, None
+
+
+class Tracer:
+    def __init__(self):
+        """Process wide tracer; spans are buffered and exported on flush or at exit"""
+        self.trace_file = None
+        self.otlp_endpoint = None
+        self.enabled = False
+        self.trace_id = None
+        self._remote_parent_span_id = None
+        self._configured = False
+
+        self._current_span: contextvars.ContextVar[Optional[Span]] = (
+            contextvars.ContextVar("cr8tor_current_span", default=None)
+        )
+        self._finished: List[Span] = []
+        self._lock = threading.Lock()
+
+    def configure(self):
+        """
+        Read the tracing environment variables. Called lazily on first use, so values
+        loaded from a .env file after import are picked up.
+        """
+        with self._lock:
+            if self._configured:
+                return
+            self.trace_file = os.getenv(TRACE_FILE_ENV)
+            self.otlp_endpoint = os.getenv(OTLP_ENDPOINT_ENV)
+            self.enabled = bool(self.trace_file or self.otlp_endpoint)
+
+            trace_id, parent_span_id = _parse_traceparent(os.getenv(TRACEPARENT_ENV))
+            self.trace_id = trace_id or secrets.token_hex(16)
+            self._remote_parent_span_id = parent_span_id
+            self._configured = True
+
+        if self.enabled:
+            atexit.register(self.flush)
+
+    @property
+    def current_span(self):
+        return self._current_span.get() or _NOOP_SPAN
+
+    @contextmanager
+    def span(self, name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+        """
+        Record a span around the enclosed block, as a child of the current span.
+
+        Exceptions mark the span as failed, except exit exceptions with a zero exit code.
+        """
+        if not self._configured:
+            self.configure()
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = self._current_span.get()
+        span = Span(
+            name=name,
+            trace_id=self.trace_id,
+            parent_span_id=parent.span_id if parent else self._remote_parent_span_id,
+            kind=kind,
+            attributes=attributes,
+        )
+        token = self._current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            exit_code = getattr(e, "exit_code", getattr(e, "code", 1))
+            if exit_code:
+                span.set_error(str(e) or f"{type(e).__name__} ({exit_code})")
+            raise
+        finally:
+            span.end_ns = time.time_ns()
+            self._current_span.reset(token)
+            with self._lock:
+                self._finished.append(span)
+
+    def propagation_headers(self) -> Dict[str, str]:
+        """Headers to correlate a downstream request with the current span"""
+        span = self._current_span.get()
+        if not self.enabled or span is None:
+            return {}
+        return {"traceparent": span.traceparent, "x-correlation-id": span.trace_id}
+
+    def flush(self):
+        """Export all finished spans to the configured file and/or OTLP endpoint"""
+        with self._lock:
+            spans, self._finished = self._finished, []
+        if not spans:
+            return
+
+        payload = json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": {
+                            "attributes": [
+                                _otlp_attribute("service.name", SERVICE_NAME)
+                            ]
+                        },
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": "cr8tor"},
+                                "spans": [span.to_otlp() for span in spans],
+                            }
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        )
+
+        if self.trace_file:
+            try:
+                trace_path = Path(self.trace_file)
+                trace_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(trace_path, "a", encoding="utf-8") as f:
+                    f.write(payload + "\n")
+            except OSError as e:
+                log.warning(f"Unable to write traces to {self.trace_file}: {e}")
+
+        if self.otlp_endpoint:
+            request = urllib.request.Request(
+                f"{self.otlp_endpoint.rstrip('/')}/v1/traces",
+                data=payload.encode("utf-8"),
+                headers={"Content-Type": "application/json"},
+                method="POST",
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=5):
+                    pass
+            except OSError as e:
+                log.warning(f"Unable to export traces to {self.otlp_endpoint}: {e}")
+
+
+tracer = Tracer()
+
+
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes):
+    """Context manager recording a span on the process wide tracer"""
+    return tracer.span(name, kind, **attributes)
@@ -5,3 +5,12 @@ class DirectoryNotFoundError(Exception):
         self.directory = directory
         self.message = f"{message}: {directory}"
         super().__init__(self.message)
+
+
+class ContextNotAvailableError(Exception):
+    """Exception raised when a JSON-LD context is neither bundled nor cached while offline."""
+
+    def __init__(self, url, message="JSON-LD context not available offline"):
+        self.url = url
+        self.message = f"{message}: {url}"
+        super().__init__(self.message)
@@ -3,16 +3,50 @@ from pathlib import Path
 from typing import Annotated
 from dotenv import load_dotenv, find_dotenv
 import typer
+import cr8tor.core.tracing as tracing
 from rocrate.rocrate import ROCrate
 
 # from cr8tor.cli.create import app as cli_commands
 from cr8tor.cli import app as cli
 from cr8tor.cli.display import print_bagit, print_crate
 from cr8tor.cli.initiate import app as cli_initiate
+from cr8tor.cli.prewarm_template import app as cli_prewarm_template
 
 app = typer.Typer()
 app.add_typer(cli)
 app.add_typer(cli_initiate)
+app.add_typer(cli_prewarm_template)
+
+
+@app.callback()
+def main(ctx: typer.Context):
+    """
+    cr8tor CLI. Set CR8TOR_TRACE_FILE or CR8TOR_OTLP_ENDPOINT to trace commands.
+    """
+    if not ctx.invoked_subcommand:
+        return
+    name = f"cr8tor {ctx.invoked_subcommand}"
+    if isinstance(ctx.obj, tracing.Span):
+        ctx.obj.update_name(name)
+        ctx.obj.set_attribute("cli.command", ctx.invoked_subcommand)
+    else:
+        # Invoked without run() (e.g. by a test runner). Click closes this span without
+        # the exception, so it cannot record a failing command.
+        ctx.with_resource(tracing.span(name, **{"cli.command": ctx.invoked_subcommand}))
+
+
+def run():
+    """
+    Console script entry point. Runs the CLI in a root span that records the exit code, and
+    the error of a failing command, so failures can be correlated across services.
+    """
+    with tracing.span("cr8tor") as root_span:
+        try:
+            app(obj=root_span if isinstance(root_span, tracing.Span) else None)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+            root_span.set_attribute("cli.exit_code", exit_code)
+            raise
 
 
 @app.command(name="read")
@@ -31,4 +65,4 @@ if __name__ == "__main__":
     debugpy.wait_for_client()
 
     load_dotenv(find_dotenv())
-    app()
+    run()
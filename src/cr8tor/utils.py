@@ -4,6 +4,7 @@ import logging
 import os
 import uuid
 from hashlib import md5
+from pathlib import Path
 from typing import Annotated
 
 from pydantic import HttpUrl
@@ -41,6 +42,42 @@ def make_uuid(
     return uuid.UUID(hex=hx).urn
 
 
+def get_cache_dir() -> Path:
+    """
+    Directory for cr8tor caches shared between invocations.
+
+    Returns:
+        Path: CR8TOR_CACHE_DIR when set, otherwise ~/.cache/cr8tor (or under XDG_CACHE_HOME).
+    """
+    cache_dir = os.getenv("CR8TOR_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir).expanduser()
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    base_dir = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+    return base_dir / "cr8tor"
+
+
+def _read_umask() -> int:
+    # The umask can only be read by setting it, which is process wide. Read it once, at
+    # import, rather than racing with the thread pools that write files later.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+DEFAULT_FILE_MODE = 0o666 & ~_read_umask()
+
+
+def set_default_file_mode(path: Path | str) -> None:
+    """
+    Give a file the permissions `open()` would have created it with (0666 less the umask).
+
+    Files written with `tempfile.mkstemp` and renamed into place are otherwise only
+    readable by their owner.
+    """
+    os.chmod(path, DEFAULT_FILE_MODE)
+
+
 # def get_config(f: Path) -> dict:
 #     """
 #     Reads a TOML configuration file and returns its contents as a dictionary.
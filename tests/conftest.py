@@ -0,0 +1,13 @@
+import pytest
+
+import cr8tor.core.resourceops as project_resources
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep every on-disk and in-process cache of a test away from the user's"""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("CR8TOR_CACHE_DIR", str(cache_dir))
+    project_resources.invalidate_resource_cache()
+    yield cache_dir
+    project_resources.invalidate_resource_cache()
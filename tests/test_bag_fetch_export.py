@@ -0,0 +1,97 @@
+import hashlib
+import tarfile
+import zipfile
+from types import SimpleNamespace
+
+import bagit
+import pytest
+
+import cr8tor.core.bag_export as bag_export
+import cr8tor.core.bag_fetch as bag_fetch
+
+ARTIFACT = b"duckdb" * 20000
+
+
+@pytest.fixture
+def bag_with_fetch_file(tmp_path):
+    """A bag whose staged and published artifact are both listed in fetch.txt"""
+    store = tmp_path / "store"
+    store.joinpath("out").mkdir(parents=True)
+    store.joinpath("out", "db.duckdb").write_bytes(ARTIFACT)
+
+    bag_dir = tmp_path / "bag"
+    bag_dir.mkdir()
+    bag_dir.joinpath("ro-crate-metadata.json").write_text("{}")
+    bag = bagit.make_bag(str(bag_dir), checksums=["sha512"])
+
+    base_url = bag_fetch.fetch_base_url({"fetch": {"base_url": f"file://{store}/"}})
+    location = {
+        "file_path": "out/db.duckdb",
+        "hash_value": hashlib.sha512(ARTIFACT).hexdigest(),
+        "total_bytes": len(ARTIFACT),
+    }
+    props = SimpleNamespace(staging_path=location, publish_path=location)
+    entries = bag_fetch.artifact_entries("dataset_1", props, base_url)
+    bag_fetch.write_fetch_file(bag, entries)
+    return bag_dir, entries
+
+
+def test_fetch_url():
+    assert bag_fetch.fetch_url("file:///mnt/tre/") == "file://localhost/mnt/tre/"
+    assert (
+        bag_fetch.fetch_url("https://tre.example.org/a") == "https://tre.example.org/a"
+    )
+    with pytest.raises(ValueError):
+        bag_fetch.fetch_url("/mnt/tre/")
+    with pytest.raises(ValueError):
+        bag_fetch.fetch_url("mnt/tre/")
+
+
+def test_fetch_then_export_round_trip(bag_with_fetch_file, tmp_path):
+    bag_dir, entries = bag_with_fetch_file
+    assert all(entry.url.startswith("file://localhost/") for entry in entries)
+
+    # The bag is complete from its Payload-Oxum before its artifacts are fetched
+    bag_export.export_bag(bag_dir, tmp_path / "before.zip", "zip")
+
+    results = bag_fetch.fetch_bag(bag_dir)
+    assert sorted(result.status.split()[0] for result in results) == [
+        "fetched",
+        "linked",
+    ]
+    staged, published = (bag_dir.joinpath(entry.path) for entry in entries)
+    assert staged.samefile(published)
+    assert {r.status for r in bag_fetch.fetch_bag(bag_dir)} == {"present"}
+    bagit.Bag(str(bag_dir)).validate()
+
+    for archive_format in bag_export.ARCHIVE_FORMATS:
+        output = tmp_path / f"bag.{archive_format}"
+        digest, size, n_files = bag_export.export_bag(
+            bag_dir, output, archive_format, verify=True
+        )
+
+        assert size == output.stat().st_size
+        assert digest == hashlib.sha256(output.read_bytes()).hexdigest()
+        assert output.with_name(output.name + ".sha256").read_text() == (
+            f"{digest}  {output.name}\n"
+        )
+        assert n_files == len(bag_export.bag_files(bag_dir))
+
+    with zipfile.ZipFile(tmp_path / "bag.zip") as archive:
+        assert archive.read(f"bag/{entries[1].path}") == ARTIFACT
+    with tarfile.open(tmp_path / "bag.tar.gz") as archive:
+        members = [m for m in archive.getmembers() if m.name.endswith("db.duckdb")]
+        assert [m.isreg() for m in members] == [True, True]
+        assert archive.extractfile(members[0]).read() == ARTIFACT
+
+
+def test_verified_export_rejects_corrupted_payload(bag_with_fetch_file, tmp_path):
+    bag_dir, entries = bag_with_fetch_file
+    bag_fetch.fetch_bag(bag_dir)
+    path = bag_dir.joinpath(entries[0].path)
+    path.write_bytes(ARTIFACT[:-1] + b"x")
+
+    output = tmp_path / "bag.zip"
+    with pytest.raises(bagit.BagValidationError):
+        bag_export.export_bag(bag_dir, output, "zip", verify=True)
+    assert list(tmp_path.glob("bag.zip*")) == []
@@ -0,0 +1,38 @@
+import re
+
+import pytest
+from typer.testing import CliRunner
+
+import cr8tor.cli.bench as bench
+from cr8tor.main import app
+
+
+@pytest.fixture(autouse=True)
+def restore_service_env(monkeypatch):
+    # bench points the API client at its mock services through the environment
+    for name in ("APPROVALS_HOST", "APPROVALS_PORT", "APPROVALS_API_TOKEN"):
+        monkeypatch.setenv(name, "unset")
+    monkeypatch.setenv("USE_TEST_DATA", "true")
+
+
+@pytest.mark.parametrize("endpoint", list(bench.BENCH_ENDPOINTS))
+def test_bench_endpoint_calls_succeed(endpoint, tmp_path):
+    result = CliRunner().invoke(
+        app,
+        [
+            "bench",
+            "-n", "6",
+            "-c", "2",
+            "--latency-ms", "1",
+            "--jitter-ms", "0",
+            "--tables", "2",
+            "--columns", "3",
+            "-e", endpoint,
+        ],
+    )  # fmt: skip
+
+    assert result.exit_code == 0, result.output
+    assert re.search(r"Succeeded\s+│\s+6\s", result.output)
+    assert re.search(r"Failed\s+│\s+0\s", result.output)
+    # Validate calls bypass the response cache, so every call reaches the service
+    assert not tmp_path.joinpath("cache", "responses").exists()
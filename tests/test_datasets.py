@@ -0,0 +1,97 @@
+import pytest
+import toml
+
+import cr8tor.cli.validate as validate
+import cr8tor.core.datasets as datasets
+import cr8tor.core.resourceops as project_resources
+import cr8tor.core.schema as schemas
+
+
+def make_sharded_dataset(resources_dir):
+    dataset_dir = resources_dir / "metadata" / "dataset_1"
+    dataset_dir.joinpath("tables").mkdir(parents=True)
+    dataset_dir.joinpath("manifest.toml").write_text(
+        toml.dumps(
+            {
+                "name": "dataset_1",
+                "schema_name": "bench",
+                "table_files": ["tables/person.toml"],
+            }
+        )
+    )
+    dataset_dir.joinpath("tables", "person.toml").write_text(
+        toml.dumps({"name": "person", "columns": [{"name": "id"}]})
+    )
+    return dataset_dir
+
+
+def test_find_datasets_in_both_layouts(tmp_path):
+    make_sharded_dataset(tmp_path)
+    tmp_path.joinpath("metadata", "dataset_2.toml").write_text(
+        toml.dumps({"name": "dataset_2", "schema_name": "bench", "tables": []})
+    )
+
+    found = datasets.find_datasets(tmp_path)
+
+    assert [d.path.name for d in found] == ["dataset_1", "dataset_2.toml"]
+    assert [d.is_sharded for d in found] == [True, False]
+    assert found[0].read_manifest() == {"name": "dataset_1", "schema_name": "bench"}
+
+
+def test_merge_into_sharded_dataset_rewrites_only_returned_tables(tmp_path):
+    dataset_dir = make_sharded_dataset(tmp_path)
+    metadata = schemas.DatasetMetadata(
+        name="dataset_1",
+        schema_name="bench",
+        description="Merged",
+        tables=[
+            {
+                "name": "person",
+                "columns": [
+                    {"name": "id", "datatype": "LONG", "description": "Identifier"},
+                    {"name": "age", "datatype": "INT"},
+                ],
+            },
+            {"name": "visit", "columns": [{"name": "visit_id", "datatype": "LONG"}]},
+        ],
+    )
+
+    validate.merge_metadata_into_dataset(dataset_dir, metadata)
+
+    manifest = project_resources.read_resource(dataset_dir / "manifest.toml")
+    assert manifest["description"] == "Merged"
+    assert manifest["table_files"] == ["tables/person.toml", "tables/visit.toml"]
+
+    dataset = datasets.DatasetResource(dataset_dir).read_dataset_model()
+    person, visit = dataset.tables
+    assert person.columns.names == ("id", "age")
+    assert person.columns[0].description == "Identifier"
+    assert visit.columns.names == ("visit_id",)
+
+
+@pytest.mark.parametrize(
+    "table_name", ["../../governance/project", "..", "a\\b", "/etc/passwd", ""]
+)
+def test_merge_rejects_table_names_outside_the_tables_dir(tmp_path, table_name):
+    dataset_dir = make_sharded_dataset(tmp_path)
+    manifest = dataset_dir.joinpath("manifest.toml").read_text()
+    person = dataset_dir.joinpath("tables", "person.toml").read_text()
+    metadata = schemas.DatasetMetadata(
+        name="dataset_1",
+        schema_name="bench",
+        description="Merged",
+        tables=[
+            {"name": "person", "columns": [{"name": "id", "datatype": "LONG"}]},
+            {"name": table_name, "columns": [{"name": "id"}]},
+        ],
+    )
+
+    with pytest.raises(ValueError):
+        validate.merge_metadata_into_dataset(dataset_dir, metadata)
+
+    assert dataset_dir.joinpath("manifest.toml").read_text() == manifest
+    assert dataset_dir.joinpath("tables", "person.toml").read_text() == person
+    assert sorted(p.name for p in tmp_path.rglob("*.toml")) == [
+        "manifest.toml",
+        "person.toml",
+    ]
@@ -0,0 +1,51 @@
+import pytest
+
+import cr8tor.core.integrity as integrity
+
+
+@pytest.fixture
+def storage_root(tmp_path):
+    root = tmp_path / "storage"
+    root.joinpath("out").mkdir(parents=True)
+    root.joinpath("out", "db.duckdb").write_bytes(b"duckdb" * 1000)
+    tmp_path.joinpath("secret").write_bytes(b"not published")
+    return root
+
+
+def location(file_path: str, path) -> dict:
+    hash_value, total_bytes = integrity.file_digest(path)
+    return {
+        "file_path": file_path,
+        "hash_value": hash_value,
+        "total_bytes": total_bytes,
+    }
+
+
+@pytest.mark.parametrize("file_path", ["out/db.duckdb", "/out/db.duckdb"])
+def test_verify_local_copy_under_the_storage_root(storage_root, file_path):
+    published = location(file_path, storage_root / "out" / "db.duckdb")
+
+    assert integrity.verify_local_copy(published, storage_root) == []
+
+    published["total_bytes"] += 1
+    assert len(integrity.verify_local_copy(published, storage_root)) == 1
+
+
+@pytest.mark.parametrize("file_path", ["../secret", "out/../../secret"])
+def test_verify_local_copy_never_reads_outside_the_storage_root(
+    storage_root, file_path
+):
+    published = location(file_path, storage_root.parent / "secret")
+
+    (mismatch,) = integrity.verify_local_copy(published, storage_root)
+
+    assert "outside the storage root" in mismatch
+
+
+def test_verify_local_copy_roots_absolute_paths(storage_root):
+    secret = storage_root.parent / "secret"
+    published = location(str(secret), secret)
+
+    (mismatch,) = integrity.verify_local_copy(published, storage_root)
+
+    assert mismatch.startswith(f"file_path {storage_root}")
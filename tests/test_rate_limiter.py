@@ -0,0 +1,70 @@
+import time
+
+import requests
+
+import cr8tor.core.gh_rest_api_client as gh
+
+
+def make_response(status_code: int, headers: dict, text: str = "") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = text.encode()
+    return response
+
+
+def test_rate_limit_delay():
+    assert gh.rate_limit_delay(make_response(200, {})) is None
+    assert gh.rate_limit_delay(make_response(429, {"Retry-After": "3"})) == 3.0
+    assert gh.rate_limit_delay(make_response(403, {}, "Secondary rate limit")) == 60.0
+    assert gh.rate_limit_delay(make_response(403, {}, "Forbidden")) is None
+
+    reset = time.time() + 30
+    delay = gh.rate_limit_delay(
+        make_response(
+            403, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)}
+        )
+    )
+    assert 25 < delay <= 30
+
+
+def test_budget_is_refreshed_per_window_and_spent_locally():
+    limiter = gh.GitHubRateLimiter(reserve=0)
+    reset = time.time() + 3600
+
+    limiter.update(
+        make_response(
+            200, {"X-RateLimit-Remaining": "100", "X-RateLimit-Reset": str(reset)}
+        )
+    )
+    limiter.acquire("GET")
+    limiter.acquire("GET")
+    assert limiter.remaining == 98
+
+    # A stale response of the same window does not give the budget back
+    limiter.update(
+        make_response(
+            200, {"X-RateLimit-Remaining": "99", "X-RateLimit-Reset": str(reset)}
+        )
+    )
+    assert limiter.remaining == 98
+
+    limiter.update(
+        make_response(
+            200,
+            {"X-RateLimit-Remaining": "5000", "X-RateLimit-Reset": str(reset + 3600)},
+        )
+    )
+    assert limiter.remaining == 5000
+
+
+def test_secondary_limit_spaces_mutations():
+    limiter = gh.GitHubRateLimiter(secondary_mutation_interval=0.2)
+
+    limiter.pause(0, secondary=True)
+    start = time.perf_counter()
+    limiter.acquire("POST")
+    limiter.acquire("POST")
+    limiter.acquire("GET")
+
+    assert 0.15 < time.perf_counter() - start < 1
@@ -0,0 +1,175 @@
+import stat
+import tomllib
+
+import toml
+
+import cr8tor.core.resourceops as project_resources
+import cr8tor.core.schema as schemas
+from cr8tor.utils import DEFAULT_FILE_MODE
+
+PROJECT_TOML = """\
+# Hand-written comment kept across edits
+[[actions]]
+id = "Create-1"
+name = "Create"
+[[actions.result]]
+"@id" = "r1"
+
+[[actions]]
+id = "Validate-1"   # trailing comment
+name = "Validate"
+
+[[actions]]
+id = "Sign-Off-1"
+name = "Sign-Off"
+
+[project]
+name = "P001"
+"""
+
+
+def write_dataset(path):
+    path.write_text(
+        toml.dumps(
+            {
+                "name": "dataset_1",
+                "schema_name": "bench",
+                "tables": [{"name": "person", "columns": [{"name": "id"}]}],
+            }
+        )
+    )
+
+
+def test_read_resource_model_returns_independent_copies(tmp_path):
+    dataset_path = tmp_path / "dataset_1.toml"
+    write_dataset(dataset_path)
+
+    model = project_resources.read_resource_model(dataset_path, schemas.DatasetMetadata)
+    model.tables[0].name = "mutated"
+    model.tables.append(schemas.TableMetadata(name="x"))
+
+    reread = project_resources.read_resource_model(
+        dataset_path, schemas.DatasetMetadata
+    )
+    assert [table.name for table in reread.tables] == ["person"]
+
+
+def test_read_resource_model_reuses_models_across_commands(
+    tmp_path, isolated_caches, monkeypatch
+):
+    dataset_path = tmp_path / "dataset_1.toml"
+    write_dataset(dataset_path)
+    project_resources.read_resource_model(dataset_path, schemas.DatasetMetadata)
+    assert len(list(isolated_caches.joinpath("models").glob("*.pickle"))) == 1
+
+    # A later command finds the validated model without parsing the resource
+    project_resources.invalidate_resource_cache()
+    with monkeypatch.context() as m:
+        m.setattr(project_resources.tomllib, "loads", None)
+        model = project_resources.read_resource_model(
+            dataset_path, schemas.DatasetMetadata
+        )
+    assert model.tables[0].columns.names == ("id",)
+
+    dataset_path.write_text(dataset_path.read_text().replace('"id"', '"key"'))
+    model = project_resources.read_resource_model(dataset_path, schemas.DatasetMetadata)
+    assert model.tables[0].columns.names == ("key",)
+
+
+def test_read_resource_returns_independent_copies(tmp_path):
+    dataset_path = tmp_path / "dataset_1.toml"
+    write_dataset(dataset_path)
+
+    project_resources.read_resource(dataset_path)["tables"].clear()
+
+    assert len(project_resources.read_resource(dataset_path)["tables"]) == 1
+
+
+def test_write_invalidates_cached_resource_and_model(tmp_path):
+    dataset_path = tmp_path / "dataset_1.toml"
+    write_dataset(dataset_path)
+    project_resources.read_resource_model(dataset_path, schemas.DatasetMetadata)
+
+    project_resources.update_resource_entity(
+        dataset_path, "tables", {"name": "visit", "columns": [{"name": "id"}]}
+    )
+
+    model = project_resources.read_resource_model(dataset_path, schemas.DatasetMetadata)
+    assert [table.name for table in model.tables] == ["person", "visit"]
+
+
+def test_replace_action_edits_only_its_block(tmp_path):
+    project_path = tmp_path / "project.toml"
+    project_path.write_text(PROJECT_TOML)
+    action = {"id": "Validate-1", "name": "Validate again", "result": [{"@id": "r2"}]}
+
+    with project_resources.resource_lock(project_path):
+        project_resources.delete_resource_entity(
+            project_path, "actions", "id", "Validate-1"
+        )
+        project_resources.update_resource_entity(project_path, "actions", action)
+
+    text = project_path.read_text()
+    assert text.startswith("# Hand-written comment kept across edits\n")
+    assert '[project]\nname = "P001"\n' in text
+    assert "trailing comment" not in text
+
+    data = tomllib.loads(text)
+    assert [a["id"] for a in data["actions"]] == [
+        "Create-1",
+        "Sign-Off-1",
+        "Validate-1",
+    ]
+    assert data["actions"][-1] == action
+    assert data["project"] == {"name": "P001"}
+
+
+def test_delete_missing_action_leaves_file_unchanged(tmp_path):
+    project_path = tmp_path / "project.toml"
+    project_path.write_text(PROJECT_TOML)
+
+    project_resources.delete_resource_entity(project_path, "actions", "id", "Missing")
+
+    assert project_path.read_text() == PROJECT_TOML
+
+
+def test_delete_last_action_keeps_empty_array(tmp_path):
+    project_path = tmp_path / "project.toml"
+    project_path.write_text('[[actions]]\nid = "Create-1"\n\n[project]\nname = "P"\n')
+
+    project_resources.delete_resource_entity(project_path, "actions", "id", "Create-1")
+
+    data = tomllib.loads(project_path.read_text())
+    assert data == {"actions": [], "project": {"name": "P"}}
+
+
+def test_append_to_empty_inline_array(tmp_path):
+    project_path = tmp_path / "project.toml"
+    project_path.write_text('actions = []\n\n[project]\nname = "P"\n')
+
+    project_resources.update_resource_entity(
+        project_path, "actions", {"id": "Create-1", "result": [{"@id": "r1"}]}
+    )
+
+    data = tomllib.loads(project_path.read_text())
+    assert data["actions"] == [{"id": "Create-1", "result": [{"@id": "r1"}]}]
+    assert data["project"] == {"name": "P"}
+
+
+def test_new_resource_gets_default_file_mode(tmp_path):
+    resource_path = tmp_path / "new.toml"
+
+    project_resources.create_resource(resource_path, {"name": "new"})
+
+    assert stat.S_IMODE(resource_path.stat().st_mode) == DEFAULT_FILE_MODE
+
+
+def test_lock_files_are_kept_in_the_user_cache(tmp_path, isolated_caches):
+    resource_path = tmp_path / "new.toml"
+
+    with project_resources.resource_lock(resource_path):
+        project_resources.create_resource(resource_path, {"name": "new"})
+
+    lock_files = list(isolated_caches.joinpath("locks").glob("*.lock"))
+    assert len(lock_files) == 1
+    assert stat.S_IMODE(lock_files[0].parent.stat().st_mode) & 0o077 == 0
@@ -0,0 +1,84 @@
+import httpx
+
+import cr8tor.core.api_client as api
+import cr8tor.core.response_cache as response_cache
+import cr8tor.core.schema as schemas
+
+
+def make_request(column_projection: bool, secret: str = "secret_key"):
+    return schemas.DataContractValidateRequest(
+        project_name="Cache",
+        project_start_time="20250101_090000",
+        destination={"name": "LSC", "type": "filestore", "format": "duckdb"},
+        source={
+            "type": "databrickssql",
+            "host_url": "https://example.azuredatabricks.net",
+            "http_path": "/sql/1.0/warehouses/example",
+            "catalog": "example",
+            "credentials": {
+                "provider": "AzureKeyVault",
+                "spn_clientid": "clientid_key",
+                "spn_secret": secret,
+            },
+        },
+        dataset={
+            "name": "cache",
+            "schema_name": "cache",
+            "tables": [{"name": "person", "columns": [{"name": "id"}]}],
+        },
+        column_projection=column_projection,
+    )
+
+
+def test_put_and_get(tmp_path):
+    cache = response_cache.ResponseCache(tmp_path)
+
+    cache.put("key", {"tables": []}, "fingerprint-1")
+
+    entry = cache.get("key")
+    assert entry.payload == {"tables": []}
+    assert entry.fingerprint == "fingerprint-1"
+    assert cache.get("other") is None
+
+
+def test_expired_entries_are_evicted(tmp_path):
+    cache = response_cache.ResponseCache(tmp_path, ttl_seconds=-1)
+
+    cache.put("key", {"tables": []}, None)
+
+    assert cache.get("key") is None
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_validate_cache_key_ignores_credentials():
+    base_url = "http://localhost:8000"
+
+    key = api.validate_cache_key(base_url, make_request(False))
+
+    assert key == api.validate_cache_key(base_url, make_request(False, "rotated"))
+    assert key != api.validate_cache_key(base_url, make_request(True))
+
+
+def test_failed_put_leaves_no_temporary_file(tmp_path, monkeypatch):
+    cache = response_cache.ResponseCache(tmp_path)
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(response_cache.os, "replace", failing_replace)
+    cache.put("key", {"tables": []}, None)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_success_payload_with_an_etag_key():
+    response = httpx.Response(
+        200,
+        json={"status": "success", "etag": "v1", "payload": {"tables": []}},
+        headers={"ETag": '"abc"'},
+    )
+
+    result = api.APIClient("http://localhost", "token").handle_response(response)
+
+    assert result.etag == '"abc"'
+    assert result.payload == {"tables": []}
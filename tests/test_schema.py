@@ -0,0 +1,33 @@
+import copy
+
+import cr8tor.core.schema as schemas
+
+COLUMNS = [
+    {"name": "id", "datatype": "LONG", "description": "Identifier"},
+    {"name": "name", "datatype": "STRING"},
+]
+
+
+def test_column_set_validates_and_serialises_as_a_list_of_columns():
+    table = schemas.TableMetadata(name="person", columns=COLUMNS)
+
+    assert isinstance(table.columns, schemas.ColumnSet)
+    assert table.columns.names == ("id", "name")
+    assert table.columns[1].datatype == "STRING"
+    assert table.model_dump()["columns"] == [
+        {"name": "id", "datatype": "LONG", "description": "Identifier"},
+        {"name": "name", "datatype": "STRING", "description": None},
+    ]
+
+
+def test_column_set_deep_copy_shares_its_immutable_columns():
+    table = schemas.TableMetadata(name="person", columns=COLUMNS)
+
+    copied = copy.deepcopy(table)
+
+    assert copied.columns == table.columns
+    assert copied.columns is not table.columns
+    assert copied.columns.names is table.columns.names
+
+    copied.columns = schemas.ColumnSet.from_columns(COLUMNS[:1])
+    assert len(table.columns) == 2
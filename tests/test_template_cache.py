@@ -0,0 +1,59 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import cr8tor.core.template_cache as template_cache
+
+TEMPLATE_URL = "https://github.com/example/cr8-cookiecutter.git"
+
+
+@pytest.fixture
+def fetches(monkeypatch):
+    """Record the templates `determine_repo_dir` clones, without network access"""
+    fetched = []
+
+    def determine_repo_dir(template, abbreviations, clone_to_dir, checkout, no_input):
+        repo_dir = Path(clone_to_dir, "cr8-cookiecutter")
+        repo_dir.mkdir()
+        repo_dir.joinpath("cookiecutter.json").write_text("{}")
+        time.sleep(0.05)
+        fetched.append((template, checkout))
+        return str(repo_dir), False
+
+    monkeypatch.setattr(template_cache, "determine_repo_dir", determine_repo_dir)
+    monkeypatch.setattr(
+        template_cache, "get_user_config", lambda: {"abbreviations": {}}
+    )
+    return fetched
+
+
+def resolve(refresh: bool = False) -> Path:
+    template_dir, checkout = template_cache.resolve_template(
+        TEMPLATE_URL, "v1", refresh=refresh
+    )
+    assert checkout is None
+    assert Path(template_dir, "cookiecutter.json").is_file()
+    return Path(template_dir)
+
+
+def test_concurrent_first_use_fetches_once(fetches):
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        template_dirs = set(pool.map(lambda _: resolve(), range(8)))
+
+    assert fetches == [(TEMPLATE_URL, "v1")]
+    (template_dir,) = template_dirs
+    assert template_cache.read_template_info(template_dir)["checkout"] == "v1"
+
+
+def test_concurrent_refreshes_swap_one_at_a_time(fetches):
+    resolve()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: resolve(refresh=True), range(4)))
+
+    assert len(fetches) == 5
+    assert [p.name for p in template_cache.template_cache_dir().iterdir()] == [
+        resolve().name
+    ]
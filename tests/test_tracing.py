@@ -0,0 +1,71 @@
+import json
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import cr8tor.core.gh_rest_api_client as gh
+import cr8tor.core.tracing as tracing
+import cr8tor.main as main
+from cr8tor.exception import DirectoryNotFoundError
+
+
+@pytest.fixture
+def tracer(tmp_path, monkeypatch):
+    monkeypatch.setenv(tracing.TRACE_FILE_ENV, str(tmp_path / "traces.jsonl"))
+    monkeypatch.delenv(tracing.OTLP_ENDPOINT_ENV, raising=False)
+    monkeypatch.delenv(tracing.TRACEPARENT_ENV, raising=False)
+    tracer = tracing.Tracer()
+    monkeypatch.setattr(tracing, "tracer", tracer)
+    return tracer
+
+
+def exported_spans(tracer: tracing.Tracer) -> list[dict]:
+    tracer.flush()
+    spans = []
+    with open(tracer.trace_file, encoding="utf-8") as f:
+        for line in f:
+            for resource_spans in json.loads(line)["resourceSpans"]:
+                for scope_spans in resource_spans["scopeSpans"]:
+                    spans.extend(scope_spans["spans"])
+    return spans
+
+
+def root_span_attributes(span: dict) -> dict:
+    return {a["key"]: a["value"] for a in span["attributes"]}
+
+
+def test_command_error_is_exported_on_the_root_span(tracer, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["cr8tor", "fetch", "-b", "missing-bag"])
+
+    with pytest.raises(DirectoryNotFoundError):
+        main.run()
+
+    (root_span,) = exported_spans(tracer)
+    assert root_span["name"] == "cr8tor fetch"
+    assert root_span["status"]["code"] == tracing.STATUS_CODE_ERROR
+    assert "missing-bag" in root_span["status"]["message"]
+    assert root_span_attributes(root_span)["cli.command"] == {"stringValue": "fetch"}
+
+
+def test_non_zero_exit_is_exported_on_the_root_span(tracer, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["cr8tor", "fetch", "--no-such-option"])
+
+    with pytest.raises(SystemExit) as exit_info:
+        main.run()
+
+    (root_span,) = exported_spans(tracer)
+    assert exit_info.value.code == 2
+    assert root_span["status"]["code"] == tracing.STATUS_CODE_ERROR
+    assert root_span_attributes(root_span)["cli.exit_code"] == {"intValue": "2"}
+
+
+def test_github_calls_keep_the_caller_span_as_parent(tracer):
+    gh_client = SimpleNamespace(max_workers=2)
+
+    with tracing.span("initiate") as parent:
+        current = gh.run_concurrently(
+            gh_client, [lambda: tracing.tracer.current_span for _ in range(4)]
+        )
+
+    assert all(span is parent for span in current)